@@ -0,0 +1,166 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Benchmark Command Line Interface."""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from gitwsrepo._workspace import RepoWorkspace
+
+from . import measure
+from .generate import CASES
+
+SIZES = (1000, 10000, 50000)
+PACKAGES = ("git-ws-repo", "git-ws", "pydantic", "click", "defusedxml")
+PARSE_JOBS = max(2, os.cpu_count() or 1)
+"""Number Of Processes For Parallel Parsing - At Least 2 To Exercise The Process Pool."""
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.option(
+    "--sizes",
+    default=",".join(str(size) for size in SIZES),
+    show_default=True,
+    help="Comma-separated number of projects.",
+)
+@click.option("--cases", default=",".join(CASES), show_default=True, help="Comma-separated synthetic manifest cases.")
+@click.option("--rounds", type=click.IntRange(min=1), default=3, show_default=True, help="Rounds per benchmark.")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="JSON output file. Standard output by default.")
+@click.option("--baseline", type=click.Path(exists=True, dir_okay=False), help="JSON output of a previous run.")
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=1.0),
+    default=1.25,
+    show_default=True,
+    help="Maximum allowed slowdown against baseline.",
+)
+def main(*, sizes, cases, rounds, output=None, baseline=None, tolerance=1.25):
+    """
+    Run Benchmarks.
+
+    Synthetic manifests are loaded with their wall time, peak and retained memory measured - in default and
+    compact mode. In parallel mode, included manifests are parsed by one process per CPU.
+    The cold start of the command line interface is measured in new interpreters.
+
+    With --baseline, the exit code is 1 if any benchmark is slower than the baseline by more than --tolerance.
+    """
+    results: list[measure.Result] = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
+        for case in cases.split(","):
+            generate = CASES[case]
+            for size in (int(size) for size in sizes.split(",")):
+                path = tmp_path / f"{case}-{size}"
+                path.mkdir()
+                filepath = generate(path, size)
+                retained = {}
+                for suffix, compact in (("", False), ("-compact", True)):
+                    seconds = measure.load(filepath, rounds, compact=compact)
+                    results.append(measure.Result(f"load{suffix}", case, size, seconds))
+                    peak, retained[compact] = measure.load_memory(filepath, compact=compact)
+                    results.append(
+                        measure.Result(
+                            f"load-memory{suffix}", case, size, 0.0, peak_bytes=peak, retained_bytes=retained[compact]
+                        )
+                    )
+                seconds = measure.load(filepath, rounds, compact=True, jobs=PARSE_JOBS)
+                results.append(measure.Result("load-parallel", case, size, seconds))
+                results.append(measure.Result("validate", case, size, measure.validate(filepath, rounds)))
+                savings = 1 - retained[True] / retained[False] if retained[False] else 0.0
+                click.echo(f"{case} {size}: done. Compact mode retains {savings:.0%} less memory.", err=True)
+        results.append(measure.Result("cold-start", "help", 0, measure.cold_start(("--help",), rounds)))
+        workspace = _create_workspace(tmp_path)
+        results.append(measure.Result("cold-start", "sync", 0, measure.cold_start(("sync",), rounds, cwd=workspace)))
+
+    doc = {"environment": _get_environment(), "results": [result._asdict() for result in results]}
+    text = json.dumps(doc, indent=2)
+    if output:
+        Path(output).write_text(f"{text}\n", encoding="utf-8")
+    else:
+        click.echo(text)
+    if baseline and not _compare(results, Path(baseline), tolerance):
+        sys.exit(1)
+
+
+def _create_workspace(tmp_path: Path) -> Path:
+    manifests = tmp_path / "manifests"
+    manifests.mkdir()
+    (manifests / "default.xml").write_text("<manifest />\n", encoding="utf-8")
+    for args in (
+        ("init", "--quiet", "--initial-branch", "main"),
+        ("add", "default.xml"),
+        ("-c", "user.name=bench", "-c", "user.email=bench@example.com", "commit", "--quiet", "-m", "init"),
+    ):
+        subprocess.run(("git", *args), cwd=manifests, check=True, capture_output=True)  # noqa: S603, S607
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    RepoWorkspace.init(manifests.as_uri(), path=workspace)
+    return workspace
+
+
+def _get_environment() -> dict[str, Optional[str]]:
+    environment: dict[str, Optional[str]] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+    for package in PACKAGES:
+        environment[package] = _get_version(package)
+    return environment
+
+
+def _get_version(package: str) -> Optional[str]:
+    try:
+        return version(package)
+    except PackageNotFoundError:
+        return None
+
+
+def _compare(results: list[measure.Result], baseline: Path, tolerance: float) -> bool:
+    doc = json.loads(baseline.read_text(encoding="utf-8"))
+    previous = {(item["benchmark"], item["case"], item["projects"]): measure.Result(**item) for item in doc["results"]}
+    success = True
+    for result in results:
+        prev = previous.get((result.benchmark, result.case, result.projects))
+        if prev is None:
+            continue
+        if result.peak_bytes is not None and prev.peak_bytes:
+            ratio = result.peak_bytes / prev.peak_bytes
+        elif result.seconds is not None and prev.seconds:
+            ratio = result.seconds / prev.seconds
+        else:
+            continue
+        failed = ratio > tolerance
+        success = success and not failed
+        status = "REGRESSION" if failed else "ok"
+        click.echo(f"{result.benchmark} {result.case} {result.projects}: {ratio:.2f}x {status}", err=True)
+    return success
+
+
+if __name__ == "__main__":
+    main()
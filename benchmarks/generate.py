@@ -0,0 +1,129 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Synthetic Manifest Generation."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import TextIO
+
+_HEADER = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remote name="origin" fetch=".." />
+  <remote name="mirror" fetch="https://mirror.example.com" review="https://review.example.com" />
+  <default remote="origin" revision="main" sync-j="4" />
+"""
+_FOOTER = "</manifest>\n"
+
+
+def flat(path: Path, count: int) -> Path:
+    """Manifest With ``count`` Projects."""
+    filepath = path / "default.xml"
+    with filepath.open("w", encoding="utf-8") as file:
+        file.write(_HEADER)
+        for idx in range(count):
+            _write_project(file, idx)
+        file.write(_FOOTER)
+    return filepath
+
+
+def nested(path: Path, count: int, depth: int = 8) -> Path:
+    """Manifest With ``count`` Projects In Nested Trees Of ``depth`` Levels."""
+    filepath = path / "default.xml"
+    with filepath.open("w", encoding="utf-8") as file:
+        file.write(_HEADER)
+        for idx in range(0, count, depth):
+            levels = min(depth, count - idx)
+            for level in range(levels):
+                indent = "  " * (level + 1)
+                # project paths are unique: every tree has its own top directory
+                projectpath = f"t{idx}" if level == 0 else f"l{level}"
+                file.write(f'{indent}<project name="n{idx + level}/" path="{projectpath}" groups="level{level}">\n')
+            for level in reversed(range(levels)):
+                file.write(f"{'  ' * (level + 1)}</project>\n")
+        file.write(_FOOTER)
+    return filepath
+
+
+def linkfiles(path: Path, count: int, files: int = 2) -> Path:
+    """Manifest With ``count`` Projects With ``files`` Copyfiles And Linkfiles Each."""
+    filepath = path / "default.xml"
+    with filepath.open("w", encoding="utf-8") as file:
+        file.write(_HEADER)
+        for idx in range(count):
+            file.write(f'  <project name="platform/project{idx}" path="project{idx}">\n')
+            for fidx in range(files):
+                file.write(f'    <copyfile src="copy{fidx}.txt" dest="out/project{idx}/copy{fidx}.txt" />\n')
+                file.write(f'    <linkfile src="link{fidx}.txt" dest="out/project{idx}/link{fidx}.txt" />\n')
+            file.write("  </project>\n")
+        file.write(_FOOTER)
+    return filepath
+
+
+def includes(path: Path, count: int, length: int = 32) -> Path:
+    """Manifest With ``count`` Projects Spread Over An Include Chain Of ``length`` Files."""
+    length = max(1, min(length, count))
+    per_file = -(-count // length)
+    for fidx in range(length):
+        with (path / f"include{fidx}.xml").open("w", encoding="utf-8") as file:
+            file.write("<manifest>\n")
+            for idx in range(fidx * per_file, min((fidx + 1) * per_file, count)):
+                _write_project(file, idx)
+            if fidx + 1 < length:
+                file.write(f'  <include name="include{fidx + 1}.xml" />\n')
+            file.write(_FOOTER)
+    filepath = path / "default.xml"
+    filepath.write_text(f'{_HEADER}  <include name="include0.xml" />\n{_FOOTER}', encoding="utf-8")
+    return filepath
+
+
+def vendors(path: Path, count: int, width: int = 32) -> Path:
+    """Manifest With ``count`` Projects Spread Over ``width`` Files Included By The Top Manifest."""
+    width = max(1, min(width, count))
+    per_file = -(-count // width)
+    names = []
+    for fidx in range(width):
+        name = f"vendor{fidx}.xml"
+        with (path / name).open("w", encoding="utf-8") as file:
+            file.write("<manifest>\n")
+            for idx in range(fidx * per_file, min((fidx + 1) * per_file, count)):
+                _write_project(file, idx)
+            file.write(_FOOTER)
+        names.append(name)
+    filepath = path / "default.xml"
+    includes = "".join(f'  <include name="{name}" />\n' for name in names)
+    filepath.write_text(f"{_HEADER}{includes}{_FOOTER}", encoding="utf-8")
+    return filepath
+
+
+CASES: dict[str, Callable[[Path, int], Path]] = {
+    "flat": flat,
+    "nested": nested,
+    "linkfiles": linkfiles,
+    "includes": includes,
+    "vendors": vendors,
+}
+"""Benchmark Cases By Name."""
+
+
+def _write_project(file: TextIO, idx: int):
+    revision = f' revision="refs/tags/v{idx % 7}"' if idx % 3 == 0 else ""
+    file.write(
+        f'  <project name="platform/group{idx % 100}/project{idx}" path="group{idx % 100}/project{idx}"'
+        f'{revision} groups="group{idx % 100},pdk" clone-depth="1" />\n'
+    )
@@ -0,0 +1,101 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Measurements."""
+
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from gitws import ManifestSpec
+
+from gitwsrepo import RepoManifestFormat
+from gitwsrepo.repomanifestformat import _FRAGMENTS
+
+CLI = "from gitwsrepo._cli import main; main()"
+"""Python Code Equivalent To The ``repo`` Console Script."""
+
+
+class Result(NamedTuple):
+    """Benchmark Result."""
+
+    benchmark: str
+    """Benchmark Name."""
+
+    case: str
+    """Case Name."""
+
+    projects: int
+    """Number Of Projects."""
+
+    seconds: Optional[float] = None
+    """Best Wall Time In Seconds."""
+
+    peak_bytes: Optional[int] = None
+    """Peak Memory Allocated By Python In Bytes."""
+
+    retained_bytes: Optional[int] = None
+    """Memory Retained By The Loaded Manifest In Bytes."""
+
+
+def best_of(func: Callable[[], object], rounds: int, setup: Optional[Callable[[], object]] = None) -> float:
+    """Return Best Wall Time Of ``rounds`` Calls Of ``func``."""
+    times = []
+    for _ in range(rounds):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def load(path: Path, rounds: int, compact: bool = False, jobs: int = 1) -> float:
+    """Wall Time Of Loading The Manifest At ``path`` Without Any Cached Files."""
+    manifest_format = RepoManifestFormat(compact=compact, jobs=jobs)
+    return best_of(lambda: manifest_format.load(path), rounds, setup=_FRAGMENTS.clear)
+
+
+def load_memory(path: Path, compact: bool = False) -> tuple[int, int]:
+    """Peak And Retained Memory Of Loading The Manifest At ``path`` Without Any Cached Files."""
+    _FRAGMENTS.clear()
+    tracemalloc.start()
+    try:
+        manifest = RepoManifestFormat(compact=compact).load(path)
+        current, peak = tracemalloc.get_traced_memory()
+        del manifest
+        _FRAGMENTS.clear()
+        return peak, current - tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        _FRAGMENTS.clear()
+
+
+def validate(path: Path, rounds: int) -> float:
+    """Wall Time Of Validating The :any:`ManifestSpec` Data Of The Manifest At ``path``."""
+    data = RepoManifestFormat().load(path).model_dump(by_alias=True)
+    return best_of(lambda: ManifestSpec.model_validate(data), rounds)
+
+
+def cold_start(args: Sequence[str], rounds: int, cwd: Optional[Path] = None) -> float:
+    """Wall Time Of Running The ``repo`` Command Line Interface With ``args`` In A New Interpreter."""
+    cmd = (sys.executable, "-c", CLI, *args)
+    return best_of(lambda: subprocess.run(cmd, cwd=cwd, check=True, capture_output=True), rounds)  # noqa: S603
@@ -16,8 +16,26 @@
 
 """
 Google's git-repo replacement powered by git-ws.
+
+All members are imported on first access, to keep the startup of the command line interface fast.
 """
 
-from .repomanifestformat import RepoManifestFormat
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .datamodel import RepoManifest
+    from .repomanifestformat import RepoManifestFormat
+
+__all__ = ["RepoManifest", "RepoManifestFormat"]
+
+
+def __getattr__(name: str):
+    if name == "RepoManifest":
+        from .datamodel import RepoManifest
+
+        return RepoManifest
+    if name == "RepoManifestFormat":
+        from .repomanifestformat import RepoManifestFormat
 
-__all__ = ["RepoManifestFormat"]
+        return RepoManifestFormat
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,207 @@
+# Copyright 2022-2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Persistent Manifest Parse Cache.
+
+Loaded :any:`RepoManifest` instances are stored pickled within the workspace. Entries are keyed by the content of
+the manifest file, the loader options and the versions of all involved packages. Additional files and directories
+read during loading are recorded with their hash and verified on every lookup.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from gitws import ManifestNotFoundError
+from gitws._util import LOGGER
+from gitws.const import GIT_WS_PATH
+from gitws.workspacefinder import find_workspace
+
+from .datamodel import RepoManifest
+
+CACHE_PATH = GIT_WS_PATH / "repo-cache"
+"""Cache Directory Within Workspace."""
+
+CACHE_MAXSIZE = 64 * 1024 * 1024
+"""Maximum Size Of All Cache Entries In Bytes."""
+
+_SUFFIX = ".pickle"
+
+
+class CacheEntry(NamedTuple):
+    """Cache Entry."""
+
+    manifest: RepoManifest
+    """Loaded Manifest."""
+
+    deps: tuple[tuple[str, str], ...]
+    """Additional files and directories which have been read with their hash."""
+
+    ignored: tuple[str, ...]
+    """Ignored Elements And Attributes."""
+
+
+class ManifestCache:
+    """
+    Manifest Parse Cache.
+
+    Args:
+        path: Cache Directory.
+
+    Keyword Args:
+        maxsize: Maximum Size Of All Cache Entries In Bytes.
+    """
+
+    def __init__(self, path: Path, maxsize: int = CACHE_MAXSIZE):
+        self.path = path
+        self.maxsize = maxsize
+
+    @staticmethod
+    def find(path: Path) -> Optional["ManifestCache"]:
+        """Return :any:`ManifestCache` of the workspace containing ``path`` - if any."""
+        workspace_path = find_workspace(path=path.resolve().parent)
+        if workspace_path is None:
+            return None
+        return ManifestCache(workspace_path / CACHE_PATH)
+
+    def load(self, loader) -> RepoManifest:
+        """
+        Return Manifest From Cache Or Use ``loader`` And Store The Result.
+
+        Args:
+            loader: Manifest Loader with ``path``, ``options``, ``paths``, ``ignored``, ``load()`` and ``ignore()``.
+        """
+        path = loader.path
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            raise ManifestNotFoundError(path) from None
+        key = _get_key(path, data, loader.options)
+        entry = self._read(key)
+        if entry is not None:
+            LOGGER.debug("%r: Using parse cache", str(path))
+            for name in entry.ignored:
+                loader.ignore(name)
+            return entry.manifest
+        manifest = loader.load()
+        deps = tuple((str(dep), _hash_path(dep)) for dep in loader.paths if dep != path)
+        self._write(key, CacheEntry(manifest=manifest, deps=deps, ignored=tuple(loader.ignored)))
+        return manifest
+
+    def clear(self):
+        """Remove All Cache Entries."""
+        for entrypath in self._iter_entries():
+            entrypath.unlink(missing_ok=True)
+
+    def _read(self, key: str) -> Optional[CacheEntry]:
+        entrypath = self.path / f"{key}{_SUFFIX}"
+        try:
+            with entrypath.open("rb") as file:
+                entry = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception:
+            LOGGER.warning("Cache Entry %s is broken. Removing.", key)
+            entrypath.unlink(missing_ok=True)
+            return None
+        if not all(_hash_path(Path(dep)) == hash_ for dep, hash_ in entry.deps):
+            entrypath.unlink(missing_ok=True)
+            return None
+        # mark as recently used
+        os.utime(entrypath)
+        return entry
+
+    def _write(self, key: str, entry: CacheEntry):
+        self.path.mkdir(parents=True, exist_ok=True)
+        entrypath = self.path / f"{key}{_SUFFIX}"
+        tmppath: Optional[Path] = None
+        try:
+            # unique name, as other threads and processes might write the same entry concurrently
+            with tempfile.NamedTemporaryFile(dir=self.path, prefix=f"{key}.", suffix=".tmp", delete=False) as file:
+                tmppath = Path(file.name)
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            tmppath.replace(entrypath)
+        except OSError as exc:  # pragma: no cover
+            LOGGER.warning("Cache Entry %s cannot be written: %s", key, exc)
+            if tmppath is not None:
+                tmppath.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self):
+        """Remove Least Recently Used Entries Until The Cache Fits Into ``maxsize``."""
+        entries = []
+        for entrypath in self._iter_entries():
+            try:
+                stat = entrypath.stat()
+            except FileNotFoundError:  # pragma: no cover
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entrypath))
+        size = sum(item[1] for item in entries)
+        for _, entrysize, entrypath in sorted(entries, key=lambda item: item[0]):
+            if size <= self.maxsize:
+                break
+            LOGGER.debug("Evict cache entry %s", entrypath.name)
+            entrypath.unlink(missing_ok=True)
+            size -= entrysize
+
+    def _iter_entries(self):
+        try:
+            yield from self.path.glob(f"*{_SUFFIX}")
+        except FileNotFoundError:  # pragma: no cover
+            return
+
+
+def _get_key(path: Path, data: bytes, options: str) -> str:
+    hash_ = hashlib.sha256(_get_versions().encode("utf-8"))
+    hash_.update(str(path.resolve()).encode("utf-8"))
+    hash_.update(b"\0")
+    hash_.update(options.encode("utf-8"))
+    hash_.update(b"\0")
+    hash_.update(data)
+    return hash_.hexdigest()
+
+
+def _hash_path(path: Path) -> str:
+    """Hash File Content, Directory Listing Or Absence Of ``path``."""
+    try:
+        if path.is_dir():
+            names = "\n".join(sorted(item.name for item in path.iterdir()))
+            return f"dir:{hashlib.sha256(names.encode('utf-8')).hexdigest()}"
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+@lru_cache
+def _get_versions() -> str:
+    versions = [f"python={sys.version_info[0]}.{sys.version_info[1]}"]
+    versions.extend(f"{package}={_get_version(package)}" for package in ("git-ws-repo", "git-ws", "pydantic"))
+    return ",".join(versions)
+
+
+def _get_version(package: str) -> str:
+    try:
+        return version(package)
+    except PackageNotFoundError:  # pragma: no cover
+        return "?"
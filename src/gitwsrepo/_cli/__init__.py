@@ -14,13 +14,24 @@
 # You should have received a copy of the GNU Lesser General Public License along
 # with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
 
-"""Command Line Interface."""
+"""
+Command Line Interface.
+
+Just :any:`click` is imported at module level.
+Everything else is imported by the commands, so ``--help`` and ``--version`` start fast.
+"""
+
+import time
+from pathlib import Path
 
 import click
-from gitws import AppConfig
 
-from .common import Context, Error, exceptionhandling, pass_context
-from .logging import setup_logging
+from gitwsrepo.const import MANIFEST_NAME_DEFAULT
+
+from .common import COLOR_INFO, Context, Error, exceptionhandling, pass_context
+from .logging import buffered_logging, setup_logging
+
+CLONE_FILTER_DEFAULT = "blob:none"
 
 
 def _version_option():  # pragma: no cover
@@ -31,38 +42,527 @@ def _version_option():  # pragma: no cover
 
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
-@click.option("-v", "--verbose", count=True)
+@click.option("-v", "--verbose", count=True, help="Increase verbosity. '-vv' reports the duration of all phases.")
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False),
+    help="Write a profile to the given file: Chrome trace events of all phases for '*.json', cProfile statistics else.",
+)
 @_version_option()
 @click.pass_context
-def main(ctx=None, verbose=0):
+def main(ctx=None, verbose=0, profile=None):
     """
     Google's git-repo replacement powered by git-ws.
     """
+    if profile:
+        _start_profile(ctx, Path(profile))
+
+    from gitws import AppConfig
+
     app_config = AppConfig()
     color = Error.color = app_config.options.color_ui
     handler = setup_logging(color, verbose)
     ctx.obj = Context(verbose=verbose, color=color, handler=handler)
 
 
+def _start_profile(ctx, path: Path):
+    if path.suffix == ".json":
+        from gitwsrepo._timing import Tracer
+
+        tracer = Tracer()
+        tracer.start()
+
+        def close():
+            tracer.stop()
+            tracer.save(path)
+
+    else:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def close():
+            profiler.disable()
+            profiler.dump_stats(str(path))
+
+    ctx.call_on_close(close)
+
+
 @main.command()
+@click.option("--manifest-url", "-u", "url", required=True, help="Manifest repository location.")
+@click.option("--manifest-branch", "-b", "revision", help="Manifest branch or revision.")
+@click.option(
+    "--manifest-name", "-m", default=MANIFEST_NAME_DEFAULT, show_default=True, help="Manifest file within repository."
+)
+@click.option("--depth", type=click.IntRange(min=1), help="Shallow clone depth for all projects without 'clone-depth'.")
+@click.option("--partial-clone", is_flag=True, help=f"Create partial clones. Filter is {CLONE_FILTER_DEFAULT!r}.")
+@click.option("--clone-filter", help="Create partial clones with the given filter.")
+@click.option(
+    "--reference",
+    type=click.Path(exists=True, file_okay=False, resolve_path=True),
+    help="Mirror workspace to borrow git objects from.",
+)
+@click.option("--mirror", is_flag=True, help="Create a mirror workspace with bare repositories.")
+@click.option(
+    "--groups",
+    "-g",
+    help="Comma separated groups to restrict the workspace to, i.e. 'all,-notdefault,-device'. '-' excludes a group.",
+)
 @pass_context
 def init(
     context,
+    *,
+    url,
+    revision=None,
+    manifest_name=MANIFEST_NAME_DEFAULT,
+    depth=None,
+    partial_clone=False,
+    clone_filter=None,
+    reference=None,
+    mirror=False,
+    groups=None,
 ):
     """
-    Init.
+    Initialize Repo Workspace In The Current Working Directory.
+
+    Workspaces on the same machine can share their git objects: initialize one mirror workspace via `--mirror`
+    and refer to it via `--reference` from all others.
     """
+    from gitws._util import resolve_relative
+
+    from gitwsrepo._groupindex import get_group_filters
+    from gitwsrepo._workspace import RepoWorkspace
+    from gitwsrepo.datamodel import RepoConfig
+
     with exceptionhandling(context):
-        click.secho("Init-TODO")
+        if partial_clone and not clone_filter:
+            clone_filter = CLONE_FILTER_DEFAULT
+        config = RepoConfig(depth=depth, clone_filter=clone_filter, reference=reference, mirror=mirror)
+        group_filters = get_group_filters(groups) if groups else None
+        workspace = RepoWorkspace.init(
+            url,
+            revision=revision,
+            manifest_name=manifest_name,
+            group_filters=group_filters,
+            config=config,
+            secho=context.secho,
+        )
+        click.secho(
+            f"Workspace initialized at {str(resolve_relative(workspace.path))!r}. "
+            "Please continue with:\n\n    repo sync\n",
+            fg=COLOR_INFO,
+        )
 
 
 @main.command()
+@click.option(
+    "--jobs", "-j", type=click.IntRange(min=1), help="Number of parallel jobs. Manifest 'sync-j' setting by default."
+)
+@click.option(
+    "--jobs-network", type=click.IntRange(min=1), help="Number of parallel clone/fetch jobs. JOBS by default."
+)
+@click.option(
+    "--jobs-checkout",
+    type=click.IntRange(min=1),
+    help="Number of parallel checkout jobs. JOBS, but not more than the number of CPUs, by default.",
+)
+@click.option(
+    "--jobs-parse",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes to parse included manifests in parallel.",
+)
+@click.option("--progress", is_flag=True, help="Show a progress bar instead of one line per project.")
+@click.option(
+    "--jobs-per-remote",
+    type=click.IntRange(min=1),
+    help="Number of parallel remote revision lookups per remote. Unlimited by default.",
+)
+@click.option("--force", is_flag=True, help="Fetch and check out all projects, even if unchanged since the last sync.")
+@click.option("--smart", is_flag=True, help="Do not fetch projects, whose pinned SHA is already available locally.")
+@click.option(
+    "--local-only", "-l", is_flag=True, help="Do not access the network. Check out the locally available revisions."
+)
 @pass_context
 def sync(
     context,
+    *,
+    jobs=None,
+    jobs_network=None,
+    jobs_checkout=None,
+    jobs_parse=1,
+    jobs_per_remote=None,
+    progress=False,
+    force=False,
+    smart=False,
+    local_only=False,
 ):
     """
-    Sync.
+    Synchronize All Projects With The Manifest.
+
+    Missing projects are cloned, existing ones are fetched and updated.
+    Projects, whose manifest settings, checkout and remote revision did not change since the last sync, are skipped.
+
+    With --smart, projects pinned to a SHA, which is already available locally, are checked out without fetch.
+    A release manifest, which just pins SHAs, is synchronized without any network access then.
+    With --local-only, no project is fetched and projects without their revision available locally fail.
+    """
+    from gitwsrepo._sync import Sync, get_jobs
+    from gitwsrepo._workspace import RepoWorkspace
+
+    with exceptionhandling(context), buffered_logging(context, progress=progress) as handler:
+        workspace = RepoWorkspace.from_path()
+        manifest = workspace.load(jobs=jobs_parse)
+        projects = workspace.get_projects(manifest)
+        jobs_network, jobs_checkout = get_jobs(
+            manifest, jobs=jobs, jobs_network=jobs_network, jobs_checkout=jobs_checkout
+        )
+        Sync(
+            workspace,
+            manifest,
+            projects,
+            jobs_network=jobs_network,
+            jobs_checkout=jobs_checkout,
+            secho=None if progress else context.secho,
+            progress=handler.progress,
+            force=force,
+            jobs_per_remote=jobs_per_remote,
+            smart=smart,
+            local_only=local_only,
+        ).run()
+
+
+@main.command()
+@click.option(
+    "--revision-as-HEAD", "-r", "pin", is_flag=True, help="Save revisions as the SHA of the checked out commits."
+)
+@click.option("--output-file", "-o", type=click.Path(dir_okay=False), help="Output file. Standard output by default.")
+@pass_context
+def manifest(context, pin=False, output_file=None):
+    """
+    Print Or Save The Effective Manifest.
+
+    The manifest is merged from all included and local manifests.
     """
+    from gitwsrepo._workspace import RepoWorkspace
+    from gitwsrepo.repomanifestformat import RepoManifestFormat
+
+    with exceptionhandling(context):
+        workspace = RepoWorkspace.from_path()
+        repo_manifest = workspace.load()
+        if pin:
+            repo_manifest = workspace.pin(repo_manifest)
+        manifest_format = RepoManifestFormat()
+        if output_file:
+            manifest_format.save_repo_manifest(repo_manifest, Path(output_file))
+        else:
+            click.echo(manifest_format.dump_repo_manifest(repo_manifest), nl=False)
+
+
+@main.command()
+@click.argument("manifest1", type=click.Path(dir_okay=False))
+@click.argument("manifest2", type=click.Path(dir_okay=False))
+@click.option("--log", "-l", is_flag=True, help="List the commits between the revisions of changed projects.")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Number of parallel jobs. Number of CPUs by default.")
+@pass_context
+def diffmanifests(context, manifest1, manifest2, log=False, jobs=None):
+    """
+    Show The Difference Between Two Manifests.
+
+    Projects are matched by name. Added, removed, moved and revision-changed projects are listed.
+    With --log, the commits are read from the clones in the current workspace.
+    """
+    import os
+
+    from gitwsrepo._diffmanifests import diff_manifests, iter_logs
+    from gitwsrepo.repomanifestformat import RepoManifestFormat
+
+    with exceptionhandling(context):
+        manifest_format = RepoManifestFormat(compact=True)
+        diff = diff_manifests(manifest_format.load(Path(manifest1)), manifest_format.load(Path(manifest2)))
+        if not any(diff):
+            context.secho("Manifests are identical.", fg=COLOR_INFO)
+            return
+        for title, projects in (("added projects", diff.added), ("removed projects", diff.removed)):
+            if projects:
+                context.secho(f"{title}:", bold=True)
+                for project in projects:
+                    click.echo(f"    {project.path or project.name} at revision {project.revision or 'HEAD'}")
+        if not diff.changed:
+            return
+        context.secho("changed projects:", bold=True)
+        logs = {}
+        if log:
+            from gitwsrepo._workspace import RepoWorkspace
+
+            path = RepoWorkspace.from_path().path
+            logs = {item.change: item for item in iter_logs(path, diff.changed, jobs=jobs or os.cpu_count() or 1)}
+        for change in diff.changed:
+            _echo_change(context, change, logs.get(change))
+
+
+def _echo_change(context, change, projectlog):
+    from gitws._util import LOGGER
+
+    if change.path_changed:
+        click.echo(f"    {change.name} moved from {change.old_path} to {change.new_path}")
+    if change.revision_changed:
+        click.echo(
+            f"    {change.new_path} changed from {change.old_revision or 'HEAD'} to {change.new_revision or 'HEAD'}"
+        )
+    if projectlog is None:
+        return
+    if projectlog.error:
+        LOGGER.warning("%s: Cannot list commits: %s", change.new_path, projectlog.error)
+    for commit in projectlog.commits:
+        context.secho(f"        {commit}", fg="green" if commit.startswith("+") else "red")
+
+
+@main.command(name="list")
+@click.argument("paths", nargs=-1, type=click.Path())
+@click.option("--groups", "-g", help="Comma separated list of groups, i.e. 'all,-device'. Workspace groups by default.")
+@click.option("--path-prefix", help="Just projects at or below this directory, relative to the workspace root.")
+@click.option("--regex", "-r", help="Just projects, whose name or path matches this regular expression.")
+@click.option("--name-only", "-n", is_flag=True, help="Show the project names only.")
+@click.option("--path-only", "-p", is_flag=True, help="Show the project paths only.")
+@pass_context
+def list_(context, *, paths, groups=None, path_prefix=None, regex=None, name_only=False, path_only=False):
+    """
+    List Projects As 'PATH : NAME'.
+
+    With PATHS, just the projects containing these files or directories are listed.
+    """
+    from gitwsrepo._daemon import request_list
+    from gitwsrepo._list import get_list_group_filters, list_projects
+    from gitwsrepo._workspace import RepoWorkspace
+
+    with exceptionhandling(context):
+        workspace = RepoWorkspace.from_path()
+        relpaths = tuple(_get_relpath(workspace.path, path) for path in paths)
+        entries = request_list(workspace.path, groups=groups, paths=relpaths, path_prefix=path_prefix, regex=regex)
+        if entries is None:
+            manifest = workspace.load()
+            group_filters = get_list_group_filters(workspace, manifest, groups=groups)
+            specs = list_projects(
+                manifest, group_filters=group_filters, paths=relpaths, path_prefix=path_prefix, regex=regex
+            )
+            entries = [(spec.name, spec.path or spec.name) for spec in specs]
+        if name_only:
+            lines = [name for name, _ in entries]
+        elif path_only:
+            lines = [path for _, path in entries]
+        else:
+            lines = [f"{path} : {name}" for name, path in entries]
+        if lines:
+            click.echo("\n".join(lines))
+
+
+def _get_relpath(workspace_path: Path, path: str) -> str:
+    """Return ``path`` Relative To The Workspace Root Directory."""
+    try:
+        return Path(path).resolve().relative_to(workspace_path).as_posix()
+    except ValueError:
+        raise ValueError(f"{path!r} is outside of the workspace") from None
+
+
+@main.command()
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Number of parallel jobs. Number of CPUs by default.")
+@pass_context
+def status(context, jobs=None):
+    """
+    Show Changed Files And Unpushed Or Missing Commits Of All Projects.
+
+    Clean projects in sync with their upstream are not shown.
+    """
+    import os
+
+    from gitwsrepo._daemon import request_status
+    from gitwsrepo._status import iter_status
+    from gitwsrepo._workspace import RepoWorkspace
+
+    with exceptionhandling(context):
+        workspace = RepoWorkspace.from_path()
+        jobs = jobs or os.cpu_count() or 1
+        statuses = request_status(workspace.path, jobs=jobs)
+        if statuses is None:
+            statuses = iter_status(workspace, workspace.get_projects(workspace.load()), jobs=jobs)
+        clean = True
+        for project_status in statuses:
+            if not project_status.is_clean:
+                clean = False
+                _echo_status(context, project_status)
+        if clean:
+            context.secho("nothing to commit (working directory clean)", fg=COLOR_INFO)
+
+
+def _echo_status(context, project_status):
+    header = context.style(f"project {project_status.path}/".ljust(40), bold=True)
+    if not project_status.cloned:
+        context.secho(f"{header} not cloned", fg="red")
+        return
+    info = f"branch {project_status.branch}" if project_status.branch else "(detached)"
+    counts = []
+    if project_status.ahead:
+        counts.append(f"ahead {project_status.ahead}")
+    if project_status.behind:
+        counts.append(f"behind {project_status.behind}")
+    if counts:
+        info = f"{info} [{', '.join(counts)}]"
+    click.echo(f"{header} {info}")
+    for change in project_status.changes:
+        context.secho(f" {change}", fg="red")
+
+
+@main.command()
+@click.option("--command", "-c", required=True, help="Shell command to run in every project.")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=1, show_default=True, help="Number of parallel jobs.")
+@click.option("--project-header", "-p", is_flag=True, help="Show the project path before the command output.")
+@pass_context
+def forall(context, command, jobs=1, project_header=False):
+    """
+    Run A Shell Command In Every Project.
+
+    Outputs are shown per project, in project order.
+    The command gets REPO_PROJECT, REPO_PATH, REPO_RREV, REPO_I and REPO_COUNT as environment variables.
+    """
+    from gitws._util import LOGGER
+
+    from gitwsrepo._daemon import request_forall
+    from gitwsrepo._forall import plan_forall, run_forall
+    from gitwsrepo._workspace import RepoWorkspace
+
+    with exceptionhandling(context):
+        workspace = RepoWorkspace.from_path()
+        tasks = request_forall(workspace.path)
+        if tasks is None:
+            tasks = plan_forall(workspace, workspace.get_projects(workspace.load()))
+        for result in run_forall(tasks, command, jobs=jobs):
+            if project_header:
+                context.secho(f"project {result.path}/", bold=True)
+            if result.output:
+                # the next project starts on a new line
+                click.echo(result.output, nl=not result.output.endswith("\n"))
+            if result.returncode:
+                LOGGER.error("%s: Command failed with exit code %d", result.path, result.returncode)
+
+
+@main.command()
+@click.argument("manifests", nargs=-1, required=True, type=click.Path(dir_okay=False))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    help="Output file. Just allowed for a single MANIFEST. MANIFEST with suffix '.toml' by default.",
+)
+@click.option("--watch", is_flag=True, help="Keep running and convert again on any change, until interrupted.")
+@click.option(
+    "--interval", type=click.FloatRange(min=0.1), default=1.0, show_default=True, help="Watch interval in seconds."
+)
+@pass_context
+def convert(context, manifests, output=None, watch=False, interval=1.0):
+    """
+    Convert Repo Manifests To Git Workspace Manifests.
+
+    All MANIFESTS are converted within one process, including their included manifests.
+    Outputs are just written, if the resulting manifest changed.
+    """
+    from gitwsrepo._convert import Converter
+
+    with exceptionhandling(context):
+        if output and len(manifests) > 1:
+            raise ValueError("--output is just allowed for a single MANIFEST")
+        items = [
+            (Path(manifest), Path(output) if output else Path(manifest).with_suffix(".toml")) for manifest in manifests
+        ]
+        converter = Converter()
+        try:
+            while True:
+                for source, target in items:
+                    _convert(context, converter, source, target)
+                if not watch:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+def _convert(context, converter, source, target):
+    from gitws import ManifestError, ManifestNotFoundError
+    from gitws._util import LOGGER
+
+    try:
+        if converter.convert(source, target):
+            context.secho(f"Converted {str(source)!r} to {str(target)!r}.", fg=COLOR_INFO)
+    except (ManifestNotFoundError, ManifestError) as exc:
+        LOGGER.error(str(exc))
+
+
+@main.group()
+def daemon():
+    """
+    Keep The Loaded Manifest In Memory For Faster Commands.
+
+    The daemon serves one workspace. It reloads the manifest on any change.
+    'list', 'status' and 'forall' use a running daemon and work without it as usual.
+    """
+
+
+@daemon.command()
+@click.option("--foreground", is_flag=True, help="Run in the foreground until interrupted.")
+@click.option(
+    "--interval", type=click.FloatRange(min=0.1), default=1.0, show_default=True, help="Poll interval in seconds."
+)
+@pass_context
+def start(context, foreground=False, interval=1.0):
+    """Start The Daemon For The Current Workspace."""
+    from gitwsrepo._daemon import Daemon, request
+    from gitwsrepo._workspace import RepoWorkspace
+
+    with exceptionhandling(context):
+        path = RepoWorkspace.from_path().path
+        if foreground:
+            context.secho(f"Daemon serving {str(path)!r}.", fg=COLOR_INFO)
+            try:
+                Daemon(path, interval=interval).serve()
+            except KeyboardInterrupt:
+                pass
+            return
+        if request(path, "ping") is not None:
+            raise ValueError("Daemon is already running")
+        _spawn_daemon(path, interval)
+        for _ in range(100):
+            time.sleep(0.1)
+            response = request(path, "ping")
+            if response is not None:
+                context.secho(f"Daemon started (pid {response['pid']}).", fg=COLOR_INFO)
+                return
+        raise ValueError("Daemon did not start. See '.git-ws/repo-daemon.log'")
+
+
+def _spawn_daemon(path: Path, interval: float):
+    import subprocess
+    import sys
+
+    from gitws.const import GIT_WS_PATH
+
+    cmd = [sys.executable, "-m", "gitwsrepo", "-v", "daemon", "start", "--foreground", f"--interval={interval}"]
+    with (path / GIT_WS_PATH / "repo-daemon.log").open("ab") as log:
+        subprocess.Popen(  # noqa: S603
+            cmd, cwd=path, stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True
+        )
+
+
+@daemon.command()
+@pass_context
+def stop(context):
+    """Stop The Daemon Of The Current Workspace."""
+    from gitwsrepo._daemon import request
+    from gitwsrepo._workspace import RepoWorkspace
+
     with exceptionhandling(context):
-        click.secho("Sync-TODO")
+        path = RepoWorkspace.from_path().path
+        if request(path, "stop") is None:
+            raise ValueError("Daemon is not running")
+        context.secho("Daemon stopped.", fg=COLOR_INFO)
@@ -18,26 +18,33 @@
 
 import traceback
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any
 
 import click
-from pydantic import BaseModel
 
 COLOR_INFO = "blue"
 
 
-class Context(BaseModel):
-    """Command Line Context."""
+@dataclass
+class Context:
+    """
+    Command Line Context.
+
+    A plain dataclass, as :any:`pydantic` is not needed for ``--help`` and ``--version``.
+    """
 
     verbose: int
     color: bool
     handler: Any = None
 
-    def secho(self, message, **kwargs):
-        """Print with color support similar to :any:`click.secho()."""
+    def secho(self, message, err=False, **kwargs):
+        """Print with color support similar to :any:`click.secho()`, via the logging handler."""
         if self.color:
-            return click.secho(message, **kwargs)
-        return click.echo(message)
+            message = click.style(message, **kwargs)
+        if self.handler is not None:
+            return self.handler.echo(message, err=err)
+        return click.echo(message, err=err)
 
     def style(self, text, **kwargs):
         """Format ``text``."""
@@ -17,6 +17,11 @@
 """Logging."""
 
 import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from queue import SimpleQueue
+from typing import Any, NamedTuple
 
 import click
 
@@ -40,6 +45,112 @@ class LogHandler(logging.Handler):
             self.has_errors = True
         click.echo(self.format(record), err=record.levelno >= logging.WARNING)
 
+    def echo(self, message: str, err: bool = False):
+        """Print ``message``."""
+        click.echo(message, err=err)
+
+
+class _Line(NamedTuple):
+    text: str
+    err: bool
+
+
+class _Status(NamedTuple):
+    text: str
+
+
+_STOP = object()
+
+
+class BufferedLogHandler(LogHandler):
+    """
+    Non-Blocking Logging Handler.
+
+    Logging threads just queue their records.
+    A single writer thread formats and prints them in batches.
+    ``has_errors`` is updated immediately.
+
+    Keyword Args:
+        progress: Show a status line, updated by :any:`progress`, below all other output.
+    """
+
+    def __init__(self, progress: bool = False):
+        super().__init__()
+        self.progress_mode = progress
+        self._queue: SimpleQueue[Any] = SimpleQueue()
+        self._status = ""
+        self._thread = threading.Thread(target=self._run, name="log", daemon=True)
+        self._thread.start()
+
+    def emit(self, record):
+        """Queue Message."""
+        if record.levelno >= logging.ERROR:
+            self.has_errors = True
+        self._queue.put(record)
+
+    def echo(self, message: str, err: bool = False):
+        """Queue ``message``."""
+        self._queue.put(_Line(message, err))
+
+    def progress(self, done: int, total: int, failed: int = 0):
+        """Update Status Line."""
+        if self.progress_mode:
+            self._queue.put(_Status(format_progress(done, total, failed)))
+
+    def flush(self):
+        """Wait Until Everything Queued So Far Is Printed."""
+        if self._thread.is_alive():
+            event = threading.Event()
+            self._queue.put(event)
+            event.wait()
+
+    def close(self):
+        """Print Everything Queued And Stop Writer Thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        super().close()
+
+    def _run(self):
+        stop = False
+        while not stop:
+            items = [self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get())
+            lines: list[_Line] = []
+            events: list[threading.Event] = []
+            status = self._status
+            for item in items:
+                if isinstance(item, logging.LogRecord):
+                    lines.append(_Line(self.format(item), item.levelno >= logging.WARNING))
+                elif isinstance(item, _Line):
+                    lines.append(item)
+                elif isinstance(item, _Status):
+                    status = item.text
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+                else:
+                    stop = True
+            self._write(lines, status, stop)
+            for event in events:
+                event.set()
+
+    def _write(self, lines: list["_Line"], status: str, stop: bool):
+        if lines and self._status:
+            click.echo(f"\r{' ' * len(self._status)}\r", nl=False, err=True)
+            self._status = ""
+        start = 0
+        for idx in range(1, len(lines) + 1):
+            if idx == len(lines) or lines[idx].err != lines[start].err:
+                click.echo("\n".join(line.text for line in lines[start:idx]), err=lines[start].err)
+                start = idx
+        if status != self._status or (lines and status):
+            click.echo(f"\r{status.ljust(len(self._status))}", nl=False, err=True)
+            self._status = status
+        if stop and self._status:
+            click.echo(err=True)
+            self._status = ""
+
 
 class LogFormatter(logging.Formatter):
     """Log Formatter."""
@@ -76,6 +187,44 @@ class LogFormatter(logging.Formatter):
         return "\n".join(f"{prefix} {line}" for line in lines)
 
 
+def format_progress(done: int, total: int, failed: int = 0, width: int = 30) -> str:
+    """
+    Format Progress Bar.
+
+    >>> format_progress(3, 10)
+    '[#########                     ]   3/10'
+    >>> format_progress(10, 10, failed=1)
+    '[##############################]  10/10 (1 failed)'
+    """
+    filled = width * done // total if total else width
+    text = f"[{'#' * filled}{' ' * (width - filled)}] {done:3d}/{total}"
+    if failed:
+        text = f"{text} ({failed} failed)"
+    return text
+
+
+@contextmanager
+def buffered_logging(context, progress: bool = False) -> Iterator[BufferedLogHandler]:
+    """
+    Route All Logging And Context Output Through A :any:`BufferedLogHandler`.
+
+    Everything is printed on exit and errors are reported to the previous handler.
+    """
+    prev = context.handler
+    handler = BufferedLogHandler(progress=progress)
+    handler.formatter = prev.formatter
+    logger = logging.getLogger()
+    logger.handlers = [handler]
+    context.handler = handler
+    try:
+        yield handler
+    finally:
+        handler.close()
+        logger.handlers = [prev]
+        context.handler = prev
+        prev.has_errors = prev.has_errors or handler.has_errors
+
+
 def setup_logging(color: bool, verbose: int) -> LogHandler:
     """Create And Setup Logging Handler."""
     handler = LogHandler()
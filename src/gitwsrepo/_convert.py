@@ -0,0 +1,90 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Repo Manifest To Git Workspace Manifest Conversion."""
+
+from pathlib import Path
+from typing import Optional
+
+from gitws import ManifestError, ManifestNotFoundError, ManifestSpec
+from gitws._util import LOGGER
+from gitws.gitwsmanifestformat import GitWSManifestFormat
+
+from .repomanifestformat import _Loader
+
+_State = tuple[tuple[Path, ...], tuple[Optional[tuple[int, int]], ...]]
+
+
+class Converter:
+    """
+    Convert Repo Manifests To Git Workspace Manifests.
+
+    The converter remembers the state of all files a conversion depends on.
+    Converting the same manifest again is just done, if any of these files changed.
+    """
+
+    def __init__(self):
+        self._format = GitWSManifestFormat()
+        self._states: dict[tuple[Path, Path], _State] = {}
+
+    def convert(self, source: Path, target: Path) -> bool:
+        """
+        Convert Repo Manifest At ``source`` To Git Workspace Manifest At ``target``.
+
+        ``target`` is just written, if the effective manifest differs from the one stored at ``target``.
+
+        Returns:
+            ``True`` if ``target`` was written.
+
+        Raises:
+            ManifestNotFoundError: if ``source`` is not found
+            ManifestError: On Syntax Or Data Scheme Errors.
+        """
+        key = (source.resolve(), target.resolve())
+        state = self._states.get(key)
+        if state is not None and _stat(state[0]) == state[1]:
+            LOGGER.debug("%r: Unchanged", str(source))
+            return False
+        loader = _Loader(source)
+        spec = loader.load().spec
+        written = self._load(target) != spec
+        if written:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._format.save(spec, target)
+        else:
+            LOGGER.info("%r: Up to date", str(target))
+        paths = (*loader.paths, target)
+        self._states[key] = (paths, _stat(paths))
+        return written
+
+    def _load(self, path: Path) -> Optional[ManifestSpec]:
+        try:
+            return self._format.load(path)
+        except (ManifestNotFoundError, ManifestError):
+            return None
+
+
+def _stat(paths: tuple[Path, ...]) -> tuple[Optional[tuple[int, int]], ...]:
+    return tuple(_stat_path(path) for path in paths)
+
+
+def _stat_path(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
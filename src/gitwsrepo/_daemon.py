@@ -0,0 +1,264 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Workspace Daemon.
+
+An opt-in long-lived process, which keeps the loaded manifest, its group index and the resolved projects
+of one workspace in memory. It listens on a Unix domain socket within the workspace (:any:`DAEMON_SOCKET_PATH`)
+and answers one JSON request per connection:
+
+* ``status``: The :any:`ProjectStatus` of all projects.
+* ``forall``: The :any:`ForallTask` for all projects. The command itself is run by the client.
+* ``list``: Names and paths of the projects selected by :any:`list_projects`.
+
+The manifest files and the workspace configuration are polled for changes and reloaded in the background.
+Every request checks for changes too, so answers are never outdated.
+
+Commands use the daemon via the ``request_*`` functions, which return ``None`` if the daemon is not running.
+The command falls back to in-process execution then.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from gitws._util import LOGGER
+from gitws.const import GIT_WS_PATH
+
+from ._forall import ForallTask, plan_forall
+from ._list import get_list_group_filters, list_projects
+from ._status import ProjectStatus, iter_status
+from ._workspace import RepoWorkspace
+from .const import LOCAL_MANIFESTS_PATH, MANIFESTS_PATH
+from .datamodel import RepoManifest
+
+if TYPE_CHECKING:
+    from gitws import Project
+
+DAEMON_SOCKET_PATH = GIT_WS_PATH / "repo-daemon.sock"
+"""Daemon Socket. Relative to the workspace root directory."""
+
+CONNECT_TIMEOUT = 1.0
+"""Connect Timeout In Seconds."""
+
+
+class Daemon:
+    """
+    Workspace Daemon.
+
+    Args:
+        path: Workspace root directory.
+
+    Keyword Args:
+        interval: Poll interval for changed files in seconds.
+    """
+
+    def __init__(self, path: Path, interval: float = 1.0):
+        self.path = path
+        self.interval = interval
+        self.requests = 0
+        """Number of handled requests."""
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._snapshot: Optional[dict[str, tuple[int, int]]] = None
+        self._loaded: Optional[tuple[RepoWorkspace, RepoManifest, tuple[Project, ...]]] = None
+        self._error = "Not loaded"
+        self._server: Optional[socketserver.BaseServer] = None
+        self._stopped = threading.Event()
+
+    def refresh(self) -> bool:
+        """Load Manifest Again, If Any Manifest Or Configuration File Changed. Return ``True`` On Reload."""
+        with self._reload_lock:
+            snapshot = _get_snapshot(self.path)
+            if snapshot == self._snapshot:
+                return False
+            try:
+                workspace = RepoWorkspace.from_path(self.path)
+                manifest = workspace.load()
+                projects = workspace.get_projects(manifest)
+                # build the index upfront, not on the first request
+                manifest.path_index  # noqa: B018
+            except Exception as exc:
+                LOGGER.warning("Cannot load manifest: %s", exc)
+                with self._lock:
+                    self._snapshot, self._loaded, self._error = snapshot, None, str(exc)
+                return True
+            with self._lock:
+                self._snapshot, self._loaded = snapshot, (workspace, manifest, projects)
+            LOGGER.info("Loaded %d projects", len(projects))
+            return True
+
+    def serve(self):
+        """
+        Serve Requests Until :any:`stop`.
+
+        Raises:
+            ValueError: Unix domain sockets are not available or the daemon is already running.
+        """
+        if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+            raise ValueError("The daemon requires Unix domain sockets")
+        sockpath = self.path / DAEMON_SOCKET_PATH
+        if request(self.path, "ping") is not None:
+            raise ValueError(f"Daemon is already running at {str(sockpath)!r}")
+        sockpath.unlink(missing_ok=True)
+        self.refresh()
+        handler = type("Handler", (_Handler,), {"daemon": self})
+        server = socketserver.ThreadingUnixStreamServer(str(sockpath), handler)  # type: ignore[attr-defined]
+        server.daemon_threads = True
+        self._server = server
+        watcher = threading.Thread(target=self._watch, name="watch", daemon=True)
+        try:
+            with server:
+                watcher.start()
+                server.serve_forever()
+        finally:
+            self._stopped.set()
+            sockpath.unlink(missing_ok=True)
+
+    def stop(self):
+        """Stop Serving."""
+        self._stopped.set()
+        if self._server is not None:
+            # ``shutdown`` waits for ``serve_forever`` to return
+            threading.Thread(target=self._server.shutdown, name="shutdown").start()
+
+    def handle(self, req: dict[str, Any]) -> dict[str, Any]:
+        """Return Response To ``req``."""
+        with self._lock:
+            self.requests += 1
+        name = req.get("request")
+        if name == "ping":
+            return {"pid": os.getpid()}
+        if name == "stop":
+            self.stop()
+            return {}
+        self.refresh()
+        with self._lock:
+            loaded, error = self._loaded, self._error
+        if loaded is None:
+            raise ValueError(error)
+        workspace, manifest, projects = loaded
+        if name == "status":
+            jobs = int(req.get("jobs") or 1)
+            return {"status": [status._asdict() for status in iter_status(workspace, projects, jobs=jobs)]}
+        if name == "forall":
+            return {"tasks": [task._asdict() for task in plan_forall(workspace, projects)]}
+        if name == "list":
+            group_filters = get_list_group_filters(workspace, manifest, groups=req.get("groups"))
+            specs = list_projects(
+                manifest,
+                group_filters=group_filters,
+                paths=req.get("paths") or (),
+                path_prefix=req.get("path_prefix"),
+                regex=req.get("regex"),
+            )
+            return {"projects": [[spec.name, spec.path or spec.name] for spec in specs]}
+        raise ValueError(f"Unknown request {name!r}")
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            self.refresh()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    daemon: Daemon
+
+    def handle(self):
+        try:
+            response = self.daemon.handle(json.loads(self.rfile.readline()))
+        except Exception as exc:
+            response = {"error": str(exc)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def _get_snapshot(path: Path) -> dict[str, tuple[int, int]]:
+    """Return Modification Time And Size Of All Files The Loaded Manifest Depends On."""
+    snapshot = {}
+    paths = [*(path / GIT_WS_PATH).glob("*.toml"), path / LOCAL_MANIFESTS_PATH]
+    paths.extend((path / LOCAL_MANIFESTS_PATH).glob("*.xml"))
+    for dirpath, dirnames, filenames in os.walk(path / MANIFESTS_PATH):
+        dirnames[:] = [dirname for dirname in dirnames if dirname != ".git"]
+        paths.extend(Path(dirpath) / filename for filename in filenames if filename.endswith(".xml"))
+    for filepath in paths:
+        try:
+            stat = filepath.stat()
+        except OSError:
+            continue
+        snapshot[str(filepath)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def request(path: Path, name: str, **kwargs) -> Optional[dict[str, Any]]:
+    """
+    Send Request ``name`` With ``kwargs`` To The Daemon Of The Workspace At ``path`` And Return The Response.
+
+    ``None`` is returned, if the daemon is not running or fails.
+    """
+    family = getattr(socket, "AF_UNIX", None)
+    sockpath = path / DAEMON_SOCKET_PATH
+    if family is None or not sockpath.exists():
+        return None
+    try:
+        with socket.socket(family) as sock:
+            sock.settimeout(CONNECT_TIMEOUT)
+            sock.connect(str(sockpath))
+            sock.settimeout(None)
+            sock.sendall(json.dumps({"request": name, **kwargs}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as file:
+                response = json.loads(file.readline())
+    except (OSError, ValueError) as exc:
+        LOGGER.debug("Daemon request %r failed: %s", name, exc)
+        return None
+    if "error" in response:
+        LOGGER.debug("Daemon request %r failed: %s", name, response["error"])
+        return None
+    return response
+
+
+def request_status(path: Path, jobs: int = 1) -> Optional[list[ProjectStatus]]:
+    """Return The Status Of All Projects Of The Workspace At ``path`` From The Daemon."""
+    response = request(path, "status", jobs=jobs)
+    if response is None:
+        return None
+    return [ProjectStatus(**{**item, "changes": tuple(item["changes"])}) for item in response["status"]]
+
+
+def request_list(
+    path: Path,
+    groups: Optional[str] = None,
+    paths: tuple[str, ...] = (),
+    path_prefix: Optional[str] = None,
+    regex: Optional[str] = None,
+) -> Optional[list[tuple[str, str]]]:
+    """Return Name And Path Of The Projects Of The Workspace At ``path`` Selected By :any:`list_projects`."""
+    response = request(path, "list", groups=groups, paths=list(paths), path_prefix=path_prefix, regex=regex)
+    if response is None:
+        return None
+    return [(name, projectpath) for name, projectpath in response["projects"]]
+
+
+def request_forall(path: Path) -> Optional[list[ForallTask]]:
+    """Return The Forall Tasks Of The Workspace At ``path`` From The Daemon."""
+    response = request(path, "forall")
+    if response is None:
+        return None
+    return [ForallTask(**item) for item in response["tasks"]]
@@ -0,0 +1,185 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Manifest Comparison.
+
+:any:`diff_manifests` matches the projects of two manifests by name via hash maps - in linear time.
+:any:`iter_logs` lists the commits between the old and the new revision of every changed project,
+with one ``git log`` per project, in parallel via the :any:`Runner`.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from gitws import ManifestSpec, ProjectSpec
+
+from ._git import GitError, is_cloned
+from ._runner import Runner, git_command
+from ._timing import phase
+
+
+class ProjectChange(NamedTuple):
+    """Project Present In Both Manifests With A Different Path Or Revision."""
+
+    name: str
+    """Project Name."""
+
+    old_path: str
+    """Project Path In The Old Manifest."""
+
+    new_path: str
+    """Project Path In The New Manifest."""
+
+    old_revision: Optional[str]
+    """Revision In The Old Manifest."""
+
+    new_revision: Optional[str]
+    """Revision In The New Manifest."""
+
+    @property
+    def path_changed(self) -> bool:
+        """Path Changed."""
+        return self.old_path != self.new_path
+
+    @property
+    def revision_changed(self) -> bool:
+        """Revision Changed."""
+        return self.old_revision != self.new_revision
+
+
+class ManifestDiff(NamedTuple):
+    """Difference Between Two Manifests."""
+
+    added: tuple[ProjectSpec, ...]
+    """Projects Just In The New Manifest. The revision is the effective one."""
+
+    removed: tuple[ProjectSpec, ...]
+    """Projects Just In The Old Manifest. The revision is the effective one."""
+
+    changed: tuple[ProjectChange, ...]
+    """Projects In Both Manifests With Different Path Or Revision."""
+
+
+class ProjectLog(NamedTuple):
+    """Commits Between The Old And The New Revision Of A Changed Project."""
+
+    change: ProjectChange
+    """Changed Project."""
+
+    commits: tuple[str, ...]
+    """Commits: ``+ SHA SUBJECT`` for new commits and ``- SHA SUBJECT`` for dropped commits."""
+
+    error: Optional[str] = None
+    """Reason, Why The Commits Are Unknown."""
+
+
+def diff_manifests(old: ManifestSpec, new: ManifestSpec) -> ManifestDiff:
+    """
+    Compare ``old`` and ``new`` Manifest.
+
+    Projects are matched by name. Projects keep the order of their manifest.
+
+    >>> old = ManifestSpec(defaults={"revision": "main"}, dependencies=[{"name": "a"}, {"name": "b"}])
+    >>> new = ManifestSpec(dependencies=[{"name": "b", "path": "c", "revision": "v1"}, {"name": "d"}])
+    >>> diff = diff_manifests(old, new)
+    >>> [project.name for project in diff.added]
+    ['d']
+    >>> [(project.name, project.revision) for project in diff.removed]
+    [('a', 'main')]
+    >>> diff.changed
+    (ProjectChange(name='b', old_path='b', new_path='c', old_revision='main', new_revision='v1'),)
+    """
+    with phase("diff-manifests"):
+        old_projects = {project.name: project for project in old.dependencies}
+        new_projects = {project.name: project for project in new.dependencies}
+        old_revision = old.defaults.revision
+        new_revision = new.defaults.revision
+        added = tuple(
+            _with_revision(project, new_revision) for name, project in new_projects.items() if name not in old_projects
+        )
+        removed = tuple(
+            _with_revision(project, old_revision) for name, project in old_projects.items() if name not in new_projects
+        )
+        changed = []
+        for name, new_project in new_projects.items():
+            old_project = old_projects.get(name)
+            if old_project is None:
+                continue
+            old_path = old_project.path or name
+            new_path = new_project.path or name
+            old_project_revision = old_project.revision or old_revision
+            new_project_revision = new_project.revision or new_revision
+            if old_path != new_path or old_project_revision != new_project_revision:
+                changed.append(ProjectChange(name, old_path, new_path, old_project_revision, new_project_revision))
+        return ManifestDiff(added, removed, tuple(changed))
+
+
+def _with_revision(project: ProjectSpec, revision: Optional[str]) -> ProjectSpec:
+    if project.revision or not revision:
+        return project
+    return project.model_copy(update={"revision": revision})
+
+
+def iter_logs(path: Path, changes: tuple[ProjectChange, ...], jobs: int = 1) -> Iterator[ProjectLog]:
+    """
+    Yield The Commits Between Old And New Revision Of All Revision-Changed Projects In Change Order.
+
+    Args:
+        path: Workspace root directory. The commits are read from the clones at the new project paths.
+        changes: Changed Projects.
+
+    Keyword Args:
+        jobs: Number of parallel ``git log`` processes.
+    """
+    changes = tuple(change for change in changes if change.revision_changed)
+    errors = {change: _check(path, change) for change in changes}
+    commands = [
+        git_command(
+            "log",
+            "--left-right",
+            "--format=%m %h %s",
+            f"{change.old_revision}...{change.new_revision}",
+            "--",
+            cwd=path / change.new_path,
+        )
+        for change in changes
+        if errors[change] is None
+    ]
+    with phase("log"):
+        results = Runner(jobs=jobs).iter_run(commands)
+        for change in changes:
+            error = errors[change]
+            if error is not None:
+                yield ProjectLog(change, (), error)
+                continue
+            result = next(results)
+            if result.returncode:
+                stderr = result.stderr.decode("utf-8", errors="replace").strip()
+                yield ProjectLog(change, (), str(GitError(result.command.args[1:], stderr)))
+                continue
+            lines = result.stdout.decode("utf-8", errors="replace").splitlines()
+            yield ProjectLog(change, tuple(("+" if line[0] == ">" else "-") + line[1:] for line in lines))
+
+
+def _check(path: Path, change: ProjectChange) -> Optional[str]:
+    if not is_cloned(path / change.new_path):
+        return "not cloned"
+    if not change.old_revision or not change.new_revision:
+        return "revision unknown"
+    return None
@@ -0,0 +1,219 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Links And Copies.
+
+:any:`apply_filerefs` applies all ``<linkfile>`` and ``<copyfile>`` entries of the workspace in one pass.
+
+* The destinations are inspected with one ``os.scandir`` per directory.
+* Links are up to date, if they point to their source.
+* Copies are up to date, if size and modification time match the source and the last copy.
+  Otherwise the content hashes are compared, before the file is copied.
+* Links and copies of earlier syncs, which are not specified anymore, are removed - unless they were modified.
+"""
+
+import hashlib
+import os
+import shutil
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from gitws import Project
+from gitws._util import LOGGER, no_echo
+
+from .datamodel import FileRefState
+
+_LINK = "link"
+_COPY = "copy"
+
+
+class _FileRef(NamedTuple):
+    kind: str
+    src: str
+
+
+def apply_filerefs(path: Path, projects: Iterable[Project], states: dict[str, FileRefState], secho=None) -> int:
+    """
+    Apply All Links And Copies Of ``projects`` In The Workspace At ``path``.
+
+    Projects, which are not cloned, are ignored.
+
+    Args:
+        path: Workspace root directory.
+        projects: Projects.
+        states: Applied links and copies by destination path. Updated in place.
+
+    Keyword Args:
+        secho: :any:`click.secho` like print method for verbose output.
+
+    Returns:
+        Number of failed links and copies. Every failure is reported via ``logging.error``.
+    """
+    secho = secho or no_echo
+    filerefs, failed = _get_filerefs(path, projects)
+    stales = [dest for dest in states if dest not in filerefs]
+    entries = _scan(path, [*filerefs, *stales])
+    for dest in stales:
+        _remove(path, dest, states.pop(dest), entries.get(dest), secho)
+    for dest, fileref in filerefs.items():
+        if not _apply(path, dest, fileref, states, entry=entries.get(dest), secho=secho):
+            failed += 1
+    return failed
+
+
+def _get_filerefs(path: Path, projects: Iterable[Project]) -> tuple[dict[str, _FileRef], int]:
+    filerefs: dict[str, _FileRef] = {}
+    failed = 0
+    for project in projects:
+        if not (path / project.path).is_dir():
+            continue
+        for kind, items in ((_LINK, project.linkfiles), (_COPY, project.copyfiles)):
+            for item in items:
+                dest = os.path.normpath(item.dest)
+                src = os.path.normpath(Path(project.path) / item.src)
+                error = _check(dest, filerefs.get(dest)) or _check(src)
+                if error:
+                    LOGGER.error("%s: Cannot %s %r: %s", project.path, kind, item.dest, error)
+                    failed += 1
+                else:
+                    filerefs[dest] = _FileRef(kind, src)
+    return filerefs, failed
+
+
+def _check(relpath: str, existing: Optional[_FileRef] = None) -> Optional[str]:
+    if Path(relpath).is_absolute() or relpath.split(os.sep, 1)[0] in (os.pardir, os.curdir):
+        return "Outside workspace"
+    if existing:
+        return f"Already used by {existing.src!r}"
+    return None
+
+
+def _scan(path: Path, dests: Iterable[str]) -> dict[str, os.DirEntry]:
+    """Return Directory Entries Of Existing ``dests`` - With One ``os.scandir`` Per Directory."""
+    names_by_dir: dict[str, dict[str, str]] = {}
+    for dest in dests:
+        dirname, name = os.path.split(dest)
+        names_by_dir.setdefault(dirname, {})[name] = dest
+    entries: dict[str, os.DirEntry] = {}
+    for dirname, names in names_by_dir.items():
+        entries.update(_scandir(path / dirname, names))
+    return entries
+
+
+def _scandir(dirpath: Path, names: dict[str, str]) -> Iterable[tuple[str, os.DirEntry]]:
+    try:
+        with os.scandir(dirpath) as iterator:
+            return [(names[entry.name], entry) for entry in iterator if entry.name in names]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _apply(
+    path: Path, dest: str, fileref: _FileRef, states: dict[str, FileRefState], *, entry: Optional[os.DirEntry], secho
+) -> bool:
+    destpath = path / dest
+    srcpath = path / fileref.src
+    try:
+        if fileref.kind == _LINK:
+            target = os.path.relpath(srcpath, destpath.parent)
+            if entry is None or not entry.is_symlink() or _readlink(entry) != target:
+                _prepare(destpath, entry)
+                destpath.symlink_to(target)
+                secho(f"{dest}: Linked {fileref.src!r}.")
+            states[dest] = FileRefState(kind=_LINK, src=fileref.src)
+            return True
+        srcstat = srcpath.stat()
+        state = states.get(dest)
+        if state and state.kind == _COPY and state.src == fileref.src and _is_copy(state, srcstat, entry):
+            return True
+        sha = _get_sha(srcpath)
+        if _is_copy(None, srcstat, entry) and _get_sha(destpath) == sha:
+            # same content, different modification time
+            shutil.copystat(srcpath, destpath)
+        else:
+            _prepare(destpath, entry)
+            shutil.copy2(srcpath, destpath)
+            secho(f"{dest}: Copied {fileref.src!r}.")
+        states[dest] = FileRefState(
+            kind=_COPY, src=fileref.src, size=srcstat.st_size, mtime_ns=srcstat.st_mtime_ns, sha=sha
+        )
+    except OSError as exc:
+        LOGGER.error("%s: Cannot %s %r: %s", dest, fileref.kind, fileref.src, exc)
+        states.pop(dest, None)
+        return False
+    return True
+
+
+def _is_copy(state: Optional[FileRefState], stat: os.stat_result, entry: Optional[os.DirEntry]) -> bool:
+    """
+    Return ``True`` if ``entry`` Is A Regular File Of The Size Of The Source ``stat``.
+
+    With the ``state`` of the last copy, the modification times must match too.
+    """
+    if entry is None or entry.is_symlink() or not entry.is_file():
+        return False
+    entrystat = entry.stat()
+    if entrystat.st_size != stat.st_size:
+        return False
+    if state is None:
+        return True
+    return state.size == stat.st_size and state.mtime_ns == stat.st_mtime_ns == entrystat.st_mtime_ns
+
+
+def _prepare(destpath: Path, entry: Optional[os.DirEntry]):
+    if entry is None:
+        destpath.parent.mkdir(parents=True, exist_ok=True)
+    else:
+        destpath.unlink()
+
+
+def _remove(path: Path, dest: str, state: FileRefState, entry: Optional[os.DirEntry], secho):
+    if entry is None:
+        return
+    if state.kind == _LINK:
+        target = os.path.relpath(path / state.src, (path / dest).parent)
+        modified = not entry.is_symlink() or _readlink(entry) != target
+    else:
+        modified = entry.is_symlink() or not entry.is_file()
+        if not modified:
+            stat = entry.stat()
+            modified = stat.st_size != state.size or (
+                stat.st_mtime_ns != state.mtime_ns and _get_sha(Path(entry.path)) != state.sha
+            )
+    if modified:
+        LOGGER.warning("%s: Modified, not removed", dest)
+        return
+    try:
+        Path(entry.path).unlink()
+    except OSError as exc:
+        LOGGER.error("%s: Cannot remove: %s", dest, exc)
+        return
+    secho(f"{dest}: Removed.")
+
+
+def _readlink(entry: os.DirEntry) -> str:
+    return str(Path(entry.path).readlink())
+
+
+def _get_sha(path: Path) -> str:
+    sha = hashlib.sha256()
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
@@ -0,0 +1,116 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Run A Command In All Projects.
+
+The command is run via the shell in a bounded number of parallel processes, see :any:`Runner`.
+The output of every project is collected and yielded in project order, as soon as all previous projects are done.
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from gitws import Project
+
+from ._git import is_cloned
+from ._runner import OUTPUT_LIMIT, Command, Runner
+from ._timing import phase
+from ._workspace import RepoWorkspace, get_mirror_path
+
+
+class ForallResult(NamedTuple):
+    """Result Of The Command In One Project."""
+
+    path: str
+    """Project Path."""
+
+    returncode: int
+    """Exit Code Of The Command."""
+
+    output: str
+    """Standard Output And Standard Error Of The Command."""
+
+
+class ForallTask(NamedTuple):
+    """Planned Command Run In One Project."""
+
+    path: str
+    """Directory To Run The Command In."""
+
+    project_path: str
+    """Project Path."""
+
+    env: dict[str, str]
+    """Additional Environment Variables."""
+
+
+def plan_forall(workspace: RepoWorkspace, projects: tuple[Project, ...]) -> list[ForallTask]:
+    """
+    Return The Tasks To Run A Command In All Cloned ``projects``.
+
+    Like repo, the command gets information about the project via environment variables:
+    ``REPO_PROJECT``, ``REPO_PATH``, ``REPO_RREV``, ``REPO_I`` and ``REPO_COUNT``.
+    Projects, which are not cloned, are skipped.
+    """
+    count = len(projects)
+    tasks = []
+    for idx, project in enumerate(projects, 1):
+        if workspace.config.mirror:
+            path = get_mirror_path(workspace.path, project.name)
+            exists = path.exists()
+        else:
+            path = workspace.path / project.path
+            exists = is_cloned(path)
+        if not exists:
+            continue
+        env = {
+            "REPO_PROJECT": project.name,
+            "REPO_PATH": project.path,
+            "REPO_RREV": project.revision or "",
+            "REPO_I": str(idx),
+            "REPO_COUNT": str(count),
+        }
+        tasks.append(ForallTask(str(path), project.path, env))
+    return tasks
+
+
+def run_forall(tasks: Iterable[ForallTask], command: str, jobs: int = 1) -> Iterator[ForallResult]:
+    """
+    Run ``command`` For All ``tasks`` And Yield The Results In Task Order.
+
+    Args:
+        tasks: Tasks.
+        command: Shell Command.
+
+    Keyword Args:
+        jobs: Number of parallel processes.
+
+    Just the last :any:`OUTPUT_LIMIT` bytes of every output are kept.
+    """
+    tasks = tuple(tasks)
+    commands = [
+        Command((command,), cwd=task.path, env={**os.environ, **task.env}, shell=True, merge=True)  # noqa: S604
+        for task in tasks
+    ]
+    with phase("forall"):
+        for task, result in zip(tasks, Runner(jobs=jobs).iter_run(commands)):
+            output = result.stdout.decode("utf-8", errors="replace")
+            if result.truncated:
+                output = f"[output truncated to the last {OUTPUT_LIMIT} bytes]\n{output}"
+            yield ForallResult(task.project_path, result.returncode, output)
@@ -0,0 +1,183 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Git Command Helper.
+
+The sync engine needs more control over ``git`` than :any:`gitws.Git` offers.
+"""
+
+import re
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+from gitws._util import run
+
+_RE_SHA = re.compile(r"\A[0-9a-f]{40}([0-9a-f]{24})?\Z")
+
+
+class GitError(RuntimeError):
+    """Git Command Failed."""
+
+    def __init__(self, args: tuple[str, ...], stderr: str):
+        cmd = " ".join(("git", *args))
+        super().__init__(f"{cmd!r} failed: {stderr}" if stderr else f"{cmd!r} failed")
+
+
+def git(*args: str, cwd: Optional[Path] = None) -> str:
+    """
+    Run ``git`` with ``args`` and return the stripped standard output.
+
+    Raises:
+        GitError: On non-zero exit code.
+    """
+    try:
+        result = run(("git", *args), cwd=cwd, capture_output=True)
+    except subprocess.CalledProcessError as error:
+        raise GitError(args, error.stderr.decode("utf-8", errors="replace").strip()) from None
+    return result.stdout.decode("utf-8", errors="replace").strip()
+
+
+def is_cloned(path: Path) -> bool:
+    """Check If ``path`` Is The Top Directory Of A Git Clone."""
+    return (path / ".git").exists()
+
+
+def get_head(path: Path) -> Optional[str]:
+    """
+    Return SHA Of ``HEAD`` Of Git Clone Or Bare Repository At ``path``.
+
+    ``None`` is returned, if there is no clone or no commit.
+    The SHA is read from the git files directly, to avoid one ``git`` process per clone.
+    Uncommon layouts, like worktrees, are handled by ``git`` itself.
+    """
+    gitdir = path / ".git"
+    if gitdir.is_file():
+        return _rev_parse_head(path)
+    if not gitdir.is_dir():
+        if not (path / "HEAD").is_file():
+            return None
+        gitdir = path
+    try:
+        head = (gitdir / "HEAD").read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
+    if not head.startswith("ref: "):
+        return head if is_sha(head) else _rev_parse_head(path)
+    ref = head[5:]
+    sha = _read_ref(gitdir, ref)
+    if sha is None:
+        return _rev_parse_head(path)
+    return sha
+
+
+def _read_ref(gitdir: Path, ref: str) -> Optional[str]:
+    refpath = gitdir / ref
+    if refpath.is_file():
+        sha = refpath.read_text(encoding="utf-8").strip()
+        return sha if is_sha(sha) else None
+    packed_refs = gitdir / "packed-refs"
+    if packed_refs.is_file():
+        suffix = f" {ref}"
+        for line in packed_refs.read_text(encoding="utf-8").splitlines():
+            if line.endswith(suffix):
+                sha = line[: -len(suffix)]
+                return sha if is_sha(sha) else None
+    return None
+
+
+def _rev_parse_head(path: Path) -> Optional[str]:
+    try:
+        return git("rev-parse", "--verify", "--quiet", "HEAD", cwd=path) or None
+    except GitError:
+        return None
+
+
+def ls_remote(url: str, *patterns: str) -> dict[str, str]:
+    """
+    Return SHAs By Reference Name Of The Remote Repository At ``url``, Limited To ``patterns``.
+
+    Raises:
+        GitError: On non-zero exit code.
+    """
+    refs = {}
+    for line in git("ls-remote", "--", url, *patterns).splitlines():
+        sha, ref = line.split("\t", 1)
+        refs[ref] = sha
+    return refs
+
+
+def get_ref_patterns(revision: Optional[str]) -> tuple[str, ...]:
+    """
+    Return :any:`ls_remote` Patterns To Resolve ``revision`` Including Peeled Tags.
+
+    >>> get_ref_patterns("v1.0")
+    ('v1.0', 'v1.0^{}')
+    >>> get_ref_patterns(None)
+    ('HEAD',)
+    """
+    if revision is None:
+        return ("HEAD",)
+    return (revision, f"{revision}^{{}}")
+
+
+def resolve_ref(refs: dict[str, str], revision: Optional[str]) -> Optional[str]:
+    """
+    Return SHA Of The Commit Of ``revision`` In ``refs``, As Returned By :any:`ls_remote`.
+
+    ``None`` refers to ``HEAD``. Branches win over tags. Annotated tags are peeled.
+
+    >>> refs = {"HEAD": "a", "refs/heads/main": "a", "refs/tags/v1": "b", "refs/tags/v1^{}": "c"}
+    >>> resolve_ref(refs, "main"), resolve_ref(refs, "v1"), resolve_ref(refs, "refs/tags/v1"), resolve_ref(refs, None)
+    ('a', 'c', 'c', 'a')
+    >>> resolve_ref(refs, "unknown")
+    """
+    if revision is None:
+        return refs.get("HEAD")
+    for ref in (revision, f"refs/heads/{revision}", f"refs/tags/{revision}"):
+        sha = refs.get(f"{ref}^{{}}") or refs.get(ref)
+        if sha:
+            return sha
+    return None
+
+
+def get_branch_name(revision: Optional[str]) -> Optional[str]:
+    """
+    Return ``revision`` Without ``refs/heads/`` - As Needed To Check Out A Branch.
+
+    >>> get_branch_name("refs/heads/main")
+    'main'
+    >>> get_branch_name("refs/tags/v1.0")
+    'refs/tags/v1.0'
+    >>> get_branch_name(None)
+    """
+    prefix = "refs/heads/"
+    if revision and revision.startswith(prefix):
+        return revision[len(prefix) :]
+    return revision
+
+
+def is_sha(revision: str) -> bool:
+    """
+    Check If ``revision`` Is A Full SHA.
+
+    >>> is_sha("0123456789abcdef0123456789abcdef01234567")
+    True
+    >>> is_sha("main")
+    False
+    """
+    return bool(_RE_SHA.match(revision))
@@ -0,0 +1,168 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Group Index.
+
+Maps every group to a bitmap of the projects in it, to evaluate group filters on bitmaps instead of per project.
+"""
+
+import sys
+from collections.abc import Sequence
+from fnmatch import fnmatchcase
+
+from gitws import GroupFilters, Groups, GroupSelects, ProjectSpec
+from gitws.datamodel import group_selects_from_filters
+
+
+class GroupIndex:
+    """
+    Group Index.
+
+    Bit ``n`` of every bitmap refers to ``projects[n]``.
+    Group filters are evaluated with the same semantics as :any:`gitws._iters.create_filter`.
+    Their results are memorized.
+
+    Args:
+        projects: Projects.
+
+    Keyword Args:
+        default_groups: Groups of projects without any group (:any:`Defaults`).
+
+    >>> index = GroupIndex([
+    ...     ProjectSpec(name="a", groups=("pdk",)),
+    ...     ProjectSpec(name="b", groups=("device", "pdk")),
+    ...     ProjectSpec(name="c", groups=("device",)),
+    ...     ProjectSpec(name="d"),
+    ... ])
+    >>> index.select(("-device",))
+    (0, 1, 3)
+    >>> index.select(("-pdk", "-device"))
+    (3,)
+    >>> index.select(("-@d", "-@c"))
+    (0, 1)
+    """
+
+    def __init__(self, projects: Sequence[ProjectSpec], default_groups: Groups = ()):
+        self.count = len(projects)
+        self.paths = tuple(project.path or project.name for project in projects)
+        members: dict[str, list[int]] = {}
+        nogroups: list[int] = []
+        for idx, project in enumerate(projects):
+            groups = project.groups or default_groups
+            if groups:
+                for group in groups:
+                    members.setdefault(sys.intern(group), []).append(idx)
+            else:
+                nogroups.append(idx)
+        self.groups: dict[str, int] = {group: self._to_bitmap(idxs) for group, idxs in members.items()}
+        """Bitmap Of Projects Per Group."""
+        self.nogroups = self._to_bitmap(nogroups)
+        """Bitmap Of Projects Without Any Group."""
+        self._selections: dict[tuple[GroupFilters, bool], tuple[int, ...]] = {}
+        self._pathmasks: dict[str, int] = {}
+
+    def select(self, group_filters: GroupFilters, default: bool = True) -> tuple[int, ...]:
+        """
+        Return Indexes Of All Projects Selected By ``group_filters``.
+
+        Args:
+            group_filters: Group Filters.
+
+        Keyword Args:
+            default: Default selection of all groups.
+        """
+        key = (tuple(group_filters), default)
+        selection = self._selections.get(key)
+        if selection is None:
+            bitmap = self.get_bitmap(group_selects_from_filters(group_filters), default=default)
+            selection = tuple(idx for idx in range(self.count) if bitmap >> idx & 1)
+            self._selections[key] = selection
+        return selection
+
+    def get_bitmap(self, group_selects: GroupSelects, default: bool = True) -> int:
+        """
+        Return Bitmap Of All Projects Selected By ``group_selects``.
+
+        Args:
+            group_selects: Group Selects.
+
+        Keyword Args:
+            default: Default selection of all groups.
+        """
+        everyone = (1 << self.count) - 1
+        named = {group_select.group for group_select in group_selects if group_select.group}
+        groupless = tuple(group_select for group_select in group_selects if not group_select.group)
+        # projects without groups are just affected by selections without group
+        result = self._apply(self.nogroups, self.nogroups, groupless, everyone)
+        for group, members in self.groups.items():
+            if group in named:
+                selects = tuple(item for item in group_selects if item.group in (None, group))
+            elif groupless:
+                selects = groupless
+            else:
+                if default:
+                    result |= members
+                continue
+            result |= self._apply(members if default else 0, members, selects, everyone)
+        return result
+
+    def _apply(self, state: int, members: int, selects: GroupSelects, everyone: int) -> int:
+        for group_select in selects:
+            affected = members & self._get_pathmask(group_select.path) if group_select.path else members
+            if group_select.select:
+                state |= affected
+            else:
+                state &= everyone ^ affected
+        return state
+
+    def _get_pathmask(self, pattern: str) -> int:
+        pathmask = self._pathmasks.get(pattern)
+        if pathmask is None:
+            idxs = [idx for idx, path in enumerate(self.paths) if fnmatchcase(path, pattern)]
+            pathmask = self._pathmasks[pattern] = self._to_bitmap(idxs)
+        return pathmask
+
+    def _to_bitmap(self, idxs: Sequence[int]) -> int:
+        data = bytearray((self.count + 7) // 8)
+        for idx in idxs:
+            data[idx >> 3] |= 1 << (idx & 7)
+        return int.from_bytes(data, "little")
+
+
+def get_group_filters(groups: str) -> GroupFilters:
+    """
+    Convert ``repo init --groups`` Value To Group Filters.
+
+    ``all`` also selects the ``notdefault`` group, ``default`` is the default selection already.
+
+    >>> get_group_filters("pdk, -device")
+    ('+pdk', '-device')
+    >>> get_group_filters("all,-notdefault,default")
+    ('+notdefault', '-notdefault')
+    >>> get_group_filters("")
+    ()
+    """
+    group_filters = []
+    for item in groups.split(","):
+        group = item.strip()
+        if not group or group == "default":
+            continue
+        if group == "all":
+            group = "notdefault"
+        group_filters.append(group if group.startswith("-") else f"+{group}")
+    return tuple(group_filters)
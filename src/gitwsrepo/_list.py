@@ -0,0 +1,101 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Project Listing.
+
+Projects are selected via the indexes of the loaded manifest, without resolving them:
+the :any:`GroupIndex` for groups and the :any:`PathIndex` for paths and path prefixes.
+"""
+
+import re
+from collections.abc import Iterable
+from typing import Optional
+
+from gitws import GroupFilters, ProjectSpec
+
+from ._groupindex import get_group_filters
+from ._workspace import RepoWorkspace
+from .datamodel import RepoManifest
+
+
+def list_projects(
+    manifest: RepoManifest,
+    group_filters: GroupFilters = (),
+    paths: Iterable[str] = (),
+    path_prefix: Optional[str] = None,
+    regex: Optional[str] = None,
+) -> tuple[ProjectSpec, ...]:
+    """
+    Return The Selected Projects Of ``manifest`` In Manifest Order.
+
+    Args:
+        manifest: Manifest.
+
+    Keyword Args:
+        group_filters: Group Filters.
+        paths: Just the projects owning these paths. Relative to the workspace root directory.
+        path_prefix: Just the projects at or below this directory. Relative to the workspace root directory.
+        regex: Just the projects, whose name or path matches this regular expression.
+
+    Raises:
+        ValueError: A path is not owned by any project.
+
+    >>> from gitws import ManifestSpec
+    >>> manifest = RepoManifest(spec=ManifestSpec(dependencies=[
+    ...     {"name": "platform/build", "path": "build/make"},
+    ...     {"name": "platform/build/soong", "path": "build/soong", "groups": ["pdk"]},
+    ...     {"name": "platform/art", "path": "art"},
+    ... ]))
+    >>> [project.name for project in list_projects(manifest, path_prefix="build")]
+    ['platform/build', 'platform/build/soong']
+    >>> [project.name for project in list_projects(manifest, group_filters=("-pdk",), regex="build")]
+    ['platform/build']
+    >>> [project.name for project in list_projects(manifest, paths=("build/soong/Android.bp",))]
+    ['platform/build/soong']
+    """
+    dependencies = manifest.spec.dependencies
+    selection = manifest.group_index.select(group_filters)
+    index = manifest.path_index
+    if paths:
+        owners = set()
+        for path in paths:
+            owner = index.find(path)
+            if owner is None:
+                raise ValueError(f"No project at {path!r}")
+            owners.add(owner)
+        selection = tuple(idx for idx in selection if idx in owners)
+    if path_prefix is not None:
+        below = set(index.select_prefix(path_prefix))
+        selection = tuple(idx for idx in selection if idx in below)
+    projects = tuple(dependencies[idx] for idx in selection)
+    if regex is not None:
+        search = re.compile(regex).search
+        projects = tuple(project for project in projects if search(project.name) or search(project.path or ""))
+    return projects
+
+
+def get_list_group_filters(
+    workspace: RepoWorkspace, manifest: RepoManifest, groups: Optional[str] = None
+) -> GroupFilters:
+    """
+    Return Group Filters For Listing.
+
+    ``groups`` (i.e. ``all,-device``) replaces the group filters of the workspace.
+    """
+    group_filters = get_group_filters(groups) if groups is not None else tuple(workspace.group_filters)
+    return manifest.spec.group_filters + group_filters
@@ -0,0 +1,114 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Path Index.
+
+Sorted project paths, to find the project owning a path and all projects below a directory without a linear scan.
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Optional
+
+from gitws import ProjectSpec
+
+
+class PathIndex:
+    """
+    Path Index.
+
+    Args:
+        projects: Projects. Nested projects are expected with their full path, as flattened by the loader.
+
+    All paths are relative to the workspace root directory, with ``/`` as separator.
+    Indices refer to ``projects``.
+
+    >>> index = PathIndex([
+    ...     ProjectSpec(name="build", path="build/make"),
+    ...     ProjectSpec(name="blueprint", path="build/make/blueprint"),
+    ...     ProjectSpec(name="soong", path="build/soong"),
+    ...     ProjectSpec(name="build-tools", path="build-tools"),
+    ... ])
+    >>> index.find("build/make/core/main.mk")
+    0
+    >>> index.find("build/make/blueprint/README")
+    1
+    >>> index.find("build") is None
+    True
+    >>> index.select_prefix("build")
+    (0, 1, 2)
+    >>> index.select_prefix("build/make/")
+    (0, 1)
+    """
+
+    def __init__(self, projects: Sequence[ProjectSpec]):
+        paths = [_normpath(project.path or project.name) for project in projects]
+        order = sorted(range(len(paths)), key=paths.__getitem__)
+        self.paths: tuple[str, ...] = tuple(paths[idx] for idx in order)
+        """Sorted Project Paths."""
+        self.indices: tuple[int, ...] = tuple(order)
+        """Project Index For Every Sorted Path."""
+        self._by_path: dict[str, int] = {}
+        for idx, path in enumerate(paths):
+            self._by_path.setdefault(path, idx)
+
+    def find(self, path: str) -> Optional[int]:
+        """
+        Return Index Of The Project Owning ``path`` Or ``None``.
+
+        The owner is the innermost project containing ``path``.
+        Just the parent directories of ``path`` are looked up - independent of the number of projects.
+        """
+        path = _normpath(path)
+        while path:
+            idx = self._by_path.get(path)
+            if idx is not None:
+                return idx
+            path = path.rpartition("/")[0]
+        return None
+
+    def select_prefix(self, prefix: str) -> tuple[int, ...]:
+        """
+        Return Indices Of All Projects At Or Below Directory ``prefix``, In Project Order.
+
+        The range is determined by binary search.
+        """
+        prefix = _normpath(prefix)
+        if not prefix:
+            return tuple(range(len(self.paths)))
+        paths = self.paths
+        # ``prefix/...`` sorts between ``prefix/`` and ``prefix0``, as ``0`` follows ``/``
+        start = bisect_left(paths, f"{prefix}/")
+        end = bisect_left(paths, f"{prefix}0", start)
+        selected = list(self.indices[start:end])
+        idx = self._by_path.get(prefix)
+        if idx is not None:
+            selected.append(idx)
+        return tuple(sorted(selected))
+
+
+def _normpath(path: str) -> str:
+    """
+    Normalize ``path``.
+
+    >>> _normpath("./build//make/")
+    'build/make'
+    >>> _normpath(".")
+    ''
+    """
+    return "/".join(part for part in path.replace("\\", "/").split("/") if part not in ("", "."))
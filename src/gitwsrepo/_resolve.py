@@ -0,0 +1,124 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Remote Reference Resolution.
+
+Revisions are resolved with ``git ls-remote`` - once per repository, with all revisions needed by the sync.
+Repositories are grouped by their remote, to limit the number of concurrent connections per remote.
+"""
+
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Executor, Future
+from typing import Optional
+
+from gitws import ManifestSpec
+
+from ._git import GitError, get_ref_patterns, ls_remote, resolve_ref
+from ._timing import phase
+
+
+class RefResolver:
+    """
+    Remote Reference Resolver.
+
+    Args:
+        executor: Executor to run ``git ls-remote`` in. Its size limits the total number of processes.
+
+    Keyword Args:
+        jobs_per_remote: Maximum number of concurrent processes per remote. Unlimited by default.
+
+    Results are kept for the lifetime of the resolver, typically one sync.
+    """
+
+    def __init__(self, executor: Executor, jobs_per_remote: Optional[int] = None):
+        self.executor = executor
+        self.jobs_per_remote = jobs_per_remote
+        self._lock = threading.Lock()
+        self._limits: dict[str, threading.Semaphore] = {}
+        self._refs: dict[str, Future] = {}
+
+    def start(self, requests: Iterable[tuple[str, str, Optional[str]]]):
+        """
+        Start Resolving ``requests`` In The Background.
+
+        Args:
+            requests: Tuples of remote, repository URL and revision.
+        """
+        patterns: dict[str, tuple[str, dict[str, None]]] = {}
+        for remote, url, revision in requests:
+            with self._lock:
+                if url in self._refs:
+                    continue
+            patterns.setdefault(url, (remote, {}))[1].update(dict.fromkeys(get_ref_patterns(revision)))
+        with self._lock:
+            for url, (remote, urlpatterns) in patterns.items():
+                self._refs[url] = self.executor.submit(self._ls_remote, remote, url, tuple(urlpatterns))
+
+    def resolve(self, url: str, revision: Optional[str]) -> Optional[str]:
+        """
+        Return SHA Of ``revision`` In Repository At ``url`` Or ``None`` If Unknown Or Unreachable.
+
+        Repositories, which were not started before, are resolved now.
+        """
+        with self._lock:
+            future = self._refs.get(url)
+        if future is None:
+            self.start(((url, url, revision),))
+            with self._lock:
+                future = self._refs[url]
+        try:
+            refs = future.result()
+        except GitError:
+            return None
+        return resolve_ref(refs, revision)
+
+    def _ls_remote(self, remote: str, url: str, patterns: tuple[str, ...]) -> dict[str, str]:
+        if self.jobs_per_remote is None:
+            with phase("ls-remote", url):
+                return ls_remote(url, *patterns)
+        with self._lock:
+            limit = self._limits.setdefault(remote, threading.Semaphore(self.jobs_per_remote))
+        with limit, phase("ls-remote", url):
+            return ls_remote(url, *patterns)
+
+
+def get_remotes(spec: ManifestSpec) -> dict[str, str]:
+    """
+    Return Remote By Project Path Of All Projects Of ``spec``.
+
+    The remote is identified by its ``url_base``. Projects with a ``url`` are their own remote.
+
+    >>> spec = ManifestSpec(
+    ...     remotes=[{"name": "aosp", "url-base": "https://aosp.example.com"}],
+    ...     defaults={"remote": "aosp"},
+    ...     dependencies=[{"name": "build", "path": "build/make"}, {"name": "ext", "url": "https://ext.example.com"}],
+    ... )
+    >>> get_remotes(spec)
+    {'build/make': 'https://aosp.example.com', 'ext': 'https://ext.example.com'}
+    """
+    url_bases = {remote.name: remote.url_base for remote in spec.remotes}
+    remotes = {}
+    for project in spec.dependencies:
+        path = project.path or project.name
+        if project.url:
+            remotes[path] = project.url
+            continue
+        remote = project.remote or spec.defaults.remote or ""
+        remotes[path] = url_bases.get(remote) or remote
+    return remotes
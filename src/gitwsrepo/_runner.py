@@ -0,0 +1,342 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Asyncio Subprocess Runner.
+
+:any:`Runner` runs many commands, like ``git`` for thousands of projects, on one event loop in one thread:
+
+* A global limit and an optional per-remote limit bound the number of concurrent processes.
+* Results are yielded in command order. Commands are just started, while the number of started but not yet
+  consumed results stays within a window - a slow consumer slows down the runner.
+* Outputs are read in chunks and just the last ``limit`` bytes are kept.
+* On interruption (i.e. Ctrl-C) or if the consumer stops iterating, all running processes and their children
+  are terminated before the runner returns.
+"""
+
+import asyncio
+import collections
+import os
+import queue
+import signal
+import subprocess
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, Union
+
+from ._timing import phase
+
+OUTPUT_LIMIT = 16 * 1024 * 1024
+"""Default Maximum Number Of Bytes Kept Per Output Stream."""
+
+TERMINATE_TIMEOUT = 5.0
+"""Seconds To Wait For A Terminated Process Before It Is Killed."""
+
+_CHUNKSIZE = 64 * 1024
+
+
+class Command(NamedTuple):
+    """Command To Be Run."""
+
+    args: tuple[str, ...]
+    """Program And Arguments. With ``shell`` just one item: the shell command."""
+
+    cwd: Optional[Union[str, Path]] = None
+    """Working Directory."""
+
+    env: Optional[dict[str, str]] = None
+    """Environment. Inherited by default."""
+
+    remote: Optional[str] = None
+    """Remote, for the per-remote limit."""
+
+    shell: bool = False
+    """Run via the shell."""
+
+    merge: bool = False
+    """Capture standard error together with standard output."""
+
+    stdin: Optional[bytes] = None
+    """Data Written To Standard Input. No standard input by default."""
+
+
+class RunResult(NamedTuple):
+    """Result Of A Command."""
+
+    command: Command
+    """Command."""
+
+    returncode: int
+    """Exit Code. 127 if the command could not be started."""
+
+    stdout: bytes
+    """Standard Output (And Standard Error If Merged)."""
+
+    stderr: bytes
+    """Standard Error."""
+
+    truncated: bool = False
+    """Output exceeded the limit and just the last part was kept."""
+
+
+def git_command(*args: str, cwd: Optional[Path] = None, remote: Optional[str] = None) -> Command:
+    """
+    Return :any:`Command` For ``git`` With ``args``.
+
+    >>> git_command("fetch", "--quiet", remote="aosp")
+    Command(args=('git', 'fetch', '--quiet'), cwd=None, env=None, remote='aosp', shell=False, merge=False, stdin=None)
+    """
+    return Command(("git", *args), cwd=cwd, remote=remote)
+
+
+class Runner:
+    """
+    Asyncio Subprocess Runner.
+
+    Keyword Args:
+        jobs: Maximum number of concurrent processes.
+        jobs_per_remote: Maximum number of concurrent processes per remote. Unlimited by default.
+        limit: Maximum number of bytes kept per output stream. Unlimited with ``None``.
+        window: Maximum number of started, but not yet consumed results. Four times ``jobs`` by default.
+    """
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        jobs_per_remote: Optional[int] = None,
+        limit: Optional[int] = OUTPUT_LIMIT,
+        window: Optional[int] = None,
+    ):
+        self.jobs = jobs
+        self.jobs_per_remote = jobs_per_remote
+        self.limit = limit
+        self.window = max(window or 4 * jobs, jobs)
+
+    def iter_run(self, commands: Iterable[Command]) -> Iterator[RunResult]:
+        """
+        Run ``commands`` And Yield Their Results In Command Order.
+
+        Raises:
+            Exception: Any unexpected error of the runner itself. Failing commands are just reported by their result.
+        """
+        batch = _Batch(self, tuple(commands))
+        thread = threading.Thread(target=batch.run, name="runner")
+        thread.start()
+        try:
+            yield from batch.iter_results()
+        finally:
+            batch.cancel()
+            thread.join()
+
+    def run_all(self, commands: Iterable[Command]) -> list[RunResult]:
+        """Run ``commands`` And Return Their Results In Command Order."""
+        return list(self.iter_run(commands))
+
+
+class _Batch:
+    """One :any:`Runner.iter_run` Call - Bridge Between The Event Loop Thread And The Consumer."""
+
+    def __init__(self, runner: Runner, commands: tuple[Command, ...]):
+        self.runner = runner
+        self.commands = commands
+        self.results: queue.Queue[tuple[Optional[int], Any]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._cancelled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._window: Optional[asyncio.Semaphore] = None
+
+    def run(self):
+        """Run All Commands - Within The Event Loop Thread."""
+        try:
+            asyncio.run(self._main())
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            self.results.put((None, exc))
+        finally:
+            with self._lock:
+                self._loop = None
+            self._ready.set()
+
+    def iter_results(self) -> Iterator[RunResult]:
+        """Yield Results In Command Order - Within The Consumer Thread."""
+        pending: dict[int, RunResult] = {}
+        for idx in range(len(self.commands)):
+            while idx not in pending:
+                item_idx, item = self.results.get()
+                if item_idx is None:
+                    raise item
+                pending[item_idx] = item
+            yield pending.pop(idx)
+            self._call(self._release)
+
+    def cancel(self):
+        """Terminate All Running Commands."""
+        with self._lock:
+            self._cancelled = True
+        self._ready.wait()
+        self._call(self._cancel)
+
+    def _call(self, func):
+        with self._lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(func)
+
+    def _release(self):
+        if self._window is not None:
+            self._window.release()
+
+    def _cancel(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _main(self) -> None:
+        runner = self.runner
+        jobs = asyncio.Semaphore(runner.jobs)
+        remotes: dict[str, asyncio.Semaphore] = {}
+        window = self._window = asyncio.Semaphore(runner.window)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.current_task()
+            cancelled = self._cancelled
+        self._ready.set()
+        if cancelled:
+            return
+
+        async def run(idx: int, command: Command) -> None:
+            limit = None
+            if command.remote is not None and runner.jobs_per_remote is not None:
+                limit = remotes.setdefault(command.remote, asyncio.Semaphore(runner.jobs_per_remote))
+            if limit is None:
+                async with jobs:
+                    result = await _run(command, runner.limit)
+            else:
+                async with limit, jobs:
+                    result = await _run(command, runner.limit)
+            self.results.put((idx, result))
+
+        tasks = []
+        try:
+            for idx, command in enumerate(self.commands):
+                await window.acquire()
+                tasks.append(asyncio.ensure_future(run(idx, command)))
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _run(command: Command, limit: Optional[int]) -> RunResult:
+    kwargs: dict[str, Any] = {
+        "cwd": command.cwd,
+        "env": command.env,
+        "stdin": subprocess.DEVNULL if command.stdin is None else subprocess.PIPE,
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.STDOUT if command.merge else subprocess.PIPE,
+    }
+    if os.name == "posix":
+        # own process group, to terminate all children
+        kwargs["start_new_session"] = True
+    detail = str(command.cwd or "")
+    with phase("process", detail):
+        try:
+            if command.shell:
+                proc = await asyncio.create_subprocess_shell(command.args[0], **kwargs)
+            else:
+                proc = await asyncio.create_subprocess_exec(*command.args, **kwargs)
+        except OSError as exc:
+            return RunResult(command, 127, b"", str(exc).encode("utf-8"))
+        try:
+            readers = [_read(proc.stdout, limit)]
+            if not command.merge:
+                readers.append(_read(proc.stderr, limit))
+            if command.stdin is not None:
+                # written concurrently to reading, as the process may block on full output pipes
+                outputs = (await asyncio.gather(*readers, _write(proc.stdin, command.stdin)))[:-1]
+            else:
+                outputs = await asyncio.gather(*readers)
+            returncode = await proc.wait()
+        except asyncio.CancelledError:
+            await _terminate(proc)
+            raise
+    stdout, truncated = outputs[0]
+    stderr, stderr_truncated = outputs[1] if len(outputs) > 1 else (b"", False)
+    return RunResult(command, returncode, stdout, stderr, truncated or stderr_truncated)
+
+
+async def _write(stream: Optional[asyncio.StreamWriter], data: bytes) -> None:
+    """Write ``data`` To ``stream`` And Close It. A process not reading its input is no error."""
+    assert stream is not None
+    try:
+        stream.write(data)
+        await stream.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        pass
+    finally:
+        stream.close()
+
+
+async def _read(stream: Optional[asyncio.StreamReader], limit: Optional[int]) -> tuple[bytes, bool]:
+    """Read ``stream`` Until EOF And Return The Last ``limit`` Bytes And Whether Anything Was Dropped."""
+    assert stream is not None
+    chunks: collections.deque[bytes] = collections.deque()
+    size = 0
+    truncated = False
+    while True:
+        chunk = await stream.read(_CHUNKSIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+        while limit is not None and size > limit:
+            truncated = True
+            excess = size - limit
+            first = chunks[0]
+            if len(first) <= excess:
+                chunks.popleft()
+                size -= len(first)
+            else:
+                chunks[0] = first[excess:]
+                size -= excess
+    return b"".join(chunks), truncated
+
+
+async def _terminate(proc: asyncio.subprocess.Process):
+    if proc.returncode is not None:
+        return
+    _signal(proc, kill=False)
+    try:
+        await asyncio.wait_for(proc.wait(), TERMINATE_TIMEOUT)
+    except asyncio.TimeoutError:
+        _signal(proc, kill=True)
+        await proc.wait()
+
+
+def _signal(proc: asyncio.subprocess.Process, kill: bool):
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        elif kill:  # pragma: no cover
+            proc.kill()
+        else:  # pragma: no cover
+            proc.terminate()
+    except ProcessLookupError:  # pragma: no cover
+        pass
@@ -0,0 +1,143 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Workspace Status.
+
+The status of all projects is determined in parallel - one ``git status`` per cloned project.
+Projects, which are not cloned, do not need any ``git`` process.
+
+A clean status is always confirmed by ``git``: file modification times cannot prove a clean work tree,
+as any command rewriting the index (i.e. ``git add`` or ``git checkout``) hides earlier changes.
+"""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from gitws import Project
+
+from ._git import git, is_cloned
+from ._timing import phase
+from ._workspace import RepoWorkspace
+
+
+class ProjectStatus(NamedTuple):
+    """
+    Status Of One Project.
+
+    Changes are formatted like ``git status --short``.
+    """
+
+    path: str
+    """Project Path."""
+
+    cloned: bool = True
+    """Project is cloned."""
+
+    branch: Optional[str] = None
+    """Checked out branch. ``None`` if detached."""
+
+    ahead: int = 0
+    """Number of commits not on the upstream."""
+
+    behind: int = 0
+    """Number of upstream commits not checked out."""
+
+    changes: tuple[str, ...] = ()
+    """Modified, staged and untracked files."""
+
+    @property
+    def is_clean(self) -> bool:
+        """
+        Project Is Cloned Without Any Changes And In Sync With Its Upstream.
+
+        >>> ProjectStatus("dep").is_clean
+        True
+        >>> ProjectStatus("dep", changes=(" M data.txt",)).is_clean
+        False
+        """
+        return self.cloned and not self.ahead and not self.behind and not self.changes
+
+
+def iter_status(workspace: RepoWorkspace, projects: tuple[Project, ...], jobs: int = 1) -> Iterator[ProjectStatus]:
+    """
+    Yield :any:`ProjectStatus` Of All ``projects`` - In Order.
+
+    Args:
+        workspace: Workspace.
+        projects: Projects.
+
+    Keyword Args:
+        jobs: Number of parallel ``git`` processes.
+
+    Raises:
+        ValueError: For mirror workspaces, as they do not have any work tree.
+    """
+    if workspace.config.mirror:
+        raise ValueError("A mirror workspace does not have any status")
+    path = workspace.path
+    with phase("status"), ThreadPoolExecutor(jobs, thread_name_prefix="status") as executor:
+        yield from executor.map(get_status, (path / project.path for project in projects), projects)
+
+
+def get_status(path: Path, project: Project) -> ProjectStatus:
+    """Return :any:`ProjectStatus` Of ``project`` Cloned At ``path``."""
+    if not is_cloned(path):
+        return ProjectStatus(project.path, cloned=False)
+    with phase("git-status", project.path):
+        output = git("status", "--porcelain=v2", "--branch", cwd=path)
+    return parse_status(project.path, output.splitlines())
+
+
+def parse_status(path: str, lines: Iterable[str]) -> ProjectStatus:
+    """
+    Parse ``git status --porcelain=v2 --branch`` Output ``lines`` Of Project At ``path``.
+
+    >>> status = parse_status("dep", [
+    ...     "# branch.head main",
+    ...     "# branch.ab +1 -2",
+    ...     "1 .M N... 100644 100644 100644 0123 0123 data.txt",
+    ...     "? untracked.txt",
+    ... ])
+    >>> status.branch, status.ahead, status.behind, status.changes
+    ('main', 1, 2, (' M data.txt', '?? untracked.txt'))
+    """
+    branch: Optional[str] = None
+    ahead = behind = 0
+    changes = []
+    for line in lines:
+        kind = line[:1]
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head ") :]
+            branch = None if head == "(detached)" else head
+        elif line.startswith("# branch.ab "):
+            ahead_, behind_ = line[len("# branch.ab ") :].split()
+            ahead, behind = int(ahead_), -int(behind_)
+        elif kind in _FIELDS:
+            fields = line.split(" ", _FIELDS[kind])
+            # renames end with a tab and the original path
+            filepath = fields[-1].split("\t")[0]
+            changes.append(f"{fields[1].replace('.', ' ')} {filepath}")
+        elif kind == "?":
+            changes.append(f"?? {line[2:]}")
+    return ProjectStatus(path, branch=branch, ahead=ahead, behind=behind, changes=tuple(changes))
+
+
+_FIELDS = {"1": 8, "2": 9, "u": 10}
+"""Number Of Fields Before The Path Per Entry Type."""
@@ -0,0 +1,406 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Parallel Sync Engine.
+
+Network bound operations (clone, fetch) and local operations (checkout, merge) run on separate worker pools.
+A project moves on to the checkout stage as soon as its fetch is done.
+
+The state of every synchronized project is recorded in the :any:`SyncState`.
+Projects, whose manifest attributes, checked out commit and remote revision did not change since, are skipped.
+Links and copies (``<linkfile>``, ``<copyfile>``) are applied in one pass at the end, see :any:`apply_filerefs`.
+The remote revisions are resolved upfront by the :any:`RefResolver` - one ``git ls-remote`` per repository.
+
+A smart sync checks the object presence of all clones upfront - one ``git cat-file --batch-check`` per clone,
+run concurrently by the :any:`Runner`. Projects, whose revision is already available, skip the fetch.
+"""
+
+import os
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from pathlib import Path
+from typing import Optional
+
+from gitws import Project
+from gitws._util import LOGGER, no_echo
+from gitws.const import COLOR_ACTION
+
+from ._filerefs import apply_filerefs
+from ._git import GitError, get_branch_name, get_head, git, is_cloned, is_sha
+from ._resolve import RefResolver, get_remotes
+from ._runner import Runner, git_command
+from ._timing import phase
+from ._workspace import RepoWorkspace, get_mirror_path
+from .datamodel import ProjectState, RepoManifest, SyncState
+
+_CHECK = "check"
+_FETCH = "fetch"
+_CHECKOUT = "checkout"
+
+
+def get_jobs(
+    manifest: RepoManifest,
+    jobs: Optional[int] = None,
+    jobs_network: Optional[int] = None,
+    jobs_checkout: Optional[int] = None,
+) -> tuple[int, int]:
+    """
+    Determine Number Of Network And Checkout Jobs.
+
+    ``jobs`` defaults to the manifest ``sync-j`` setting or 1.
+    Network jobs default to ``jobs``. Checkout jobs default to ``jobs``, but not more than the number of CPUs.
+
+    >>> get_jobs(RepoManifest())
+    (1, 1)
+    >>> get_jobs(RepoManifest(sync_j=4))[0]
+    4
+    >>> get_jobs(RepoManifest(sync_j=4), jobs=2, jobs_checkout=1)
+    (2, 1)
+    """
+    jobs = jobs or manifest.sync_j or 1
+    return jobs_network or jobs, jobs_checkout or min(jobs, os.cpu_count() or 1)
+
+
+class Sync:
+    """
+    Parallel Sync Engine.
+
+    Args:
+        workspace: Workspace.
+        manifest: Loaded Manifest.
+        projects: Projects To Be Synchronized.
+
+    Keyword Args:
+        jobs_network: Number Of Parallel Clone/Fetch Operations.
+        jobs_checkout: Number Of Parallel Checkout Operations.
+        secho: :any:`click.secho` like print method for verbose output.
+        progress: Called with the number of done projects, all projects and failed projects on every change.
+        force: Fetch and check out all projects, even if they did not change since the last sync.
+        jobs_per_remote: Maximum number of concurrent ``git ls-remote`` per remote. Unlimited by default.
+        smart: Skip the fetch of projects, whose revision is a SHA already available in the clone.
+        local_only: Never access the network. Branches and tags are taken from the clone, as fetched before.
+            Projects, whose revision is not available in the clone, fail.
+
+    Failing projects do not stop the others. Every failure is reported via ``logging.error``.
+
+    New clones are shallow, if the project, the manifest defaults or the workspace configuration specify a depth
+    (in this order). The partial clone filter of the workspace configuration is applied to new clones.
+    New clones borrow objects from the reference mirror workspace - if configured and available.
+
+    A mirror workspace just maintains bare repositories, named by the project name. There is no checkout stage.
+    """
+
+    def __init__(
+        self,
+        workspace: RepoWorkspace,
+        manifest: RepoManifest,
+        projects: tuple[Project, ...],
+        *,
+        jobs_network: int = 1,
+        jobs_checkout: int = 1,
+        secho=None,
+        progress: Optional[Callable[[int, int, int], None]] = None,
+        force: bool = False,
+        jobs_per_remote: Optional[int] = None,
+        smart: bool = False,
+        local_only: bool = False,
+    ):
+        self.path = workspace.path
+        self.config = workspace.config
+        self.manifest = manifest
+        self.projects = projects
+        self.jobs_network = jobs_network
+        self.jobs_checkout = jobs_checkout
+        self.secho = secho or no_echo
+        self.progress = progress
+        self.force = force
+        self.jobs_per_remote = jobs_per_remote
+        self.smart = smart
+        self.local_only = local_only
+        self.local: dict[str, str] = {}
+        """Locally Available Revision SHA Per Project Path."""
+        self.state = SyncState.load(self.path)
+
+    def run(self) -> int:
+        """Synchronize All Projects And Return The Number Of Failed Ones."""
+        failed = finished = 0
+        total = len(self.projects)
+        self._report(finished, total, failed)
+        fetch_pool = ThreadPoolExecutor(self.jobs_network, thread_name_prefix="fetch")
+        checkout_pool = ThreadPoolExecutor(self.jobs_checkout, thread_name_prefix="checkout")
+        resolve_pool = ThreadPoolExecutor(self.jobs_network, thread_name_prefix="resolve")
+        resolver = RefResolver(resolve_pool, jobs_per_remote=self.jobs_per_remote)
+        first = _FETCH if (self.force and not self.local_only) or self.config.mirror else _CHECK
+        funcs = {_CHECK: partial(self._check, resolver=resolver), _FETCH: self._fetch, _CHECKOUT: self._checkout}
+        with phase("sync"), resolve_pool, fetch_pool, checkout_pool:
+            if first == _CHECK:
+                self._prepare(resolver)
+            pending: dict[Future, tuple[str, Project]] = {
+                fetch_pool.submit(self._run_stage, first, funcs[first], project): (first, project)
+                for project in self.projects
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, project = pending.pop(future)
+                    try:
+                        message = future.result()
+                    except Exception as exc:
+                        LOGGER.error("%s: %s", project.path, exc)
+                        self.state.projects.pop(project.path, None)
+                        failed += 1
+                        finished += 1
+                        self._report(finished, total, failed)
+                        continue
+                    if stage == _CHECK and message is None:
+                        # locally available revisions go straight to the checkout
+                        stage = _CHECKOUT if project.path in self.local else _FETCH
+                        pool = checkout_pool if stage == _CHECKOUT else fetch_pool
+                        pending[pool.submit(self._run_stage, stage, funcs[stage], project)] = (stage, project)
+                        continue
+                    self.secho(f"{project.path}: {message}", fg=COLOR_ACTION)
+                    if stage == _FETCH and not self.config.mirror:
+                        checkout = checkout_pool.submit(self._run_stage, _CHECKOUT, self._checkout, project)
+                        pending[checkout] = (_CHECKOUT, project)
+                    else:
+                        if stage == _CHECKOUT:
+                            self._record(project)
+                        finished += 1
+                        self._report(finished, total, failed)
+            if not self.config.mirror:
+                with phase("filerefs"):
+                    apply_filerefs(self.path, self.projects, self.state.filerefs, secho=self.secho)
+        if not self.config.mirror:
+            self.state.save(self.path)
+        return failed
+
+    def _report(self, done: int, total: int, failed: int):
+        if self.progress:
+            self.progress(done, total, failed)
+
+    @staticmethod
+    def _run_stage(stage: str, func, project: Project) -> str:
+        with phase(stage, project.path):
+            return func(project)
+
+    def _get_depth(self, project: Project) -> Optional[int]:
+        return self.manifest.get_clone_depth(project.path) or self.config.depth
+
+    def _get_state(self, project: Project, sha: str) -> ProjectState:
+        return ProjectState(url=str(project.url), revision=project.revision, depth=self._get_depth(project), sha=sha)
+
+    def _prepare(self, resolver: RefResolver):
+        """Determine Local And Remote Revisions Before The Check."""
+        if self.smart or self.local_only:
+            self._probe()
+        self._resolve(resolver)
+
+    def _probe(self):
+        """Determine The Locally Available Revisions - One ``git cat-file`` Per Clone, All Concurrently."""
+        projects = [
+            project
+            for project in self.projects
+            if (self.local_only or (project.revision and is_sha(project.revision)))
+            and is_cloned(self.path / project.path)
+        ]
+        commands = [
+            git_command("cat-file", "--batch-check=%(objectname)", cwd=self.path / project.path)._replace(
+                stdin="".join(f"{name}^{{commit}}\n" for name in get_local_names(project.revision)).encode()
+            )
+            for project in projects
+        ]
+        with phase("probe"):
+            for project, result in zip(projects, Runner(jobs=self.jobs_checkout).iter_run(commands)):
+                if result.returncode:
+                    continue
+                for line in result.stdout.decode("utf-8", errors="replace").splitlines():
+                    if is_sha(line):
+                        self.local[project.path] = line
+                        break
+
+    def _resolve(self, resolver: RefResolver):
+        """Start Resolving The Remote Revisions Of All Previously Synchronized Projects."""
+        if self.local_only:
+            return
+        remotes = get_remotes(self.manifest.spec)
+        resolver.start(
+            (remotes.get(project.path, ""), str(project.url), project.revision)
+            for project in self.projects
+            if project.path in self.state.projects and not (project.revision and is_sha(project.revision))
+        )
+
+    def _check(self, project: Project, resolver: RefResolver) -> Optional[str]:
+        """Return Message, If ``project`` Did Not Change Since The Last Sync, Otherwise ``None``."""
+        state = self.state.projects.get(project.path)
+        if state is None or state != self._get_state(project, state.sha):
+            return None
+        if get_head(self.path / project.path) != state.sha:
+            return None
+        revision = project.revision
+        if revision and is_sha(revision):
+            sha: Optional[str] = revision
+        elif self.local_only:
+            sha = self.local.get(project.path)
+        else:
+            sha = resolver.resolve(str(project.url), revision)
+        if sha != state.sha:
+            return None
+        return "Up to date."
+
+    def _record(self, project: Project):
+        sha = get_head(self.path / project.path)
+        if sha is None:
+            self.state.projects.pop(project.path, None)
+        else:
+            self.state.projects[project.path] = self._get_state(project, sha)
+
+    def _fetch(self, project: Project) -> str:
+        if self.local_only:
+            raise ValueError(f"Revision {project.revision or 'HEAD'!r} is not available locally")
+        if self.config.mirror:
+            return self._fetch_mirror(project)
+        path = self.path / project.path
+        depth = self._get_depth(project)
+        revision = project.revision
+        if not is_cloned(path):
+            return self._clone(project, path, depth, revision)
+        if depth and revision and not is_sha(revision):
+            # a shallow clone just tracks the branch it was cloned with, which might not be the revision anymore
+            _fetch_revision(path, depth, revision)
+            return "Fetched."
+        args = ["fetch", "--quiet", "--prune"]
+        if depth:
+            args.append(f"--depth={depth}")
+        git(*args, "origin", cwd=path)
+        if depth and revision and is_sha(revision):
+            git("fetch", "--quiet", f"--depth={depth}", "origin", revision, cwd=path)
+        return "Fetched."
+
+    def _clone(self, project: Project, path: Path, depth: Optional[int], revision: Optional[str]) -> str:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        args = ["clone", "--quiet", "--no-checkout"]
+        branch = _get_clone_branch(revision)
+        if depth:
+            args.append(f"--depth={depth}")
+            if branch:
+                args.extend(("--branch", branch))
+        if self.config.clone_filter:
+            args.append(f"--filter={self.config.clone_filter}")
+        if self.config.reference:
+            reference = get_mirror_path(Path(self.config.reference), project.name)
+            args.append(f"--reference-if-able={reference}")
+        git(*args, "--", str(project.url), str(path))
+        if depth and revision and is_sha(revision):
+            # a shallow clone just contains the default branch
+            git("fetch", "--quiet", f"--depth={depth}", "origin", revision, cwd=path)
+        elif depth and revision and not branch:
+            _fetch_revision(path, depth, revision)
+        return f"Cloned {project.url!r}."
+
+    def _fetch_mirror(self, project: Project) -> str:
+        path = get_mirror_path(self.path, project.name)
+        if path.exists():
+            git("fetch", "--quiet", "--prune", "origin", cwd=path)
+            return "Fetched."
+        path.parent.mkdir(parents=True, exist_ok=True)
+        git("clone", "--quiet", "--mirror", "--", str(project.url), str(path))
+        return f"Mirrored {project.url!r}."
+
+    def _checkout(self, project: Project) -> str:
+        path = self.path / project.path
+        # ``git checkout refs/heads/BRANCH`` would detach - ``git checkout BRANCH`` tracks ``origin/BRANCH``
+        revision = get_branch_name(project.revision) or git("symbolic-ref", "--quiet", "--short", "HEAD", cwd=path)
+        git("checkout", "--quiet", revision, cwd=path)
+        branch = git("branch", "--show-current", cwd=path)
+        if branch and git("for-each-ref", "--format=%(upstream:short)", f"refs/heads/{branch}", cwd=path):
+            git("merge", "--quiet", "--ff-only", "@{upstream}", cwd=path)
+        return f"Checked out {revision!r}."
+
+
+def _get_clone_branch(revision: Optional[str]) -> Optional[str]:
+    """
+    Return Branch Or Tag Name For ``git clone --branch`` Or ``None`` If ``revision`` Cannot Be Cloned Directly.
+
+    >>> _get_clone_branch("refs/heads/dev"), _get_clone_branch("refs/tags/v1.0"), _get_clone_branch("main")
+    ('dev', 'v1.0', 'main')
+    >>> _get_clone_branch("refs/changes/01/1/1")
+    >>> _get_clone_branch("0123456789abcdef0123456789abcdef01234567")
+    """
+    if not revision or is_sha(revision):
+        return None
+    name = get_branch_name(revision) or ""
+    if name.startswith("refs/tags/"):
+        name = name[len("refs/tags/") :]
+    return None if name.startswith("refs/") else name
+
+
+def _fetch_revision(path: Path, depth: int, revision: str):
+    """
+    Fetch Just ``revision`` With ``depth`` Into The Clone At ``path``.
+
+    Branches are fetched to their remote tracking branch and added to the fetch refspec,
+    as ``git checkout`` just creates tracking branches for remote branches covered by it.
+    Tags and other references are fetched to the same name.
+    """
+    name = get_branch_name(revision) or ""
+    fetch = ("fetch", "--quiet", f"--depth={depth}", "origin")
+    if name.startswith("refs/"):
+        git(*fetch, f"+{name}:{name}", cwd=path)
+        return
+    refspec = f"+refs/heads/{name}:refs/remotes/origin/{name}"
+    try:
+        git(*fetch, refspec, cwd=path)
+    except GitError:
+        if name != revision:
+            # explicitly a branch
+            raise
+        git(*fetch, f"+refs/tags/{name}:refs/tags/{name}", cwd=path)
+        return
+    try:
+        refspecs = git("config", "--get-all", "remote.origin.fetch", cwd=path).splitlines()
+    except GitError:
+        refspecs = []
+    if refspec not in refspecs and "+refs/heads/*:refs/remotes/origin/*" not in refspecs:
+        git("remote", "set-branches", "--add", "origin", name, cwd=path)
+
+
+def get_local_names(revision: Optional[str]) -> tuple[str, ...]:
+    """
+    Return Names To Look Up ``revision`` In A Clone, In Order Of Precedence.
+
+    Branches are taken from the remote tracking branches, as the checkout merges them.
+
+    >>> get_local_names("0123456789abcdef0123456789abcdef01234567")
+    ('0123456789abcdef0123456789abcdef01234567',)
+    >>> get_local_names("main")
+    ('refs/remotes/origin/main', 'main')
+    >>> get_local_names("refs/heads/main")
+    ('refs/remotes/origin/main', 'main')
+    >>> get_local_names("refs/tags/v1.0")
+    ('refs/tags/v1.0',)
+    >>> get_local_names(None)
+    ('refs/remotes/origin/HEAD', 'HEAD')
+    """
+    if revision and is_sha(revision):
+        return (revision,)
+    name = get_branch_name(revision)
+    if not name:
+        return ("refs/remotes/origin/HEAD", "HEAD")
+    if name.startswith("refs/"):
+        return (name,)
+    return (f"refs/remotes/origin/{name}", name)
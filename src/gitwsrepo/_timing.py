@@ -0,0 +1,112 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Phase Timing.
+
+Phases like manifest parsing or a project fetch are measured via :any:`phase`.
+Their duration is logged at debug level (``-vv``) and recorded as trace event, if a :any:`Tracer` is active.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional
+
+from gitws._util import LOGGER
+
+_TRACER: Optional["Tracer"] = None
+
+
+class Tracer:
+    """
+    Trace Event Recorder.
+
+    Phases are recorded in the Chrome Trace Event Format, which can be opened offline by
+    ``chrome://tracing`` or https://ui.perfetto.dev.
+    """
+
+    def __init__(self):
+        self.events: list[dict[str, Any]] = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, name: str, detail: str, start: float, duration: float):
+        """Add Phase ``name`` Started At ``start`` (:any:`time.perf_counter`) Lasting ``duration`` Seconds."""
+        event = {
+            "name": f"{name} {detail}" if detail else name,
+            "cat": name,
+            "ph": "X",
+            "ts": round((start - self._start) * 1e6),
+            "dur": round(duration * 1e6),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def save(self, path: Path):
+        """Save Trace Events At ``path``."""
+        data = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    def start(self):
+        """Record All Phases From Now On."""
+        global _TRACER  # noqa: PLW0603
+        _TRACER = self
+
+    def stop(self):
+        """Stop Recording."""
+        global _TRACER  # noqa: PLW0603
+        if _TRACER is self:
+            _TRACER = None
+
+
+@contextmanager
+def phase(name: str, detail: str = "") -> Iterator[None]:
+    """
+    Measure Phase ``name``.
+
+    The duration is logged at debug level with ``phase``, ``detail`` and ``duration`` as extra record attributes.
+
+    Args:
+        name: Phase Name.
+
+    Keyword Args:
+        detail: Phase Detail, like a file or project path.
+    """
+    tracer = _TRACER
+    if tracer is None and not LOGGER.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        extra = {"phase": name, "detail": detail, "duration": duration}
+        if detail:
+            LOGGER.debug("%s %r: %.1f ms", name, detail, duration * 1e3, extra=extra)
+        else:
+            LOGGER.debug("%s: %.1f ms", name, duration * 1e3, extra=extra)
+        if tracer is not None:
+            tracer.add(name, detail, start, duration)
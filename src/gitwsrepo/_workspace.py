@@ -0,0 +1,185 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Repo Workspace.
+
+A repo workspace is a git-ws workspace whose manifest is a repo manifest.
+The manifest repository is cloned to ``.repo/manifests`` and becomes the main project.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from gitws import Git, GitWS, GroupFilters, InitializedError, Manifest, Project, Workspace
+from gitws._util import no_echo
+from gitws.const import COLOR_ACTION, COLOR_BANNER
+
+from ._git import get_head
+from .const import MANIFEST_NAME_DEFAULT, MANIFESTS_PATH
+from .datamodel import RepoConfig, RepoManifest
+from .repomanifestformat import RepoManifestFormat
+
+
+class RepoWorkspace:
+    """
+    Repo Workspace.
+
+    Args:
+        workspace: git-ws Workspace.
+        manifest_path: Manifest File Path.
+
+    Keyword Args:
+        group_filters: Group Filters.
+        config: Repo Workspace Configuration.
+    """
+
+    def __init__(
+        self,
+        workspace: Workspace,
+        manifest_path: Path,
+        group_filters: GroupFilters = (),
+        config: Optional[RepoConfig] = None,
+    ):
+        self.workspace = workspace
+        self.manifest_path = manifest_path
+        self.group_filters = group_filters
+        self.config = config or RepoConfig()
+
+    @staticmethod
+    def from_path(path: Optional[Path] = None, group_filters: Optional[GroupFilters] = None) -> "RepoWorkspace":
+        """
+        Create :any:`RepoWorkspace` for EXISTING workspace at ``path``.
+
+        Keyword Args:
+            path: Path within the workspace (Default is the current working directory).
+            group_filters: Group Filters. Default is taken from Configuration.
+
+        Raises:
+            UninitializedError: If ``path`` is not within a workspace.
+        """
+        workspace = Workspace.from_path(path=path)
+        manifest_path = workspace.get_manifest_path()
+        group_filters = workspace.get_group_filters(group_filters=group_filters)
+        config = RepoConfig.load(workspace.path)
+        return RepoWorkspace(workspace, manifest_path, group_filters=group_filters, config=config)
+
+    @staticmethod
+    def init(
+        url: str,
+        *,
+        path: Optional[Path] = None,
+        revision: Optional[str] = None,
+        manifest_name: str = MANIFEST_NAME_DEFAULT,
+        group_filters: Optional[GroupFilters] = None,
+        config: Optional[RepoConfig] = None,
+        secho=None,
+    ) -> "RepoWorkspace":
+        """
+        Initialize NEW Workspace at ``path`` and return corresponding :any:`RepoWorkspace`.
+
+        The manifest repository ``url`` is cloned to :any:`MANIFESTS_PATH`.
+
+        Args:
+            url: Manifest Repository URL.
+
+        Keyword Args:
+            path: Workspace Root Directory. Current working directory by default.
+            revision: Manifest Repository Revision.
+            manifest_name: Manifest File Name Within The Manifest Repository.
+            group_filters: Group Filters. Stored in the workspace configuration.
+            config: Repo Workspace Configuration.
+            secho: :any:`click.secho` like print method for verbose output.
+
+        Raises:
+            InitializedError: ``path`` already contains workspace.
+        """
+        secho = secho or no_echo
+        path = (path or Path.cwd()).resolve()
+        info = Workspace.is_init(path)
+        if info:
+            raise InitializedError(path, info.main_path)
+        main_path = path / MANIFESTS_PATH
+        secho(f"===== {MANIFESTS_PATH} (MAIN 'manifests') =====", fg=COLOR_BANNER)
+        secho(f"Cloning {url!r}.", fg=COLOR_ACTION)
+        main_path.parent.mkdir(parents=True, exist_ok=True)
+        Git(main_path, secho=secho).clone(url, revision=revision)
+        gws = GitWS.create(
+            path, main_path=main_path, manifest_path=Path(manifest_name), group_filters=group_filters, secho=secho
+        )
+        config = config or RepoConfig()
+        config.save(path)
+        return RepoWorkspace(gws.workspace, gws.manifest_path, group_filters=gws.group_filters, config=config)
+
+    @property
+    def path(self) -> Path:
+        """Workspace Root Directory."""
+        return self.workspace.path
+
+    def load(self, jobs: int = 1) -> RepoManifest:
+        """
+        Load Manifest In Compact Mode.
+
+        Keyword Args:
+            jobs: Number of processes to convert included manifests in parallel.
+        """
+        return RepoManifestFormat(compact=True, jobs=jobs).load_repo_manifest(self.manifest_path)
+
+    def get_projects(self, manifest: RepoManifest) -> tuple[Project, ...]:
+        """
+        Return Resolved And Group-Filtered Projects Of ``manifest``.
+
+        Relative URLs are resolved against the URL of the main project.
+        Just the selected projects are resolved.
+        """
+        spec = manifest.spec
+        selection = manifest.group_index.select(spec.group_filters + tuple(self.group_filters))
+        if len(selection) < len(spec.dependencies):
+            dependencies = tuple(spec.dependencies[idx] for idx in selection)
+            spec = spec.model_copy(update={"dependencies": dependencies})
+        main_path = self.workspace.main_path
+        refurl = Git(main_path).get_url() if main_path else None
+        resolved = Manifest.from_spec(spec, path=str(self.manifest_path), refurl=refurl, resolve_url=True)
+        return resolved.dependencies
+
+    def pin(self, manifest: RepoManifest) -> RepoManifest:
+        """
+        Return ``manifest`` With All Project Revisions Pinned To The Checked Out Commits.
+
+        Projects which are not cloned keep their revision.
+        """
+        dependencies = []
+        for project in manifest.spec.dependencies:
+            if self.config.mirror:
+                path = get_mirror_path(self.path, project.name)
+            else:
+                path = self.path / (project.path or project.name)
+            sha = get_head(path)
+            if sha is not None:
+                project = project.model_copy(update={"revision": sha})  # noqa: PLW2901
+            dependencies.append(project)
+        spec = manifest.spec.model_copy(update={"dependencies": tuple(dependencies)})
+        return manifest.model_copy(update={"spec": spec})
+
+
+def get_mirror_path(path: Path, name: str) -> Path:
+    """
+    Return Path Of Bare Repository For Project ``name`` In Mirror Workspace At ``path``.
+
+    >>> get_mirror_path(Path('mirror'), 'platform/build').as_posix()
+    'mirror/platform/build.git'
+    """
+    return path / f"{name}.git"
@@ -0,0 +1,31 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Constants."""
+
+from pathlib import Path
+
+REPO_PATH = Path(".repo")
+"""Repo Directory. Relative to the workspace root directory."""
+
+MANIFESTS_PATH = REPO_PATH / "manifests"
+"""Manifest Repository Clone. Relative to the workspace root directory."""
+
+LOCAL_MANIFESTS_PATH = REPO_PATH / "local_manifests"
+"""Local Manifests, merged after the manifest. Relative to the workspace root directory."""
+
+MANIFEST_NAME_DEFAULT = "default.xml"
+"""Default Manifest File Name."""
@@ -0,0 +1,261 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Repo Datamodel.
+
+* :any:`RepoManifest`: Loaded Repo Manifest - :any:`ManifestSpec` plus repo specific settings.
+* :any:`RepoConfig`: Repo Workspace Configuration.
+* :any:`SyncState`: Synchronized State Of All Projects And Applied Links And Copies.
+"""
+
+from functools import cached_property
+from pathlib import Path
+from typing import Literal, Optional
+
+import tomlkit
+from gitws import ManifestSpec
+from gitws.const import GIT_WS_PATH
+from pydantic import BaseModel, ConfigDict, PositiveInt, model_validator
+
+from ._groupindex import GroupIndex
+from ._pathindex import PathIndex
+
+REPO_CONFIG_PATH = GIT_WS_PATH / "repo.toml"
+"""Repo Workspace Configuration File. Relative to the workspace root directory."""
+
+SYNC_STATE_PATH = GIT_WS_PATH / "repo-sync.json"
+"""Sync State File. Relative to the workspace root directory."""
+
+
+class RepoManifest(BaseModel):
+    """
+    Repo Manifest.
+
+    A repo manifest carries settings, which have no representation in :any:`ManifestSpec`.
+
+    Keyword Args:
+        spec: Manifest Specification.
+        sync_j: Number of parallel sync jobs (``<default sync-j="..."/>``).
+        clone_depth: Default shallow clone depth (``<default clone-depth="..."/>``).
+        clone_depths: Shallow clone depth per project path (``<project clone-depth="..."/>``).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    spec: ManifestSpec = ManifestSpec()
+    """Manifest Specification."""
+
+    sync_j: Optional[PositiveInt] = None
+    """Number of parallel sync jobs."""
+
+    clone_depth: Optional[PositiveInt] = None
+    """Default shallow clone depth."""
+
+    clone_depths: dict[str, PositiveInt] = {}
+    """Shallow clone depth per project path."""
+
+    def get_clone_depth(self, path: str) -> Optional[int]:
+        """
+        Return Shallow Clone Depth For Project At ``path``.
+
+        >>> manifest = RepoManifest(clone_depth=5, clone_depths={'kernel': 1})
+        >>> manifest.get_clone_depth('kernel')
+        1
+        >>> manifest.get_clone_depth('other')
+        5
+        """
+        return self.clone_depths.get(path, self.clone_depth)
+
+    @cached_property
+    def group_index(self) -> GroupIndex:
+        """
+        Group Index Of All Projects.
+
+        >>> manifest = RepoManifest(spec=ManifestSpec(dependencies=[{"name": "a", "groups": ["pdk"]}]))
+        >>> manifest.group_index.select(("-pdk",))
+        ()
+        """
+        return GroupIndex(self.spec.dependencies, default_groups=self.spec.defaults.groups)
+
+    @cached_property
+    def path_index(self) -> PathIndex:
+        """
+        Path Index Of All Projects.
+
+        >>> manifest = RepoManifest(spec=ManifestSpec(dependencies=[{"name": "a", "path": "x/a"}]))
+        >>> manifest.path_index.find("x/a/file.txt")
+        0
+        """
+        return PathIndex(self.spec.dependencies)
+
+
+class RepoConfig(BaseModel):
+    """
+    Repo Workspace Configuration.
+
+    The settings are specified on ``repo init`` and kept at :any:`REPO_CONFIG_PATH`.
+
+    Keyword Args:
+        depth: Shallow clone depth for all projects without ``clone-depth``.
+        clone_filter: Partial clone filter (i.e. ``blob:none``).
+        reference: Mirror workspace, whose object databases are used via git alternates.
+        mirror: Workspace is a mirror workspace with bare repositories.
+
+    A mirror workspace contains complete bare repositories only. ``depth`` and ``clone_filter`` are not allowed.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    depth: Optional[PositiveInt] = None
+    """Shallow clone depth for all projects without ``clone-depth``."""
+
+    clone_filter: Optional[str] = None
+    """Partial clone filter (i.e. ``blob:none``)."""
+
+    reference: Optional[str] = None
+    """Mirror workspace, whose object databases are used via git alternates."""
+
+    mirror: bool = False
+    """Workspace is a mirror workspace with bare repositories."""
+
+    @model_validator(mode="after")
+    def _mirror_is_complete(self):
+        if self.mirror and (self.depth or self.clone_filter):
+            raise ValueError("A mirror cannot be shallow or partial")
+        return self
+
+    @staticmethod
+    def load(path: Path) -> "RepoConfig":
+        """
+        Load Configuration from workspace root directory at ``path``.
+
+        A missing file results in the default configuration.
+        """
+        try:
+            doc = tomlkit.parse((path / REPO_CONFIG_PATH).read_text())
+        except FileNotFoundError:
+            return RepoConfig()
+        return RepoConfig(**doc.unwrap())
+
+    def save(self, path: Path):
+        """Save Configuration at workspace root directory at ``path``."""
+        configpath = path / REPO_CONFIG_PATH
+        configpath.parent.mkdir(parents=True, exist_ok=True)
+        doc = tomlkit.document()
+        doc.add(tomlkit.comment("Git Workspace Repo System File. DO NOT EDIT."))
+        doc.add(tomlkit.nl())
+        for name, value in self.model_dump(exclude_defaults=True).items():
+            doc[name] = value
+        configpath.write_text(tomlkit.dumps(doc))
+
+
+class ProjectState(BaseModel):
+    """
+    Synchronized State Of One Project.
+
+    Keyword Args:
+        url: Remote URL.
+        revision: Manifest revision.
+        depth: Shallow clone depth.
+        sha: Checked out commit.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    url: str
+    """Remote URL."""
+
+    revision: Optional[str] = None
+    """Manifest revision."""
+
+    depth: Optional[PositiveInt] = None
+    """Shallow clone depth."""
+
+    sha: str
+    """Checked out commit."""
+
+
+class FileRefState(BaseModel):
+    """
+    Applied Link Or Copy.
+
+    Keyword Args:
+        kind: ``link`` or ``copy``.
+        src: Source path, relative to the workspace root directory.
+        size: Size of the copy.
+        mtime_ns: Modification time of the copy in nanoseconds.
+        sha: SHA256 of the copy.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    kind: Literal["link", "copy"]
+    """``link`` or ``copy``."""
+
+    src: str
+    """Source path, relative to the workspace root directory."""
+
+    size: Optional[int] = None
+    """Size of the copy."""
+
+    mtime_ns: Optional[int] = None
+    """Modification time of the copy in nanoseconds."""
+
+    sha: Optional[str] = None
+    """SHA256 of the copy."""
+
+
+class SyncState(BaseModel):
+    """
+    Sync State.
+
+    The state of every project after its last successful sync, by project path,
+    and the applied links and copies, by destination.
+    Kept at :any:`SYNC_STATE_PATH`.
+
+    Keyword Args:
+        projects: Project states by project path.
+        filerefs: Applied links and copies by destination path.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    projects: dict[str, ProjectState] = {}
+    """Project states by project path."""
+
+    filerefs: dict[str, FileRefState] = {}
+    """Applied links and copies by destination path."""
+
+    @staticmethod
+    def load(path: Path) -> "SyncState":
+        """
+        Load Sync State from workspace root directory at ``path``.
+
+        A missing or broken file results in an empty state.
+        """
+        try:
+            return SyncState.model_validate_json((path / SYNC_STATE_PATH).read_bytes())
+        except (FileNotFoundError, ValueError):
+            return SyncState()
+
+    def save(self, path: Path):
+        """Save Sync State at workspace root directory at ``path``."""
+        statepath = path / SYNC_STATE_PATH
+        statepath.parent.mkdir(parents=True, exist_ok=True)
+        tmppath = statepath.with_suffix(".tmp")
+        tmppath.write_text(self.model_dump_json(exclude_defaults=True))
+        tmppath.replace(statepath)
@@ -18,13 +18,20 @@
 Google Git Repo Manifest Format.
 """
 
+import hashlib
+import io
 import re
-from contextlib import contextmanager
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from functools import cache, lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any
-from xml.etree.ElementTree import tostring
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple, Optional, TextIO, Union
+from xml.etree.ElementTree import Element, tostring
+from xml.sax.saxutils import quoteattr
 
-from defusedxml import ElementTree
 from gitws import (
     Defaults,
     FileRef,
@@ -39,140 +46,847 @@ from gitws import (
 )
 from gitws._util import LOGGER
 
+from ._timing import phase
+from .const import LOCAL_MANIFESTS_PATH, MANIFESTS_PATH
+
+if TYPE_CHECKING:
+    from .datamodel import RepoManifest
+
 _RE_SPLIT = re.compile(r"[,\s]\s*")
 
 
 class RepoManifestFormat(ManifestFormat):
     """
     Google Repo Manifest Format.
+
+    Keyword Args:
+        compact: Compact in-memory representation. See below.
+        jobs: Number of processes to convert included manifests in parallel.
+
+    Large manifests repeat remote names, revisions and groups thousands of times.
+    In compact mode these strings are interned and equal group tuples are shared by all projects.
+    Projects are constructed without a second validation pass, as the manifest elements are already checked
+    during conversion. Elements, which do not pass these checks, are validated as usual, for the same errors.
+    The loaded manifest is equal in both modes.
+
+    With ``jobs`` above 1, all manifests reachable via includes are converted in a process pool upfront,
+    one include level after the other. They are merged in include order afterwards, as usual.
+    Files, which fail to convert, are converted again while merging, for the same errors at the same position.
     """
 
+    def __init__(self, compact: bool = False, jobs: int = 1):
+        self.compact = compact
+        self.jobs = jobs
+
     def is_compatible(self, path: Path) -> bool:
         """Check If v  File At ``path`` Is Compatible."""
         return path.suffix == ".xml"
 
-    def load(self, path: Path) -> ManifestSpec:  # noqa: C901, PLR0915
+    def load(self, path: Path) -> ManifestSpec:
         """
         Load Manifest From ``path``.
 
+        The file is parsed incrementally. Every top-level element is converted as soon as it is complete
+        and dropped afterwards, so the full element tree is never held in memory.
+
+        ``<include name="..."/>`` elements are resolved relative to the directory of ``path``.
+        If ``path`` is located in the manifest repository clone (``.repo/manifests``), all
+        ``.repo/local_manifests/*.xml`` files are merged afterwards. Every file is converted at most once per
+        process and only converted again after it changed.
+
+        Within a workspace, the result is kept in a persistent parse cache.
+        Unchanged manifests are not parsed again.
+
         Raises:
             ManifestNotFoundError: if file is not found
             ManifestError: On Syntax Or Data Scheme Errors.
         """
-        defaults: dict[str, str] = {}
-        remotes: list[Remote] = []
-        projects: list[ProjectSpec] = []
-        ignored: list[str] = []
-
-        # Feel free to re-factor
-
-        def _convert_default(defaults: dict[str, str], element):
-            for name, value in element.attrib.items():
-                if name in ("remote", "revision"):
-                    defaults[name] = value
-                else:
-                    _ignore(f"default.{name}")
-
-        def _convert_remote(remotes: list[Remote], element):
-            remote = {}
-            for name, value in element.attrib.items():
-                if name == "name":
-                    remote[name] = value
-                elif name == "fetch":
-                    remote["url-base"] = value
-                else:
-                    _ignore(f"remote.{name}")
-            with _handle_validation_error(path, element):
-                remotes.append(Remote(**remote))
-
-        def _convert_project(projects: list[ProjectSpec], element, pname=None, ppath=None):
-            copyfiles: list[FileRef] = []
-            linkfiles: list[FileRef] = []
-            groups: list[Group] = []
-            project: dict[str, Any] = {
-                "recursive": False,
-            }
-            subprojects: list[ProjectSpec] = []
-            for name, value in element.attrib.items():
-                if name == "name":
-                    project[name] = f"{pname}{value}" if pname else value
-                elif name == "path":
-                    project[name] = f"{ppath}/{value}" if ppath else value
-                elif name in ("remote", "revision"):
-                    project[name] = value
-                elif name == "groups":
-                    groups.extend(item.strip() for item in _RE_SPLIT.split(value))
-                else:
-                    _ignore(f"default.{name}")
-            # group compatibility
-            pname = project["name"]
-            ppath = project.get("path", pname)
-            # subelements
-            for subelement in element:
-                if subelement.tag == "copyfile":
-                    _convert_file(copyfiles, "project.copyfile", subelement)
-                elif subelement.tag == "linkfile":
-                    _convert_file(linkfiles, "project.linkfile", subelement)
-                elif subelement.tag == "project":
-                    _convert_project(subprojects, subelement, pname=pname, ppath=ppath)
-                else:
-                    _ignore(f"project.{subelement.tag}")
-            with _handle_validation_error(path, element):
-                projects.append(
-                    ProjectSpec(copyfiles=tuple(copyfiles), linkfiles=tuple(linkfiles), groups=tuple(groups), **project)
-                )
-            projects.extend(subprojects)
-
-        def _convert_file(files: list[FileRef], prefix: str, element):
-            file = {}
-            for name, value in element.attrib.items():
-                if name in ("src", "dest"):
-                    file[name] = value
-                else:
-                    _ignore(f"{prefix}.{name}")
-            with _handle_validation_error(path, element):
-                files.append(FileRef(**file))
+        return self.load_repo_manifest(path).spec
+
+    def load_repo_manifest(self, path: Path) -> "RepoManifest":
+        """
+        Load Manifest From ``path`` Including Repo Specific Settings.
+
+        Raises:
+            ManifestNotFoundError: if file is not found
+            ManifestError: On Syntax Or Data Scheme Errors.
+        """
+        from ._cache import ManifestCache
+
+        with phase("load", str(path)):
+            loader = _Loader(path, compact=self.compact, jobs=self.jobs)
+            cache = ManifestCache.find(path)
+            if cache is not None:
+                return cache.load(loader)
+            return loader.load()
+
+    def dump(self, spec: ManifestSpec, path: Optional[Path] = None) -> str:
+        """
+        Return :any:`ManifestSpec` As String.
+
+        See :any:`dump_repo_manifest` for details.
+        """
+        from .datamodel import RepoManifest
+
+        return self.dump_repo_manifest(RepoManifest(spec=spec))
+
+    def save(self, spec: ManifestSpec, path: Path, update: bool = True):
+        """
+        Save ``spec`` At ``path``.
+
+        See :any:`save_repo_manifest` for details.
+        An existing file is always overwritten, ``update`` is not supported.
+        """
+        from .datamodel import RepoManifest
+
+        self.save_repo_manifest(RepoManifest(spec=spec), path)
+
+    def dump_repo_manifest(self, manifest: "RepoManifest") -> str:
+        """
+        Return ``manifest`` As String.
+
+        See :any:`save_repo_manifest` for details.
+        """
+        file = io.StringIO()
+        _write(file, manifest)
+        return file.getvalue()
+
+    def save_repo_manifest(self, manifest: "RepoManifest", path: Path):
+        """
+        Save ``manifest`` Including Repo Specific Settings At ``path``.
+
+        The file is written element by element, without building an element tree.
+        Nested projects are written flat with their full name and path, which loads to the same manifest.
+        Settings without repo equivalent, like group filters or submodules, are not stored.
+
+        Raises:
+            ValueError: Manifest cannot be represented in repo format.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            _write(file, manifest)
+
+
+class _Include(NamedTuple):
+    """Include Directive."""
+
+    path: Path
+    """Path of the including file."""
+
+    name: str
+    """Name of the included file. Relative to the directory of the top manifest file."""
+
 
-        def _ignore(name):
-            if name not in ignored:
-                ignored.append(name)
-                LOGGER.info("%r: Ignoring %r", str(path), name)
+class _ExtendProject(NamedTuple):
+    """Extend Project Directive."""
 
+    path: Path
+    """Path of the file containing the directive."""
+
+    name: str
+    """Project Name."""
+
+    project_path: Optional[str]
+    """Restrict to project at this path."""
+
+    update: dict[str, Any]
+    """Project Attributes To Be Replaced."""
+
+    groups: tuple[str, ...]
+    """Groups To Be Added."""
+
+    expr: str
+    """Directive - for error reporting."""
+
+
+class _RemoveProject(NamedTuple):
+    """Remove Project Directive."""
+
+    path: Path
+    """Path of the file containing the directive."""
+
+    name: Optional[str]
+    """Project Name."""
+
+    project_path: Optional[str]
+    """Project Path."""
+
+    optional: bool
+    """Do not complain about a missing project."""
+
+    expr: str
+    """Directive - for error reporting."""
+
+
+_Item = Union[ProjectSpec, _Include, _ExtendProject, _RemoveProject]
+
+
+class _Fragment(NamedTuple):
+    """Converted Content Of One Manifest File."""
+
+    defaults: dict[str, str]
+    sync_j: Optional[int]
+    clone_depth: Optional[int]
+    remotes: tuple[Remote, ...]
+    items: tuple[_Item, ...]
+    """Projects, includes and directives in document order."""
+    clone_depths: dict[str, int]
+    ignored: tuple[str, ...]
+
+
+class _FragmentMemo:
+    """
+    Converted Manifest Files Of This Process.
+
+    A file is just converted again, if its modification time or size changed and its content differs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[Path, bool], tuple[tuple[int, int], str, _Fragment]] = {}
+
+    def get(self, path: Path, compact: bool = False) -> _Fragment:
+        """Return Converted Content Of File At ``path``."""
+        filepath = path.resolve()
         try:
-            root = ElementTree.parse(path).getroot()
+            stat = filepath.stat()
         except FileNotFoundError:
             raise ManifestNotFoundError(path) from None
-        except Exception as exc:
-            raise ManifestError(path, str(exc)) from None
+        statkey = (stat.st_mtime_ns, stat.st_size)
+        key = (filepath, compact)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == statkey:
+            return entry[2]
+        try:
+            data = filepath.read_bytes()
+        except FileNotFoundError:  # pragma: no cover
+            raise ManifestNotFoundError(path) from None
+        hash_ = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry[1] == hash_:
+            fragment = entry[2]
+        else:
+            with phase("parse", str(path)):
+                fragment = _FileLoader(path, compact=compact).load(io.BytesIO(data))
+        with self._lock:
+            self._entries[key] = (statkey, hash_, fragment)
+        return fragment
+
+    def get_current(self, path: Path, compact: bool = False) -> Optional[_Fragment]:
+        """Return Converted Content Of File At ``path``, If The File Did Not Change Since - Without Converting."""
+        filepath = path.resolve()
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get((filepath, compact))
+        if entry is not None and entry[0] == (stat.st_mtime_ns, stat.st_size):
+            return entry[2]
+        return None
 
-        if root.tag != "manifest":
-            raise ManifestError(path, f"Root element is {root.tag!r}. Expecting 'manifest'")
+    def add(self, path: Path, entry: tuple[tuple[int, int], str, _Fragment], compact: bool = False):
+        """Add Converted Content Of File At ``path``, As Returned By :any:`_convert`."""
+        with self._lock:
+            self._entries[(path.resolve(), compact)] = entry
 
-        for element in root:
+    def clear(self):
+        """Forget All Converted Files."""
+        with self._lock:
+            self._entries.clear()
+
+
+_FRAGMENTS = _FragmentMemo()
+
+
+class _Loader:
+    """
+    Manifest Loader.
+
+    Merges the manifest, all included manifests and the local manifests.
+    Every file is converted at most once per process.
+
+    Projects are kept in insertion order with name and path indexes,
+    so ``extend-project`` and ``remove-project`` directives do not need to search.
+    """
+
+    def __init__(self, path: Path, compact: bool = False, jobs: int = 1):
+        self.path = path
+        self.compact = compact
+        self.jobs = jobs
+        self.options = f"compact={compact}"
+        """Options, the result depends on. ``jobs`` just affects the loading, not the result."""
+        self.paths: list[Path] = []
+        """All files and directories, the result depends on."""
+        self.defaults: dict[str, str] = {}
+        self.sync_j: Optional[int] = None
+        self.clone_depth: Optional[int] = None
+        self.clone_depths: dict[str, int] = {}
+        self.remotes: list[Remote] = []
+        self.projects: dict[int, ProjectSpec] = {}
+        self.ignored: list[str] = []
+        self._merged: set[Path] = set()
+        self._names: dict[str, list[int]] = {}
+        self._paths: dict[str, int] = {}
+        self._counter = 0
+
+    def load(self) -> "RepoManifest":
+        """Load, Merge And Convert."""
+        from .datamodel import RepoManifest
+
+        path = self.path
+        local_manifests_path = _get_local_manifests_path(path)
+        local_manifest_paths = sorted(local_manifests_path.glob("*.xml")) if local_manifests_path else []
+        if self.jobs > 1:
+            with phase("parallel-conversion", str(path)):
+                self._convert_all([path, *local_manifest_paths])
+        with phase("include-resolution", str(path)):
+            self._merge(path, ())
+            if local_manifests_path is not None:
+                self.paths.append(local_manifests_path)
+                for local_manifest_path in local_manifest_paths:
+                    self._merge(local_manifest_path, ())
+
+        with phase("validation", str(path)), _handle_validation_error(path):
+            spec = ManifestSpec(
+                defaults=Defaults(**self.defaults),
+                remotes=tuple(self.remotes),
+                dependencies=tuple(self.projects.values()),
+                group_filters=["-notdefault"],
+            )
+            manifest = RepoManifest(
+                spec=spec, sync_j=self.sync_j, clone_depth=self.clone_depth, clone_depths=self.clone_depths
+            )
+        with phase("group-index", str(path)):
+            # built once at load time - the parse cache keeps it
+            manifest.group_index  # noqa: B018
+        return manifest
+
+    def ignore(self, name):
+        """Report ``name`` as ignored - once."""
+        if name not in self.ignored:
+            self.ignored.append(name)
+            LOGGER.info("%r: Ignoring %r", str(self.path), name)
+
+    def _convert_all(self, paths: list[Path]):
+        """Convert ``paths`` And All Files Included By Them In Parallel - One Include Level After The Other."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        compact = self.compact
+        seen = {path.resolve() for path in paths}
+        with ExitStack() as stack:
+            executor = None
+            while paths:
+                fragments: list[_Fragment] = []
+                stale: list[Path] = []
+                for path in paths:
+                    fragment = _FRAGMENTS.get_current(path, compact=compact)
+                    if fragment is None:
+                        stale.append(path)
+                    else:
+                        fragments.append(fragment)
+                if len(stale) > 1 and executor is None:
+                    executor = stack.enter_context(
+                        ProcessPoolExecutor(max_workers=self.jobs, mp_context=_get_mp_context())
+                    )
+                mapper = executor.map if executor else map
+                for path, entry in zip(stale, mapper(_convert, stale, repeat(compact))):
+                    if entry is not None:
+                        _FRAGMENTS.add(path, entry, compact=compact)
+                        fragments.append(entry[2])
+                paths = list(self._iter_includes(fragments, seen))
+
+    def _iter_includes(self, fragments: Iterable[_Fragment], seen: set[Path]) -> Iterator[Path]:
+        for fragment in fragments:
+            for item in fragment.items:
+                if isinstance(item, _Include):
+                    include_path = self.path.parent / item.name
+                    key = include_path.resolve()
+                    if key not in seen and include_path.is_file():
+                        seen.add(key)
+                        yield include_path
+
+    def _merge(self, path: Path, stack: tuple[Path, ...]):
+        key = path.resolve()
+        if key in stack:
+            chain = " -> ".join(repr(str(item.name)) for item in (*stack, key))
+            raise ManifestError(path, f"Include cycle {chain}")
+        if key in self._merged:
+            LOGGER.debug("%r: Already included %r", str(self.path), str(path))
+            return
+        self._merged.add(key)
+        self.paths.append(path)
+        fragment = _FRAGMENTS.get(path, compact=self.compact)
+        for name in fragment.ignored:
+            self.ignore(name)
+        self.defaults.update(fragment.defaults)
+        if fragment.sync_j is not None:
+            self.sync_j = fragment.sync_j
+        if fragment.clone_depth is not None:
+            self.clone_depth = fragment.clone_depth
+        self.remotes.extend(fragment.remotes)
+        for item in fragment.items:
+            if isinstance(item, _Include):
+                self._include(item, (*stack, key))
+            elif isinstance(item, _ExtendProject):
+                self._extend_project(item)
+            elif isinstance(item, _RemoveProject):
+                self._remove_project(item)
+            else:
+                self._add_project(path, item, fragment.clone_depths)
+
+    def _include(self, item: _Include, stack: tuple[Path, ...]):
+        include_path = self.path.parent / item.name
+        if not include_path.is_file():
+            raise ManifestError(item.path, f"Included manifest {item.name!r} not found")
+        self._merge(include_path, stack)
+
+    def _add_project(self, filepath: Path, project: ProjectSpec, clone_depths: dict[str, int]):
+        path = _get_path(project)
+        if path in self._paths:
+            raise ManifestError(filepath, f"Duplicate project path {path!r}")
+        idx = self._counter
+        self._counter += 1
+        self.projects[idx] = project
+        self._names.setdefault(project.name, []).append(idx)
+        self._paths[path] = idx
+        clone_depth = clone_depths.get(path)
+        if clone_depth is not None:
+            self.clone_depths[path] = clone_depth
+
+    def _extend_project(self, item: _ExtendProject):
+        idxs = self._names.get(item.name, [])
+        if item.project_path is not None:
+            idxs = [idx for idx in idxs if _get_path(self.projects[idx]) == item.project_path]
+        if not idxs:
+            raise ManifestError(item.path, f"Unknown project in {item.expr}")
+        for idx in idxs:
+            project = self.projects[idx]
+            path = _get_path(project)
+            update = dict(item.update)
+            if item.groups:
+                update["groups"] = project.groups + tuple(group for group in item.groups if group not in project.groups)
+            with _handle_validation_error(item.path, expr=item.expr):
+                # unset attributes are left out, as ``None`` does not pass validation (i.e. ``path``)
+                attrs = {key: value for key, value in dict(project).items() if value is not None}
+                extended = ProjectSpec(**{**attrs, **update})
+            newpath = _get_path(extended)
+            if newpath != path and newpath in self._paths:
+                raise ManifestError(item.path, f"Duplicate project path {newpath!r} in {item.expr}")
+            self.projects[idx] = extended
+            if newpath != path:
+                _discard(self._paths, path, idx)
+                self._paths[newpath] = idx
+                clone_depth = self.clone_depths.pop(path, None)
+                if clone_depth is not None:
+                    self.clone_depths[newpath] = clone_depth
+
+    def _remove_project(self, item: _RemoveProject):
+        if item.name is not None:
+            idxs = self._names.get(item.name, [])
+            if item.project_path is not None:
+                idxs = [idx for idx in idxs if _get_path(self.projects[idx]) == item.project_path]
+        else:
+            idx = self._paths.get(item.project_path or "")
+            idxs = [idx] if idx is not None else []
+        if not idxs and not item.optional:
+            raise ManifestError(item.path, f"Unknown project in {item.expr}")
+        for idx in tuple(idxs):
+            project = self.projects.pop(idx)
+            path = _get_path(project)
+            _discard(self._paths, path, idx)
+            self.clone_depths.pop(path, None)
+            names = self._names[project.name]
+            names.remove(idx)
+            if not names:
+                del self._names[project.name]
+
+
+def _discard(paths: dict[str, int], path: str, idx: int):
+    """Remove ``path`` From ``paths``, If It Refers To Project ``idx``."""
+    if paths.get(path) == idx:
+        del paths[path]
+
+
+class _FileLoader:
+    """Manifest File Loader - converts the elements of one manifest file."""
+
+    def __init__(self, path: Path, compact: bool = False):
+        self.path = path
+        self.compact = compact
+        self.defaults: dict[str, str] = {}
+        self.sync_j: Optional[int] = None
+        self.clone_depth: Optional[int] = None
+        self.clone_depths: dict[str, int] = {}
+        self.remotes: list[Remote] = []
+        self.items: list[_Item] = []
+        self.ignored: list[str] = []
+
+    def load(self, source: BinaryIO) -> _Fragment:
+        """Load And Convert ``source``."""
+        for root, element in _iterparse(self.path, source):
             tag = element.tag
             if tag == "default":
-                _convert_default(defaults, element)
+                self._convert_default(element)
             elif tag == "remote":
-                _convert_remote(remotes, element)
+                self._convert_remote(element)
             elif tag == "project":
-                _convert_project(projects, element)
+                projects: list[ProjectSpec] = []
+                self._convert_project(projects, element)
+                self.items.extend(projects)
+            elif tag == "include":
+                self._convert_include(element)
+            elif tag == "extend-project":
+                self._convert_extend_project(element)
+            elif tag == "remove-project":
+                self._convert_remove_project(element)
             else:
-                _ignore(tag)
+                self.ignore(tag)
+            # the element is converted and not needed anymore
+            root.clear()
+        return _Fragment(
+            defaults=self.defaults,
+            sync_j=self.sync_j,
+            clone_depth=self.clone_depth,
+            remotes=tuple(self.remotes),
+            items=tuple(self.items),
+            clone_depths=self.clone_depths,
+            ignored=tuple(self.ignored),
+        )
 
-        with _handle_validation_error(path, root):
-            return ManifestSpec(
-                defaults=Defaults(**defaults),
-                remotes=tuple(remotes),
-                dependencies=tuple(projects),
-                group_filters=["-notdefault"],
+    def _convert_default(self, element):
+        for name, value in element.attrib.items():
+            if name in ("remote", "revision"):
+                self.defaults[name] = value
+            elif name == "sync-j":
+                with _handle_validation_error(self.path, element):
+                    self.sync_j = _get_positive_int().validate_python(value)
+            elif name == "clone-depth":
+                with _handle_validation_error(self.path, element):
+                    self.clone_depth = _get_positive_int().validate_python(value)
+            else:
+                self.ignore(f"default.{name}")
+
+    def _convert_remote(self, element):
+        remote = {}
+        for name, value in element.attrib.items():
+            if name == "name":
+                remote[name] = value
+            elif name == "fetch":
+                remote["url-base"] = value
+            else:
+                self.ignore(f"remote.{name}")
+        with _handle_validation_error(self.path, element):
+            self.remotes.append(Remote(**remote))
+
+    def _convert_project(self, projects: list[ProjectSpec], element, pname=None, ppath=None):  # noqa: C901, PLR0912
+        copyfiles: list[FileRef] = []
+        linkfiles: list[FileRef] = []
+        groups: list[Group] = []
+        project: dict[str, Any] = {
+            "recursive": False,
+        }
+        subprojects: list[ProjectSpec] = []
+        clone_depth: Optional[int] = None
+        for name, value in element.attrib.items():
+            if name == "name":
+                project[name] = f"{pname}{value}" if pname else value
+            elif name == "path":
+                project[name] = f"{ppath}/{value}" if ppath else value
+            elif name in ("remote", "revision"):
+                project[name] = sys.intern(value) if self.compact else value
+            elif name == "groups":
+                groups.extend(item.strip() for item in _RE_SPLIT.split(value))
+            elif name == "clone-depth":
+                with _handle_validation_error(self.path, element):
+                    clone_depth = _get_positive_int().validate_python(value)
+            else:
+                self.ignore(f"default.{name}")
+        # group compatibility
+        pname = project["name"]
+        ppath = project.get("path", pname)
+        if clone_depth is not None:
+            self.clone_depths[ppath] = clone_depth
+        # subelements
+        for subelement in element:
+            if subelement.tag == "copyfile":
+                self._convert_file(copyfiles, "project.copyfile", subelement)
+            elif subelement.tag == "linkfile":
+                self._convert_file(linkfiles, "project.linkfile", subelement)
+            elif subelement.tag == "project":
+                self._convert_project(subprojects, subelement, pname=pname, ppath=ppath)
+            else:
+                self.ignore(f"project.{subelement.tag}")
+        fields = {"copyfiles": tuple(copyfiles), "linkfiles": tuple(linkfiles), "groups": tuple(groups), **project}
+        spec = _construct_project(fields) if self.compact else None
+        if spec is None:
+            with _handle_validation_error(self.path, element):
+                spec = ProjectSpec(**fields)
+        projects.append(spec)
+        projects.extend(subprojects)
+
+    def _convert_file(self, files: list[FileRef], prefix: str, element):
+        file = {}
+        for name, value in element.attrib.items():
+            if name in ("src", "dest"):
+                file[name] = value
+            else:
+                self.ignore(f"{prefix}.{name}")
+        if self.compact and len(file) == 2:  # noqa: PLR2004
+            fileref = FileRef.model_construct(
+                _get_fields_set(frozenset(file)), src=sys.intern(file["src"]), dest=file["dest"]
             )
+            files.append(fileref)
+        else:
+            with _handle_validation_error(self.path, element):
+                files.append(FileRef(**file))
+
+    def _convert_include(self, element):
+        name = element.attrib.get("name")
+        if not name:
+            raise ManifestError(self.path, tostring(element).decode("utf-8").strip())
+        for attrname in element.attrib:
+            if attrname != "name":
+                self.ignore(f"include.{attrname}")
+        self.items.append(_Include(path=self.path, name=name))
+
+    def _convert_extend_project(self, element):
+        attrib = dict(element.attrib)
+        expr = tostring(element).decode("utf-8").strip()
+        name = attrib.pop("name", None)
+        if not name:
+            raise ManifestError(self.path, expr)
+        project_path = attrib.pop("path", None)
+        update: dict[str, Any] = {}
+        groups: tuple[str, ...] = ()
+        for attrname, value in attrib.items():
+            if attrname == "dest-path":
+                update["path"] = value
+            elif attrname in ("remote", "revision"):
+                update[attrname] = value
+            elif attrname == "groups":
+                groups = tuple(item.strip() for item in _RE_SPLIT.split(value))
+            else:
+                self.ignore(f"extend-project.{attrname}")
+        self.items.append(
+            _ExtendProject(
+                path=self.path, name=name, project_path=project_path, update=update, groups=groups, expr=expr
+            )
+        )
+
+    def _convert_remove_project(self, element):
+        attrib = element.attrib
+        expr = tostring(element).decode("utf-8").strip()
+        name = attrib.get("name")
+        project_path = attrib.get("path")
+        if not name and not project_path:
+            raise ManifestError(self.path, expr)
+        for attrname in attrib:
+            if attrname not in ("name", "path", "optional"):
+                self.ignore(f"remove-project.{attrname}")
+        optional = attrib.get("optional", "false").lower() == "true"
+        self.items.append(
+            _RemoveProject(path=self.path, name=name, project_path=project_path, optional=optional, expr=expr)
+        )
+
+    def ignore(self, name):
+        """Collect ``name`` as ignored - once."""
+        if name not in self.ignored:
+            self.ignored.append(name)
+
+
+def _get_mp_context():
+    """
+    Return Multiprocessing Context Without ``fork``.
+
+    The caller might run other threads (i.e. logging), whose locks a forked child inherits in any state.
+    """
+    import multiprocessing
+
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _convert(path: Path, compact: bool) -> Optional[tuple[tuple[int, int], str, _Fragment]]:
+    """
+    Convert File At ``path`` - Typically In A Worker Process.
+
+    Return memo entry for :any:`_FragmentMemo.add` or ``None`` on any failure.
+    Failures are reported by :any:`_FragmentMemo.get` in include order.
+    """
+    filepath = path.resolve()
+    try:
+        stat = filepath.stat()
+        data = filepath.read_bytes()
+        fragment = _FileLoader(path, compact=compact).load(io.BytesIO(data))
+    except Exception:
+        return None
+    return (stat.st_mtime_ns, stat.st_size), hashlib.sha256(data).hexdigest(), fragment
+
+
+@cache
+def _get_positive_int():
+    from pydantic import PositiveInt, TypeAdapter
+
+    return TypeAdapter(PositiveInt)
+
+
+def _get_path(project: ProjectSpec) -> str:
+    return project.path or project.name
+
+
+def _get_local_manifests_path(path: Path) -> Optional[Path]:
+    """
+    Return Local Manifests Directory, If ``path`` Is Located In The Manifest Repository Clone.
+    """
+    manifests_path = path.resolve().parent
+    if manifests_path.parts[-len(MANIFESTS_PATH.parts) :] == MANIFESTS_PATH.parts:
+        return manifests_path.parent.parent / LOCAL_MANIFESTS_PATH
+    return None
+
+
+def _iterparse(path: Path, source: BinaryIO) -> Iterator[tuple[Element, Element]]:
+    """
+    Parse ``source`` read from ``path`` incrementally and yield ``(root, element)`` for every top-level element.
+
+    :any:`defusedxml` keeps forbidding entities and external references.
+    """
+    from defusedxml import ElementTree
+
+    try:
+        root = None
+        level = 0
+        for event, element in ElementTree.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if level == 0:
+                    if element.tag != "manifest":
+                        raise ManifestError(path, f"Root element is {element.tag!r}. Expecting 'manifest'")
+                    root = element
+                level += 1
+            else:
+                level -= 1
+                if level == 1:
+                    yield root, element
+    except ManifestError:
+        raise
+    except Exception as exc:
+        raise ManifestError(path, str(exc)) from None
+
+
+def _construct_project(fields: dict[str, Any]) -> Optional[ProjectSpec]:
+    """
+    Construct :any:`ProjectSpec` Without Validation - Or Return ``None`` If ``fields`` Need Validation.
+
+    >>> _construct_project({"name": "a", "groups": ("pdk",)}) == ProjectSpec(name="a", groups=("pdk",))
+    True
+    >>> _construct_project({"name": "../a"})
+    """
+    name = fields.get("name")
+    path = fields.get("path")
+    if not name or _is_unsafe(name) or (path is not None and _is_unsafe(path)):
+        return None
+    if fields.get("groups"):
+        groups = _get_groups(fields["groups"])
+        if groups is None:
+            return None
+        fields["groups"] = groups
+    # all projects with the same fields share one fields set - frozen models never modify it
+    return ProjectSpec.model_construct(_get_fields_set(frozenset(fields)), **{**_get_project_defaults(), **fields})
+
+
+def _is_unsafe(path: str) -> bool:
+    return ".." in path.split("/")
+
+
+@lru_cache(maxsize=4096)
+def _get_groups(groups: tuple[str, ...]) -> Optional[tuple[str, ...]]:
+    """Return Shared And Validated Tuple Of Interned ``groups`` or ``None`` if invalid."""
+    try:
+        _get_groups_adapter().validate_python(groups)
+    except ValidationError:
+        return None
+    return tuple(sys.intern(group) for group in groups)
+
+
+@cache
+def _get_project_defaults() -> dict[str, Any]:
+    return {
+        name: field.get_default(call_default_factory=True)
+        for name, field in ProjectSpec.model_fields.items()
+        if not field.is_required()
+    }
+
+
+@lru_cache(maxsize=64)
+def _get_fields_set(names: frozenset[str]) -> set[str]:
+    return set(names)
+
+
+@cache
+def _get_groups_adapter():
+    from gitws import Groups
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(Groups)
 
 
 @contextmanager
-def _handle_validation_error(path, element):
+def _handle_validation_error(path, element=None, expr=None):
     try:
         yield
     except ValidationError as exc:
         LOGGER.debug(str(exc))
-        expr = tostring(element).decode("utf-8").strip()
+        if element is not None:
+            expr = tostring(element).decode("utf-8").strip()
+        elif expr is None:
+            expr = "; ".join(error["msg"] for error in exc.errors())
         raise ManifestError(path, expr) from None
+
+
+def _write(file: TextIO, manifest: "RepoManifest"):
+    spec = manifest.spec
+    if spec.linkfiles or spec.copyfiles:
+        raise ValueError("Manifest 'linkfiles' and 'copyfiles' cannot be represented in repo format")
+    write = file.write
+    write('<?xml version="1.0" encoding="UTF-8"?>\n<manifest>\n')
+    for remote in spec.remotes:
+        write(f"  <remote{_attrs({'name': remote.name, 'fetch': remote.url_base})} />\n")
+    defaults = spec.defaults
+    attrs = _attrs(
+        {
+            "remote": defaults.remote,
+            "revision": defaults.revision,
+            "sync-j": manifest.sync_j,
+            "clone-depth": manifest.clone_depth,
+        }
+    )
+    if attrs:
+        write(f"  <default{attrs} />\n")
+    clone_depths = manifest.clone_depths
+    for project in spec.dependencies:
+        if project.url or project.sub_url:
+            raise ValueError(f"Project {project.name!r}: 'url' and 'sub-url' cannot be represented in repo format")
+        attrs = _attrs(
+            {
+                "name": project.name,
+                "path": project.path,
+                "remote": project.remote,
+                "revision": project.revision,
+                "groups": ",".join(project.groups) or None,
+                "clone-depth": clone_depths.get(project.path or project.name),
+            }
+        )
+        if project.copyfiles or project.linkfiles:
+            write(f"  <project{attrs}>\n")
+            for fileref in project.copyfiles:
+                write(f"    <copyfile{_attrs({'src': fileref.src, 'dest': fileref.dest})} />\n")
+            for fileref in project.linkfiles:
+                write(f"    <linkfile{_attrs({'src': fileref.src, 'dest': fileref.dest})} />\n")
+            write("  </project>\n")
+        else:
+            write(f"  <project{attrs} />\n")
+    write("</manifest>\n")
+
+
+def _attrs(attrs: dict[str, Any]) -> str:
+    return "".join(f" {name}={quoteattr(str(value))}" for name, value in attrs.items() if value is not None)
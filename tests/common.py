@@ -16,11 +16,69 @@
 
 """Shared Test Stuff."""
 
+import subprocess
 from pathlib import Path
 
 TESTDATA_PATH = Path(__file__).parent / "testdata"
 
+MANIFEST = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remote name="origin" fetch=".." />
+  <default remote="origin" revision="main" sync-j="2" />
+  <project name="dep1" />
+  <project name="dep2" path="sub/dep2" groups="abc" />
+  <project name="dep3" revision="v1.0" />
+  <project name="dep4" groups="notdefault" />
+</manifest>
+"""
+
 
 def get_refdata_path(filepath: str):
     """Return Reference Data Path."""
     return Path(__file__).parent / "refdata" / Path(filepath).stem
+
+
+def run_git(path: Path, *args: str) -> str:
+    """Run ``git`` in ``path``."""
+    cmd = ("git", "-c", "user.name=tester", "-c", "user.email=tester@example.com", *args)
+    result = subprocess.run(cmd, cwd=path, check=True, capture_output=True)  # noqa: S603
+    return result.stdout.decode("utf-8").strip()
+
+
+def create_repo(path: Path, files: dict[str, str], tag=None) -> Path:
+    """Create Git Repository at ``path`` with ``files`` committed on ``main``."""
+    path.mkdir(parents=True)
+    run_git(path, "init", "--quiet", "--initial-branch", "main")
+    commit(path, files)
+    if tag:
+        run_git(path, "tag", tag)
+    return path
+
+
+def commit(path: Path, files: dict[str, str], msg: str = "commit") -> str:
+    """Write ``files`` And Commit Them. Return SHA."""
+    for name, content in files.items():
+        filepath = path / name
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(content)
+    run_git(path, "add", ".")
+    run_git(path, "commit", "--quiet", "-m", msg)
+    return run_git(path, "rev-parse", "HEAD")
+
+
+def create_remotes(path: Path, manifest: str = MANIFEST) -> Path:
+    """Create Remote Repositories For :any:`MANIFEST` And Return The Manifest Repository Path."""
+    for name in ("dep1", "dep2", "dep3", "dep4"):
+        create_repo(path / name, {"data.txt": name}, tag="v1.0")
+        run_git(path / name, "config", "uploadpack.allowFilter", "true")
+    return create_repo(path / "manifests", {"default.xml": manifest})
+
+
+def create_workspace(path: Path, remotes_path: Path, config=None) -> Path:
+    """Create Workspace For Manifest Repository In ``remotes_path`` And Return The Workspace Path."""
+    from gitwsrepo._workspace import RepoWorkspace
+
+    path.mkdir(parents=True)
+    RepoWorkspace.init((remotes_path / "manifests").as_uri(), path=path, config=config)
+    return path
@@ -0,0 +1,67 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark Suite Testing."""
+
+import json
+
+from click.testing import CliRunner
+
+from benchmarks.__main__ import main
+
+
+def test_benchmarks(tmp_path):
+    """Run All Benchmarks With Tiny Manifests And Compare Against Itself."""
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(main, ["--sizes", "10,20", "--rounds", "1", "--output", str(output)])
+    assert result.exit_code == 0, result.output
+    doc = json.loads(output.read_text())
+    assert doc["environment"]["git-ws"]
+    results = {(item["benchmark"], item["case"], item["projects"]): item for item in doc["results"]}
+    for case in ("flat", "nested", "linkfiles", "includes", "vendors"):
+        for size in (10, 20):
+            for suffix in ("", "-compact"):
+                assert results[f"load{suffix}", case, size]["seconds"] > 0
+                assert results[f"load-memory{suffix}", case, size]["peak_bytes"] > 0
+                assert results[f"load-memory{suffix}", case, size]["retained_bytes"] > 0
+            assert results["load-parallel", case, size]["seconds"] > 0
+            assert results["validate", case, size]["seconds"] > 0
+    assert "Compact mode retains" in result.output
+    assert results["cold-start", "help", 0]["seconds"] > 0
+    assert results["cold-start", "sync", 0]["seconds"] > 0
+
+    # much slower baseline
+    for item in doc["results"]:
+        item["seconds"] = item["seconds"] and item["seconds"] * 1000
+        item["peak_bytes"] = item["peak_bytes"] and item["peak_bytes"] * 1000
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(doc))
+    result = CliRunner().invoke(
+        main, ["--sizes", "10", "--cases", "flat", "--rounds", "1", "--baseline", str(baseline)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "load flat 10: 0.00x ok" in result.output
+
+    # much faster baseline
+    for item in doc["results"]:
+        item["seconds"] = item["seconds"] and item["seconds"] / 1e6
+        item["peak_bytes"] = item["peak_bytes"] and item["peak_bytes"] / 1e6
+    baseline.write_text(json.dumps(doc))
+    result = CliRunner().invoke(
+        main, ["--sizes", "10", "--cases", "flat", "--rounds", "1", "--baseline", str(baseline)]
+    )
+    assert result.exit_code == 1
+    assert "REGRESSION" in result.output
@@ -0,0 +1,149 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Manifest Parse Cache Testing."""
+
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from gitws.const import INFO_PATH
+from pytest import fixture
+
+from gitwsrepo import RepoManifestFormat
+from gitwsrepo._cache import CACHE_PATH, ManifestCache
+from gitwsrepo.const import LOCAL_MANIFESTS_PATH, MANIFESTS_PATH
+from gitwsrepo.repomanifestformat import _Loader
+
+from .common import TESTDATA_PATH
+
+
+@fixture
+def workspace(tmp_path):
+    """Workspace With Example Manifest."""
+    (tmp_path / INFO_PATH).parent.mkdir(parents=True)
+    (tmp_path / INFO_PATH).touch()
+    shutil.copy(TESTDATA_PATH / "example.xml", tmp_path / "example.xml")
+    return tmp_path
+
+
+def _count_entries(workspace):
+    return len(list((workspace / CACHE_PATH).glob("*.pickle")))
+
+
+def test_cache(workspace, monkeypatch, caplog):
+    """Second Load Is Served From Cache."""
+    filepath = workspace / "example.xml"
+    manifest_format = RepoManifestFormat()
+    manifest_spec = manifest_format.load(filepath)
+    assert _count_entries(workspace) == 1
+    ignored = [record.message for record in caplog.records]
+    caplog.clear()
+
+    def fail(self):
+        raise AssertionError("parsed")
+
+    with monkeypatch.context() as mpatch:
+        mpatch.setattr("gitwsrepo.repomanifestformat._Loader.load", fail)
+        assert manifest_format.load(filepath) == manifest_spec
+    assert [record.message for record in caplog.records] == ignored
+
+
+def test_cache_invalidate(workspace):
+    """Changed Manifest Is Parsed Again."""
+    filepath = workspace / "example.xml"
+    manifest_format = RepoManifestFormat()
+    manifest_spec = manifest_format.load(filepath)
+
+    filepath.write_text(filepath.read_text().replace('revision="rev1"', 'revision="other"'))
+    changed = manifest_format.load(filepath)
+    assert changed != manifest_spec
+    assert changed.dependencies[0].revision == "other"
+    assert _count_entries(workspace) == 2
+
+
+def test_cache_options(workspace):
+    """Compact And Normal Loads Do Not Share Entries."""
+    filepath = workspace / "example.xml"
+    manifest_spec = RepoManifestFormat().load(filepath)
+    assert _count_entries(workspace) == 1
+    assert RepoManifestFormat(compact=True).load(filepath) == manifest_spec
+    assert _count_entries(workspace) == 2
+    # jobs do not change the result
+    RepoManifestFormat(jobs=2).load(filepath)
+    assert _count_entries(workspace) == 2
+
+
+def test_cache_concurrent(workspace):
+    """Threads Writing The Same Entry Do Not Collide."""
+    filepath = workspace / "example.xml"
+    cache = ManifestCache.find(filepath)
+    assert cache is not None
+    with ThreadPoolExecutor(8) as executor:
+        manifests = list(executor.map(lambda _: cache.load(_Loader(filepath)), range(16)))
+    assert all(manifest == manifests[0] for manifest in manifests)
+    assert _count_entries(workspace) == 1
+    assert list((workspace / CACHE_PATH).glob("*.tmp")) == []
+
+
+def test_cache_broken(workspace):
+    """Broken Entries Are Removed."""
+    filepath = workspace / "example.xml"
+    manifest_format = RepoManifestFormat()
+    manifest_spec = manifest_format.load(filepath)
+    for entrypath in (workspace / CACHE_PATH).glob("*.pickle"):
+        entrypath.write_bytes(b"garbage")
+    assert manifest_format.load(filepath) == manifest_spec
+    assert _count_entries(workspace) == 1
+
+
+def test_cache_evict(workspace):
+    """Least Recently Used Entries Are Evicted."""
+    filepath = workspace / "example.xml"
+    cache = ManifestCache.find(filepath)
+    assert cache is not None
+    cache.maxsize = 0
+    cache.load(_Loader(filepath))
+    assert _count_entries(workspace) == 0
+
+
+def test_cache_clear(workspace):
+    """Clear Cache."""
+    filepath = workspace / "example.xml"
+    RepoManifestFormat().load(filepath)
+    assert _count_entries(workspace) == 1
+    cache = ManifestCache.find(filepath)
+    assert cache is not None
+    cache.clear()
+    assert _count_entries(workspace) == 0
+
+
+def test_cache_local_manifests(workspace):
+    """New Local Manifests Invalidate The Cache."""
+    manifests_path = workspace / MANIFESTS_PATH
+    manifests_path.mkdir(parents=True)
+    filepath = manifests_path / "default.xml"
+    filepath.write_text('<manifest><project name="dep1" /><include name="inc.xml" /></manifest>')
+    (manifests_path / "inc.xml").write_text('<manifest><project name="inc" /></manifest>')
+    manifest_format = RepoManifestFormat()
+    assert len(manifest_format.load(filepath).dependencies) == 2
+
+    (manifests_path / "inc.xml").write_text('<manifest><project name="inc" /><project name="inc2" /></manifest>')
+    assert len(manifest_format.load(filepath).dependencies) == 3
+
+    local_manifests_path = workspace / LOCAL_MANIFESTS_PATH
+    local_manifests_path.mkdir(parents=True)
+    (local_manifests_path / "local.xml").write_text('<manifest><project name="local" /></manifest>')
+    assert len(manifest_format.load(filepath).dependencies) == 4
@@ -0,0 +1,111 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Convert Testing."""
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from gitws import ManifestSpec, ProjectSpec
+from gitws.gitwsmanifestformat import GitWSManifestFormat
+
+from gitwsrepo import RepoManifestFormat
+from gitwsrepo._cli import main
+
+from .common import MANIFEST
+
+INCLUDE = """\
+<manifest>
+  <project name="dep5" />
+</manifest>
+"""
+
+
+def _convert(path, *args):
+    with chdir(path):
+        return CliRunner().invoke(main, ["convert", *args])
+
+
+def test_convert(tmp_path):
+    """Convert And Convert Again Just On Change."""
+    (tmp_path / "default.xml").write_text(MANIFEST.replace("</manifest>", '<include name="inc.xml" /></manifest>'))
+    (tmp_path / "inc.xml").write_text(INCLUDE)
+
+    result = _convert(tmp_path, "default.xml", "-o", "git-ws.toml")
+    assert result.exit_code == 0, result.output
+    assert result.output == "Converted 'default.xml' to 'git-ws.toml'.\n"
+    target = tmp_path / "git-ws.toml"
+    spec = GitWSManifestFormat().load(target)
+    assert spec == RepoManifestFormat().load(tmp_path / "default.xml")
+    assert spec.dependencies[-1] == ProjectSpec(name="dep5", recursive=False)
+
+    # comments added by the user are kept
+    target.write_text(f"# my comment\n{target.read_text()}")
+    mtime = target.stat().st_mtime_ns
+    result = _convert(tmp_path, "default.xml", "-o", "git-ws.toml")
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    assert target.stat().st_mtime_ns == mtime
+
+    (tmp_path / "inc.xml").write_text(INCLUDE.replace("dep5", "dep6"))
+    result = _convert(tmp_path, "default.xml", "-o", "git-ws.toml")
+    assert result.exit_code == 0, result.output
+    assert result.output == "Converted 'default.xml' to 'git-ws.toml'.\n"
+    assert target.read_text().startswith("# my comment\n")
+    assert GitWSManifestFormat().load(target).dependencies[-1] == ProjectSpec(name="dep6", recursive=False)
+
+
+def test_convert_batch(tmp_path):
+    """Convert Many Manifests At Once."""
+    (tmp_path / "a.xml").write_text(MANIFEST)
+    (tmp_path / "b.xml").write_text(INCLUDE)
+    (tmp_path / "c.xml").write_text("<manifest><broken></manifest>")
+
+    result = _convert(tmp_path, "a.xml", "b.xml", "-o", "out.toml")
+    assert result.exit_code == 1
+    assert "--output is just allowed for a single MANIFEST" in result.output
+
+    result = _convert(tmp_path, "a.xml", "missing.xml", "b.xml", "c.xml")
+    assert result.exit_code == 1
+    lines = result.output.splitlines()
+    assert lines[0] == "Converted 'a.xml' to 'a.toml'."
+    assert lines[1].startswith("ERROR:") and "missing.xml" in lines[1]
+    assert lines[2] == "Converted 'b.xml' to 'b.toml'."
+    assert lines[3].startswith("ERROR:") and "c.xml" in lines[3]
+    assert GitWSManifestFormat().load(tmp_path / "b.toml") == ManifestSpec(
+        dependencies=[ProjectSpec(name="dep5", recursive=False)], group_filters=["-notdefault"]
+    )
+
+
+def test_convert_watch(tmp_path, monkeypatch):
+    """Watch Mode."""
+    (tmp_path / "default.xml").write_text(INCLUDE)
+    sleeps = []
+
+    def sleep(interval):
+        sleeps.append(interval)
+        if len(sleeps) == 2:
+            (tmp_path / "default.xml").write_text(INCLUDE.replace("dep5", "dep77"))
+        elif len(sleeps) == 4:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("gitwsrepo._cli.time.sleep", sleep)
+    result = _convert(tmp_path, "default.xml", "--watch", "--interval", "0.5")
+    assert result.exit_code == 0, result.output
+    assert result.output == "Converted 'default.xml' to 'default.toml'.\n" * 2
+    assert sleeps == [0.5] * 4
+    assert GitWSManifestFormat().load(tmp_path / "default.toml").dependencies == (
+        ProjectSpec(name="dep77", recursive=False),
+    )
@@ -0,0 +1,136 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Workspace Daemon Testing."""
+
+import threading
+import time
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from pytest import fixture, raises
+
+from gitwsrepo._cli import main
+from gitwsrepo._daemon import Daemon, request, request_list
+from gitwsrepo.const import LOCAL_MANIFESTS_PATH
+
+from .common import create_remotes, create_workspace
+
+LOCAL_MANIFEST = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remove-project name="dep3" />
+</manifest>
+"""
+
+
+@fixture
+def workspace(tmp_path):
+    """Synchronized Workspace."""
+    create_remotes(tmp_path / "remotes")
+    workspace = create_workspace(tmp_path / "workspace", tmp_path / "remotes")
+    with chdir(workspace):
+        assert CliRunner().invoke(main, ["sync"]).exit_code == 0
+    return workspace
+
+
+@fixture
+def daemon(workspace):
+    """Running Daemon."""
+    daemon = Daemon(workspace, interval=0.1)
+    thread = threading.Thread(target=daemon.serve)
+    thread.start()
+    for _ in range(100):
+        if request(workspace, "ping") is not None:
+            break
+        time.sleep(0.05)
+    yield daemon
+    daemon.stop()
+    thread.join()
+
+
+def _invoke(workspace, *args):
+    with chdir(workspace):
+        return CliRunner().invoke(main, args)
+
+
+def test_daemon(workspace, daemon):
+    """Commands Use The Daemon."""
+    requests = daemon.requests
+    result = _invoke(workspace, "status")
+    assert result.exit_code == 0, result.output
+    assert result.output == "nothing to commit (working directory clean)\n"
+    (workspace / "dep1" / "new.txt").write_text("new")
+    result = _invoke(workspace, "status")
+    assert result.exit_code == 0, result.output
+    assert " ?? new.txt" in result.output.splitlines()
+
+    result = _invoke(workspace, "forall", "-c", "echo $REPO_PATH")
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["dep1", "sub/dep2", "dep3"]
+    assert daemon.requests == requests + 3
+
+    assert request_list(workspace) == [("dep1", "dep1"), ("dep2", "sub/dep2"), ("dep3", "dep3")]
+
+    result = _invoke(workspace, "list", "--path-prefix", "sub")
+    assert result.exit_code == 0, result.output
+    assert result.output == "sub/dep2 : dep2\n"
+    assert request_list(workspace, groups="all", regex="dep[34]") == [("dep3", "dep3"), ("dep4", "dep4")]
+
+
+def test_daemon_reload(workspace, daemon):
+    """Changed Manifests Are Reloaded."""
+    assert not daemon.refresh()
+    (workspace / LOCAL_MANIFESTS_PATH).mkdir()
+    (workspace / LOCAL_MANIFESTS_PATH / "local.xml").write_text(LOCAL_MANIFEST)
+    result = _invoke(workspace, "forall", "-c", "echo $REPO_PATH")
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["dep1", "sub/dep2"]
+
+    # broken manifests are reported by the in-process fallback
+    (workspace / LOCAL_MANIFESTS_PATH / "local.xml").write_text("<manifest>")
+    assert daemon.refresh()
+    assert request(workspace, "list") is None
+    result = _invoke(workspace, "forall", "-c", "echo $REPO_PATH")
+    assert result.exit_code == 1
+    assert "local.xml" in result.output
+
+
+def test_daemon_cli(workspace, daemon):
+    """Start And Stop."""
+    with raises(ValueError, match="Daemon is already running"):
+        Daemon(workspace).serve()
+    result = _invoke(workspace, "daemon", "start")
+    assert result.exit_code == 1
+    assert "Error: Daemon is already running" in result.output
+    assert request(workspace, "unknown") is None
+
+    result = _invoke(workspace, "daemon", "stop")
+    assert result.exit_code == 0, result.output
+    assert result.output == "Daemon stopped.\n"
+    for _ in range(100):
+        if request(workspace, "ping") is None:
+            break
+        time.sleep(0.05)
+
+    result = _invoke(workspace, "daemon", "stop")
+    assert result.exit_code == 1
+    assert "Error: Daemon is not running" in result.output
+
+    # fallback
+    result = _invoke(workspace, "status")
+    assert result.exit_code == 0, result.output
+    assert result.output == "nothing to commit (working directory clean)\n"
@@ -0,0 +1,103 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Manifest Comparison Testing."""
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+
+from gitwsrepo._cli import main
+
+from .common import commit, create_remotes, create_workspace, run_git
+
+OLD = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remote name="origin" fetch=".." />
+  <default remote="origin" revision="main" />
+  <project name="dep1" revision="{dep1}" />
+  <project name="dep2" path="sub/dep2" />
+  <project name="dep3" revision="v1.0" />
+  <project name="dep4" />
+</manifest>
+"""
+
+NEW = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remote name="origin" fetch=".." />
+  <default remote="origin" revision="main" />
+  <project name="dep1" revision="{dep1}" />
+  <project name="dep2" path="dep2" />
+  <project name="dep3" revision="v2.0" />
+  <project name="dep5" />
+</manifest>
+"""
+
+
+def _diffmanifests(path, *args):
+    with chdir(path):
+        return CliRunner().invoke(main, ["diffmanifests", *args])
+
+
+def test_diffmanifests(tmp_path):
+    """Added, Removed, Moved And Changed Projects."""
+    (tmp_path / "old.xml").write_text(OLD.format(dep1="main"))
+    (tmp_path / "new.xml").write_text(NEW.format(dep1="main"))
+    result = _diffmanifests(tmp_path, "old.xml", "new.xml")
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        "added projects:",
+        "    dep5 at revision main",
+        "removed projects:",
+        "    dep4 at revision main",
+        "changed projects:",
+        "    dep2 moved from sub/dep2 to dep2",
+        "    dep3 changed from v1.0 to v2.0",
+    ]
+
+    result = _diffmanifests(tmp_path, "old.xml", "old.xml")
+    assert result.exit_code == 0, result.output
+    assert result.output == "Manifests are identical.\n"
+
+
+def test_diffmanifests_missing(tmp_path):
+    """Missing Manifest."""
+    (tmp_path / "old.xml").write_text(OLD.format(dep1="main"))
+    result = _diffmanifests(tmp_path, "old.xml", "missing.xml")
+    assert result.exit_code == 1
+    assert "missing.xml" in result.output
+
+
+def test_diffmanifests_log(tmp_path):
+    """Commit Ranges Of Changed Projects."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    with chdir(workspace):
+        assert CliRunner().invoke(main, ["sync"]).exit_code == 0
+    old = run_git(remotes / "dep1", "rev-parse", "HEAD")
+    new = commit(remotes / "dep1", {"data.txt": "changed"}, msg="Change data")
+    run_git(workspace / "dep1", "fetch", "--quiet")
+    (tmp_path / "old.xml").write_text(OLD.format(dep1=old))
+    (tmp_path / "new.xml").write_text(NEW.format(dep1=new))
+
+    result = _diffmanifests(workspace, str(tmp_path / "old.xml"), str(tmp_path / "new.xml"), "--log")
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert f"    dep1 changed from {old} to {new}" in lines
+    assert f"        + {new[:7]} Change data" in lines
+    assert "WARNING: dep3: Cannot list commits: 'git log --left-right" in result.output
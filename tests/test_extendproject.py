@@ -0,0 +1,126 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Extend And Remove Project Testing."""
+
+import re
+
+from gitws import ManifestError, ProjectSpec
+from pytest import raises
+
+from gitwsrepo import RepoManifestFormat
+from gitwsrepo.const import LOCAL_MANIFESTS_PATH, MANIFESTS_PATH
+
+DEFAULT = """\
+<manifest>
+  <remote name="origin" fetch=".." />
+  <remote name="other" fetch="https://other.example.com" />
+  <default remote="origin" revision="main" />
+  <project name="dep1" groups="abc" clone-depth="1" />
+  <project name="dep2" />
+  <project name="dup1" path="sub/dup" />
+  <project name="dup2" path="other/dup" />
+  <project name="dep3" />
+</manifest>
+"""
+
+
+def _load(tmp_path, local):
+    manifests_path = tmp_path / MANIFESTS_PATH
+    manifests_path.mkdir(parents=True)
+    (manifests_path / "default.xml").write_text(DEFAULT)
+    local_manifests_path = tmp_path / LOCAL_MANIFESTS_PATH
+    local_manifests_path.mkdir(parents=True)
+    (local_manifests_path / "local.xml").write_text(f"<manifest>{local}</manifest>")
+    return RepoManifestFormat().load_repo_manifest(manifests_path / "default.xml")
+
+
+def test_extend_project(tmp_path):
+    """Extend Project Updates In Place."""
+    manifest = _load(
+        tmp_path,
+        """
+        <extend-project name="dep1" dest-path="moved/dep1" groups="abc, def" revision="v1" remote="other" />
+        <extend-project name="dup2" path="other/dup" revision="v2" upstream="main" />
+        <extend-project name="dep3" revision="v3" />
+        <project name="dep4" />
+        """,
+    )
+    assert manifest.spec.dependencies == (
+        ProjectSpec(
+            name="dep1", path="moved/dep1", groups=("abc", "def"), revision="v1", remote="other", recursive=False
+        ),
+        ProjectSpec(name="dep2", recursive=False),
+        ProjectSpec(name="dup1", path="sub/dup", recursive=False),
+        ProjectSpec(name="dup2", path="other/dup", revision="v2", recursive=False),
+        ProjectSpec(name="dep3", revision="v3", recursive=False),
+        ProjectSpec(name="dep4", recursive=False),
+    )
+    assert manifest.clone_depths == {"moved/dep1": 1}
+
+
+def test_remove_project(tmp_path):
+    """Remove Project By Name Or Path."""
+    manifest = _load(
+        tmp_path,
+        """
+        <remove-project name="dep1" />
+        <remove-project path="other/dup" />
+        <remove-project name="unknown" optional="true" />
+        <project name="dep1" path="dep1" />
+        """,
+    )
+    assert manifest.spec.dependencies == (
+        ProjectSpec(name="dep2", recursive=False),
+        ProjectSpec(name="dup1", path="sub/dup", recursive=False),
+        ProjectSpec(name="dep3", recursive=False),
+        ProjectSpec(name="dep1", path="dep1", recursive=False),
+    )
+    assert manifest.clone_depths == {}
+
+    manifest = _load(tmp_path / "both", '<remove-project name="dup1" path="sub/dup" /><remove-project name="dep2" />')
+    assert [project.name for project in manifest.spec.dependencies] == ["dep1", "dup2", "dep3"]
+
+
+def test_unknown_project(tmp_path):
+    """Directives On Unknown Projects."""
+    with raises(ManifestError, match=re.escape('Unknown project in <extend-project name="dup1" path="other/dup" />')):
+        _load(tmp_path / "extend", '<extend-project name="dup1" path="other/dup" />')
+    with raises(ManifestError, match=re.escape('Unknown project in <remove-project name="unknown" />')):
+        _load(tmp_path / "remove", '<remove-project name="unknown" />')
+    with raises(ManifestError, match=re.escape("<remove-project />")):
+        _load(tmp_path / "empty", "<remove-project />")
+
+
+def test_duplicate_path(tmp_path):
+    """Project Paths Are Unique."""
+    with raises(ManifestError, match=re.escape("Duplicate project path 'sub/dup'")):
+        _load(tmp_path / "add", '<project name="other" path="sub/dup" />')
+    with raises(ManifestError, match=re.escape("Duplicate project path 'dep2' in <extend-project name=\"dep1\"")):
+        _load(tmp_path / "move", '<extend-project name="dep1" dest-path="dep2" />')
+
+    # the path of a removed or moved project is free again
+    manifest = _load(
+        tmp_path / "free",
+        """
+        <extend-project name="dep1" dest-path="moved/dep1" />
+        <remove-project path="sub/dup" />
+        <project name="new1" path="dep1" />
+        <project name="new2" path="sub/dup" />
+        <remove-project path="dep1" />
+        """,
+    )
+    assert [project.name for project in manifest.spec.dependencies] == ["dep1", "dep2", "dup2", "dep3", "new2"]
@@ -0,0 +1,147 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Links And Copies Testing."""
+
+import os
+from pathlib import Path
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from gitws import FileRef, Project
+
+from gitwsrepo._cli import main
+from gitwsrepo._filerefs import apply_filerefs
+from gitwsrepo.datamodel import SyncState
+
+from .common import MANIFEST, create_remotes, create_workspace
+
+MANIFEST_FILEREFS = MANIFEST.replace(
+    '<project name="dep1" />',
+    '<project name="dep1">'
+    '<linkfile src="data.txt" dest="links/dep1.txt" />'
+    '<copyfile src="data.txt" dest="dep1.txt" />'
+    "</project>",
+)
+
+
+def _echo(lines):
+    def echo(message, **kwargs):
+        lines.append(message)
+
+    return echo
+
+
+def test_sync(tmp_path):
+    """Sync Applies Links And Copies."""
+    create_remotes(tmp_path / "remotes", manifest=MANIFEST_FILEREFS)
+    workspace = create_workspace(tmp_path / "workspace", tmp_path / "remotes")
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert "links/dep1.txt: Linked 'dep1/data.txt'." in result.output
+    assert "dep1.txt: Copied 'dep1/data.txt'." in result.output
+    assert (workspace / "links" / "dep1.txt").readlink() == Path("..", "dep1", "data.txt")
+    assert (workspace / "dep1.txt").read_text() == "dep1"
+    assert sorted(SyncState.load(workspace).filerefs) == ["dep1.txt", "links/dep1.txt"]
+
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert "Linked" not in result.output
+    assert "Copied" not in result.output
+
+
+def test_apply(tmp_path):
+    """Unchanged Destinations Are Skipped, Stale Ones Removed."""
+    (tmp_path / "proj").mkdir()
+    (tmp_path / "proj" / "a.txt").write_text("a")
+    (tmp_path / "proj" / "b.txt").write_text("b")
+    link = FileRef(src="a.txt", dest="a.txt")
+    copy = FileRef(src="b.txt", dest="sub/b.txt")
+    project = Project(name="proj", path="proj", linkfiles=(link,), copyfiles=(copy,))
+    states: dict = {}
+    lines: list[str] = []
+
+    assert apply_filerefs(tmp_path, [project], states, secho=_echo(lines)) == 0
+    assert lines == ["a.txt: Linked 'proj/a.txt'.", "sub/b.txt: Copied 'proj/b.txt'."]
+    assert (tmp_path / "a.txt").read_text() == "a"
+    assert (tmp_path / "sub" / "b.txt").read_text() == "b"
+
+    # unchanged
+    lines.clear()
+    assert apply_filerefs(tmp_path, [project], states, secho=_echo(lines)) == 0
+    assert lines == []
+
+    # touched, same content
+    os.utime(tmp_path / "sub" / "b.txt", ns=(0, 0))
+    assert apply_filerefs(tmp_path, [project], states, secho=_echo(lines)) == 0
+    assert lines == []
+    assert (tmp_path / "sub" / "b.txt").stat().st_mtime_ns == (tmp_path / "proj" / "b.txt").stat().st_mtime_ns
+
+    # changed source
+    (tmp_path / "proj" / "b.txt").write_text("bb")
+    assert apply_filerefs(tmp_path, [project], states, secho=_echo(lines)) == 0
+    assert lines == ["sub/b.txt: Copied 'proj/b.txt'."]
+    assert (tmp_path / "sub" / "b.txt").read_text() == "bb"
+
+    # replaced link
+    lines.clear()
+    (tmp_path / "a.txt").unlink()
+    (tmp_path / "a.txt").write_text("other")
+    assert apply_filerefs(tmp_path, [project], states, secho=_echo(lines)) == 0
+    assert lines == ["a.txt: Linked 'proj/a.txt'."]
+    assert (tmp_path / "a.txt").is_symlink()
+
+    # stale
+    lines.clear()
+    assert apply_filerefs(tmp_path, [project.model_copy(update={"linkfiles": ()})], states, secho=_echo(lines)) == 0
+    assert lines == ["a.txt: Removed."]
+    assert not (tmp_path / "a.txt").exists()
+    assert sorted(states) == ["sub/b.txt"]
+
+
+def test_apply_stale_modified(tmp_path, caplog):
+    """Modified Stale Copies Are Kept."""
+    (tmp_path / "proj").mkdir()
+    (tmp_path / "proj" / "b.txt").write_text("b")
+    project = Project(name="proj", path="proj", copyfiles=(FileRef(src="b.txt", dest="b.txt"),))
+    states: dict = {}
+    assert apply_filerefs(tmp_path, [project], states) == 0
+    (tmp_path / "b.txt").write_text("modified")
+
+    assert apply_filerefs(tmp_path, [Project(name="proj", path="proj")], states) == 0
+    assert (tmp_path / "b.txt").read_text() == "modified"
+    assert "b.txt: Modified, not removed" in caplog.text
+    assert states == {}
+
+
+def test_apply_errors(tmp_path, caplog):
+    """Invalid Links And Copies Are Reported."""
+    (tmp_path / "proj").mkdir()
+    project = Project(
+        name="proj",
+        path="proj",
+        linkfiles=(FileRef(src="a.txt", dest="../a.txt"), FileRef(src="a.txt", dest="a.txt")),
+        copyfiles=(FileRef(src="a.txt", dest="a.txt"), FileRef(src="missing.txt", dest="m.txt")),
+    )
+    missing = Project(name="missing", path="missing", linkfiles=(FileRef(src="a.txt", dest="x.txt"),))
+    states: dict = {}
+    assert apply_filerefs(tmp_path, [project, missing], states) == 3
+    assert "proj: Cannot link '../a.txt': Outside workspace" in caplog.text
+    assert "proj: Cannot copy 'a.txt': Already used by 'proj/a.txt'" in caplog.text
+    assert "m.txt: Cannot copy 'proj/missing.txt'" in caplog.text
+    assert sorted(states) == ["a.txt"]
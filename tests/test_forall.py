@@ -0,0 +1,86 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Forall Testing."""
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from pytest import fixture
+
+from gitwsrepo._cli import main
+from gitwsrepo.datamodel import RepoConfig
+
+from .common import create_remotes, create_workspace
+
+
+@fixture
+def remotes(tmp_path):
+    """Remote Repositories."""
+    create_remotes(tmp_path / "remotes")
+    return tmp_path / "remotes"
+
+
+def _run(workspace, *args):
+    with chdir(workspace):
+        return CliRunner().invoke(main, list(args))
+
+
+def test_forall(tmp_path, remotes):
+    """Outputs In Project Order."""
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    result = _run(workspace, "forall", "-c", "echo $REPO_PATH")
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+
+    assert _run(workspace, "sync").exit_code == 0
+    command = "sleep 0.$((3 - REPO_I)); echo $REPO_PROJECT $REPO_PATH $REPO_RREV $REPO_I/$REPO_COUNT; cat data.txt"
+    result = _run(workspace, "forall", "-j", "3", "-p", "-c", command)
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        "project dep1/",
+        "dep1 dep1 main 1/3",
+        "dep1",
+        "project sub/dep2/",
+        "dep2 sub/dep2 main 2/3",
+        "dep2",
+        "project dep3/",
+        "dep3 dep3 v1.0 3/3",
+        "dep3",
+    ]
+
+
+def test_forall_error(tmp_path, remotes):
+    """Failing Commands Are Reported."""
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    assert _run(workspace, "sync").exit_code == 0
+    result = _run(workspace, "forall", "-c", 'test "$REPO_PATH" != dep3 && echo ok')
+    assert result.exit_code == 1
+    assert "ok\nok\n" in result.output
+    assert "dep3: Command failed with exit code 1" in result.output
+    assert "Aborted!" in result.output
+
+
+def test_forall_mirror(tmp_path, remotes):
+    """Commands Run In The Bare Repositories Of A Mirror Workspace."""
+    mirror = create_workspace(tmp_path / "mirror", remotes, config=RepoConfig(mirror=True))
+    assert _run(mirror, "sync").exit_code == 0
+    result = _run(mirror, "forall", "-c", "git rev-parse --is-bare-repository")
+    assert result.exit_code == 0, result.output
+    assert result.output == "true\ntrue\ntrue\n"
+
+    result = _run(mirror, "status")
+    assert result.exit_code == 1
+    assert "A mirror workspace does not have any status" in result.output
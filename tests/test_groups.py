@@ -0,0 +1,86 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Group Index And Group Selection Testing."""
+
+import random
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from gitws import ProjectSpec
+from gitws._iters import create_filter
+from gitws.datamodel import group_selects_from_filters
+from pytest import mark
+
+from gitwsrepo._cli import main
+from gitwsrepo._groupindex import GroupIndex
+
+from .common import create_remotes
+
+GROUPS = ("pdk", "device", "notdefault", "docs")
+
+FILTERS = (
+    (),
+    ("-notdefault",),
+    ("-notdefault", "+pdk"),
+    ("-device",),
+    ("-pdk", "-device"),
+    ("-@sub/*",),
+    ("-notdefault", "+notdefault@sub/*"),
+    ("-device", "+@sub/p1*", "-docs@*"),
+)
+
+
+def _create_projects(count, seed=0):
+    rand = random.Random(seed)  # noqa: S311
+    projects = []
+    for idx in range(count):
+        project = ProjectSpec(name=f"p{idx}", groups=tuple(rand.sample(GROUPS, rand.randint(0, 2))))
+        if rand.random() < 0.3:
+            project = project.model_copy(update={"path": f"sub/p{idx}"})
+        projects.append(project)
+    return projects
+
+
+@mark.parametrize("group_filters", FILTERS)
+@mark.parametrize("default", [True, False])
+def test_select(group_filters, default):
+    """Bitmap Selection Equals Per Project Filtering."""
+    projects = _create_projects(200)
+    index = GroupIndex(projects)
+    groupfilter = create_filter(group_selects_from_filters(group_filters), default=default)
+    expected = tuple(
+        idx for idx, project in enumerate(projects) if groupfilter(project.path or project.name, project.groups)
+    )
+    assert index.select(group_filters, default=default) == expected
+    assert index.select(group_filters, default=default) is index.select(group_filters, default=default)
+
+
+def test_init_groups(tmp_path):
+    """Groups Are Applied On Init And Kept For Sync."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["init", "-u", (remotes / "manifests").as_uri(), "-g", "all,-abc"])
+        assert result.exit_code == 0, result.output
+        result = CliRunner().invoke(main, ["sync"])
+        assert result.exit_code == 0, result.output
+    assert (workspace / "dep1" / "data.txt").exists()
+    assert not (workspace / "sub" / "dep2").exists()
+    assert (workspace / "dep3" / "data.txt").exists()
+    assert (workspace / "dep4" / "data.txt").exists()
@@ -0,0 +1,162 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Include And Local Manifest Testing."""
+
+import re
+
+from gitws import ManifestError, ProjectSpec, Remote
+from pytest import raises
+
+from gitwsrepo import RepoManifestFormat
+from gitwsrepo.const import LOCAL_MANIFESTS_PATH, MANIFESTS_PATH
+from gitwsrepo.repomanifestformat import _FRAGMENTS
+
+DEFAULT = """\
+<manifest>
+  <remote name="origin" fetch=".." />
+  <default remote="origin" revision="main" />
+  <project name="dep1" />
+  <include name="sub/vendor.xml" />
+  <project name="dep2" />
+  <include name="common.xml" />
+</manifest>
+"""
+
+VENDOR = """\
+<manifest>
+  <remote name="vendor" fetch="https://vendor.example.com" />
+  <project name="vdep1" remote="vendor" clone-depth="1" />
+  <include name="common.xml" />
+</manifest>
+"""
+
+COMMON = """\
+<manifest>
+  <project name="common" />
+</manifest>
+"""
+
+
+def _create(path, files):
+    path.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        filepath = path / name
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(content)
+
+
+def _names(manifest):
+    return [project.name for project in manifest.spec.dependencies]
+
+
+def test_include(tmp_path):
+    """Includes Are Merged In Document Order And At Most Once."""
+    _create(tmp_path, {"default.xml": DEFAULT, "sub/vendor.xml": VENDOR, "common.xml": COMMON})
+    manifest = RepoManifestFormat().load_repo_manifest(tmp_path / "default.xml")
+    assert _names(manifest) == ["dep1", "vdep1", "common", "dep2"]
+    assert manifest.spec.remotes == (
+        Remote(name="origin", url_base=".."),
+        Remote(name="vendor", url_base="https://vendor.example.com"),
+    )
+    assert manifest.get_clone_depth("vdep1") == 1
+    assert manifest.spec.dependencies[1] == ProjectSpec(name="vdep1", remote="vendor", recursive=False)
+
+
+def test_include_cycle(tmp_path):
+    """Include Cycles Are Detected."""
+    _create(
+        tmp_path,
+        {
+            "default.xml": '<manifest><include name="a.xml"/></manifest>',
+            "a.xml": '<manifest><include name="b.xml"/></manifest>',
+            "b.xml": '<manifest><include name="a.xml"/></manifest>',
+        },
+    )
+    with raises(ManifestError, match=re.escape("Include cycle 'default.xml' -> 'a.xml' -> 'b.xml' -> 'a.xml'")):
+        RepoManifestFormat().load(tmp_path / "default.xml")
+
+
+def test_include_missing(tmp_path):
+    """Missing Include."""
+    _create(tmp_path, {"default.xml": '<manifest><include name="a.xml"/></manifest>'})
+    with raises(ManifestError, match=re.escape("Included manifest 'a.xml' not found")):
+        RepoManifestFormat().load(tmp_path / "default.xml")
+    _create(tmp_path, {"default.xml": "<manifest><include /></manifest>"})
+    with raises(ManifestError, match="<include />"):
+        RepoManifestFormat().load(tmp_path / "default.xml")
+
+
+def test_include_changed(tmp_path, monkeypatch):
+    """Only Changed Files Are Converted Again."""
+    _create(tmp_path, {"default.xml": DEFAULT, "sub/vendor.xml": VENDOR, "common.xml": COMMON})
+    manifest_format = RepoManifestFormat()
+    manifest_format.load(tmp_path / "default.xml")
+
+    from gitwsrepo.repomanifestformat import _FileLoader
+
+    converted = []
+    orig = _FileLoader.load
+
+    def load(self, source):
+        converted.append(self.path.name)
+        return orig(self, source)
+
+    monkeypatch.setattr(_FileLoader, "load", load)
+    (tmp_path / "common.xml").write_text(COMMON.replace("common", "common2"))
+    manifest = manifest_format.load_repo_manifest(tmp_path / "default.xml")
+    assert converted == ["common.xml"]
+    assert _names(manifest) == ["dep1", "vdep1", "common2", "dep2"]
+
+    # touched, but same content
+    (tmp_path / "sub" / "vendor.xml").write_text(VENDOR)
+    manifest_format.load(tmp_path / "default.xml")
+    assert converted == ["common.xml"]
+
+
+def test_local_manifests(tmp_path):
+    """Local Manifests Are Merged After The Manifest."""
+    manifests_path = tmp_path / MANIFESTS_PATH
+    _create(manifests_path, {"default.xml": DEFAULT, "sub/vendor.xml": VENDOR, "common.xml": COMMON})
+    local_manifests_path = tmp_path / LOCAL_MANIFESTS_PATH
+    _create(
+        local_manifests_path,
+        {
+            "b.xml": '<manifest><project name="local-b" /></manifest>',
+            "a.xml": '<manifest><project name="local-a" /></manifest>',
+            "readme.txt": "",
+        },
+    )
+    manifest = RepoManifestFormat().load_repo_manifest(manifests_path / "default.xml")
+    assert _names(manifest) == ["dep1", "vdep1", "common", "dep2", "local-a", "local-b"]
+
+
+def test_include_parallel(tmp_path):
+    """Parallel Conversion Merges In Include Order And Reports Errors Like Sequential Conversion."""
+    _create(tmp_path, {"default.xml": DEFAULT, "sub/vendor.xml": VENDOR, "common.xml": COMMON})
+    _FRAGMENTS.clear()
+    manifest = RepoManifestFormat(jobs=2).load_repo_manifest(tmp_path / "default.xml")
+    assert _names(manifest) == ["dep1", "vdep1", "common", "dep2"]
+    assert manifest == RepoManifestFormat().load_repo_manifest(tmp_path / "default.xml")
+
+    (tmp_path / "common.xml").write_text('<manifest><project name="../common" /></manifest>')
+    with raises(ManifestError) as sequential:
+        RepoManifestFormat().load(tmp_path / "default.xml")
+    _FRAGMENTS.clear()
+    with raises(ManifestError) as parallel:
+        RepoManifestFormat(jobs=2).load(tmp_path / "default.xml")
+    assert str(parallel.value) == str(sequential.value)
+    assert "common.xml" in str(parallel.value)
@@ -0,0 +1,211 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Init And Shallow/Partial Clone Testing."""
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from gitws.const import INFO_PATH
+
+from gitwsrepo._cli import main
+from gitwsrepo.const import MANIFESTS_PATH
+from gitwsrepo.datamodel import RepoConfig
+
+from .common import commit, create_remotes, create_workspace, run_git
+
+MANIFEST = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remote name="origin" fetch=".." />
+  <default remote="origin" revision="main" clone-depth="2" />
+  <project name="dep1" clone-depth="1" />
+  <project name="dep2" />
+  <project name="dep3" revision="v1.0" />
+</manifest>
+"""
+
+
+def _add_commits(remotes):
+    for name in ("dep1", "dep2", "dep3"):
+        for idx in range(3):
+            commit(remotes / name, {"data.txt": f"{name}{idx}"})
+
+
+def _count(path):
+    return int(run_git(path, "rev-list", "--count", "HEAD"))
+
+
+def _objects(path):
+    """Number Of Objects In The Repository At ``path`` - As Transferred."""
+    lines = run_git(path, "count-objects", "-v").splitlines()
+    values = dict(line.split(": ", 1) for line in lines)
+    return int(values["count"]) + int(values["in-pack"])
+
+
+def _missing(path):
+    """Number Of Objects Referenced, But Left Out By The Partial Clone Filter."""
+    lines = run_git(path, "rev-list", "--objects", "--all", "--missing=print").splitlines()
+    return sum(1 for line in lines if line.startswith("?"))
+
+
+def test_init(tmp_path):
+    """Initialize Workspace."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    with chdir(workspace):
+        result = CliRunner().invoke(
+            main, ["init", "-u", (remotes / "manifests").as_uri(), "--depth", "3", "--partial-clone"]
+        )
+        assert result.exit_code == 0, result.output
+        assert "repo sync" in result.output
+        assert (workspace / INFO_PATH).exists()
+        assert (workspace / MANIFESTS_PATH / "default.xml").exists()
+        assert RepoConfig.load(workspace) == RepoConfig(depth=3, clone_filter="blob:none")
+
+        result = CliRunner().invoke(main, ["init", "-u", (remotes / "manifests").as_uri()])
+        assert result.exit_code == 1
+
+
+def test_clone_depth(tmp_path):
+    """Project And Default Clone Depth."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes, manifest=MANIFEST)
+    _add_commits(remotes)
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert _count(workspace / "dep1") == 1
+    assert _count(workspace / "dep2") == 2
+    assert _count(workspace / "dep3") == 1
+    assert (workspace / "dep3" / "data.txt").read_text() == "dep3"
+    # just commit, tree and blob of the last commits are transferred: 4 commits with 3 objects each remotely
+    assert _objects(remotes / "dep2") == 12
+    assert _objects(workspace / "dep1") == 3
+    assert _objects(workspace / "dep2") == 6
+    assert _objects(workspace / "dep3") == 3
+
+    commit(remotes / "dep2", {"data.txt": "new"})
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert (workspace / "dep2" / "data.txt").read_text() == "new"
+    assert _count(workspace / "dep2") == 2
+
+
+MANIFEST_BRANCHES = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remote name="origin" fetch=".." />
+  <default remote="origin" revision="main" clone-depth="2" />
+  <project name="dep1" revision="refs/heads/dev" />
+  <project name="dep3" revision="refs/tags/v1.0" />
+</manifest>
+"""
+
+
+def test_clone_depth_branches(tmp_path):
+    """Shallow Clones Of Branch References And Revision Changes To Other Branches."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes, manifest=MANIFEST_BRANCHES)
+    _add_commits(remotes)
+    for branch in ("dev", "feature"):
+        run_git(remotes / "dep1", "checkout", "--quiet", "-b", branch, "main")
+        commit(remotes / "dep1", {"data.txt": branch})
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert run_git(workspace / "dep1", "branch", "--show-current") == "dev"
+    assert (workspace / "dep1" / "data.txt").read_text() == "dev"
+    assert _count(workspace / "dep1") == 2
+    assert (workspace / "dep3" / "data.txt").read_text() == "dep3"
+    assert _count(workspace / "dep3") == 1
+
+    manifest_path = workspace / MANIFESTS_PATH / "default.xml"
+    manifest_path.write_text(manifest_path.read_text().replace("refs/heads/dev", "feature"))
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert run_git(workspace / "dep1", "branch", "--show-current") == "feature"
+    assert (workspace / "dep1" / "data.txt").read_text() == "feature"
+
+    sha = commit(remotes / "dep1", {"data.txt": "feature2"})
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert run_git(workspace / "dep1", "rev-parse", "HEAD") == sha
+    assert _count(workspace / "dep1") == 2
+
+
+def test_partial_clone(tmp_path):
+    """Workspace Depth And Partial Clone."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    _add_commits(remotes)
+    config = RepoConfig(depth=2, clone_filter="blob:none")
+    workspace = create_workspace(tmp_path / "workspace", remotes, config=config)
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert _count(workspace / "dep1") == 2
+    assert run_git(workspace / "dep1", "config", "remote.origin.partialclonefilter") == "blob:none"
+    assert (workspace / "dep1" / "data.txt").read_text() == "dep12"
+    # 2 commits and trees, but just the checked out blob
+    assert _objects(workspace / "dep1") == 5
+    assert _missing(workspace / "dep1") == 1
+
+
+def test_mirror_reference(tmp_path):
+    """Mirror Workspace And Reference."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    mirror = create_workspace(tmp_path / "mirror", remotes, config=RepoConfig(mirror=True))
+    with chdir(mirror):
+        result = CliRunner().invoke(main, ["sync"])
+        assert result.exit_code == 0, result.output
+    assert run_git(mirror / "dep1.git", "rev-parse", "--is-bare-repository") == "true"
+    assert not (mirror / "dep1").exists()
+
+    sha = commit(remotes / "dep1", {"data.txt": "changed"})
+    with chdir(mirror):
+        result = CliRunner().invoke(main, ["sync"])
+        assert result.exit_code == 0, result.output
+    assert run_git(mirror / "dep1.git", "rev-parse", "main") == sha
+
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["init", "-u", (remotes / "manifests").as_uri(), "--reference", str(mirror)])
+        assert result.exit_code == 0, result.output
+        result = CliRunner().invoke(main, ["sync"])
+        assert result.exit_code == 0, result.output
+    assert (workspace / "dep1" / "data.txt").read_text() == "changed"
+    alternates = workspace / "dep1" / ".git" / "objects" / "info" / "alternates"
+    assert alternates.read_text().strip() == str(mirror / "dep1.git" / "objects")
+    assert "in-pack: 0" in run_git(workspace / "dep1", "count-objects", "-v")
+
+
+def test_mirror_shallow(tmp_path):
+    """Mirror cannot be shallow."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    with chdir(tmp_path):
+        result = CliRunner().invoke(main, ["init", "-u", (remotes / "manifests").as_uri(), "--mirror", "--depth", "1"])
+    assert result.exit_code == 1
+    assert "A mirror cannot be shallow or partial" in result.output
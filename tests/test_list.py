@@ -0,0 +1,103 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Project Listing Testing."""
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from pytest import fixture
+
+from gitwsrepo._cli import main
+from gitwsrepo._pathindex import PathIndex
+from gitwsrepo.repomanifestformat import RepoManifestFormat
+
+from .common import MANIFEST, TESTDATA_PATH, create_remotes, create_workspace
+
+MANIFEST_NESTED = MANIFEST.replace(
+    '<project name="dep1" />', '<project name="dep1"><project name="-nested" path="nested" /></project>'
+)
+
+
+@fixture
+def workspace(tmp_path):
+    """Workspace With Nested Project."""
+    create_remotes(tmp_path / "remotes", manifest=MANIFEST_NESTED)
+    return create_workspace(tmp_path / "workspace", tmp_path / "remotes")
+
+
+def _list(path, *args):
+    with chdir(path):
+        return CliRunner().invoke(main, ["list", *args])
+
+
+def test_list(workspace):
+    """List And Filter."""
+    result = _list(workspace)
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["dep1 : dep1", "dep1/nested : dep1-nested", "sub/dep2 : dep2", "dep3 : dep3"]
+
+    result = _list(workspace, "-g", "all,-abc", "-n")
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["dep1", "dep1-nested", "dep3", "dep4"]
+
+    result = _list(workspace, "--path-prefix", "dep1", "-p")
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["dep1", "dep1/nested"]
+
+    result = _list(workspace, "--regex", "dep[23]$")
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["sub/dep2 : dep2", "dep3 : dep3"]
+
+    result = _list(workspace, "--regex", "missing")
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+
+
+def test_list_paths(workspace):
+    """Projects Owning Paths."""
+    result = _list(workspace, "dep1/nested/src/main.c", "dep1/README", "sub/dep2")
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == ["dep1 : dep1", "dep1/nested : dep1-nested", "sub/dep2 : dep2"]
+
+    (workspace / "sub" / "dep2").mkdir(parents=True)
+    result = _list(workspace / "sub" / "dep2", ".")
+    assert result.exit_code == 0, result.output
+    assert result.output == "sub/dep2 : dep2\n"
+
+    result = _list(workspace, "sub")
+    assert result.exit_code == 1
+    assert "Error: No project at 'sub'" in result.output
+
+    result = _list(workspace, "..")
+    assert result.exit_code == 1
+    assert "is outside of the workspace" in result.output
+
+
+def test_path_index():
+    """Path Index Of A Large Manifest."""
+    manifest = RepoManifestFormat().load_repo_manifest(TESTDATA_PATH / "repo.xml")
+    index = manifest.path_index
+    assert isinstance(index, PathIndex)
+    assert list(index.paths) == sorted(index.paths)
+    projects = manifest.spec.dependencies
+    assert projects[index.find("build/soong/ui/build.go")].path == "build/soong"
+    assert projects[index.find("device/generic/goldfish-opengl")].path == "device/generic/goldfish-opengl"
+    assert index.find("device/generic") is None
+    selected = [projects[idx].path for idx in index.select_prefix("device/generic")]
+    assert selected == [
+        project.path for project in projects if project.path and project.path.startswith("device/generic/")
+    ]
+    assert "device/generic/goldfish" in selected
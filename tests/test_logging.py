@@ -0,0 +1,88 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Logging Testing."""
+
+import logging
+import threading
+
+from gitwsrepo._cli.logging import BufferedLogHandler, LogFormatter
+
+
+def _create(progress=False):
+    handler = BufferedLogHandler(progress=progress)
+    handler.formatter = LogFormatter(color=False)
+    logger = logging.getLogger("test-buffered")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return handler, logger
+
+
+def test_buffered(capsys):
+    """Records Of Many Threads Are Printed In Order Per Thread."""
+    handler, logger = _create()
+
+    def work(idx):
+        for msg in range(50):
+            logger.info("thread%d msg%d", idx, msg)
+
+    threads = [threading.Thread(target=work, args=(idx,)) for idx in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not handler.has_errors
+    logger.warning("warning")
+    logger.error("error")
+    # immediately - not just after printing
+    assert handler.has_errors
+    handler.echo("echo")
+    handler.flush()
+    handler.close()
+
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert len(lines) == 8 * 50 + 1
+    for idx in range(8):
+        assert [line for line in lines if f"thread{idx} " in line] == [
+            f"INFO:    thread{idx} msg{msg}" for msg in range(50)
+        ]
+    assert lines[-1] == "echo"
+    assert captured.err == "WARNING: warning\nERROR:   error\n"
+
+
+def test_progress(capsys):
+    """Status Line Stays Below All Other Output."""
+    handler, logger = _create(progress=True)
+    handler.progress(0, 2)
+    handler.flush()
+    logger.warning("warning")
+    handler.progress(1, 2)
+    handler.progress(2, 2, failed=1)
+    handler.close()
+    err = capsys.readouterr().err
+    assert err.endswith("\r[##############################]   2/2 (1 failed)\n")
+    assert "WARNING: warning\n" in err
+    assert err.startswith("\r[                              ]   0/2")
+
+
+def test_progress_disabled(capsys):
+    """Progress Is Ignored Without Progress Mode."""
+    handler, _ = _create()
+    handler.progress(1, 2)
+    handler.close()
+    assert capsys.readouterr().err == ""
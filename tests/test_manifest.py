@@ -0,0 +1,78 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Manifest Command Testing."""
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from pytest import fixture
+
+from gitwsrepo import RepoManifestFormat
+from gitwsrepo._cli import main
+from gitwsrepo._git import get_head
+
+from .common import create_remotes, create_workspace, run_git
+
+
+@fixture
+def workspace(tmp_path):
+    """Synchronized Workspace."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    return workspace
+
+
+def test_manifest(workspace):
+    """Print Effective And Pinned Manifest."""
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["manifest"])
+    assert result.exit_code == 0, result.output
+    assert '<project name="dep1" />' in result.output
+    assert '<default remote="origin" revision="main" sync-j="2" />' in result.output
+
+    shas = {name: run_git(workspace / path, "rev-parse", "HEAD") for name, path in (("dep1", "dep1"), ("dep3", "dep3"))}
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["manifest", "-r", "-o", "pinned.xml"])
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+    pinned = RepoManifestFormat().load(workspace / "pinned.xml")
+    revisions = {project.name: project.revision for project in pinned.dependencies}
+    assert revisions["dep1"] == shas["dep1"]
+    assert revisions["dep3"] == shas["dep3"]
+    assert revisions["dep4"] is None  # not cloned
+
+
+def test_get_head(workspace, tmp_path):
+    """Read HEAD Without Git."""
+    path = workspace / "dep1"
+    sha = run_git(path, "rev-parse", "HEAD")
+    assert get_head(path) == sha
+    run_git(path, "pack-refs", "--all")
+    assert not (path / ".git" / "refs" / "heads" / "main").exists()
+    assert get_head(path) == sha
+    run_git(path, "checkout", "--quiet", "--detach")
+    assert get_head(path) == sha
+    run_git(path, "worktree", "add", "--quiet", str(tmp_path / "worktree"))
+    assert get_head(tmp_path / "worktree") == sha
+    run_git(path, "checkout", "--quiet", "--orphan", "empty")
+    assert get_head(path) is None
+    assert get_head(tmp_path / "missing") is None
+    run_git(tmp_path, "clone", "--quiet", "--bare", str(workspace / "dep3"), "bare.git")
+    assert get_head(tmp_path / "bare.git") == run_git(workspace / "dep3", "rev-parse", "main")
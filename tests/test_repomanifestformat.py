@@ -22,7 +22,7 @@ from contextlib_chdir import chdir
 from gitws import (
     Defaults,
     FileRef,
-    IncompatibleFormatError,
+    MainFileRef,
     ManifestError,
     ManifestNotFoundError,
     ManifestSpec,
@@ -34,7 +34,7 @@ from gitws._manifestformatmanager import get_manifest_format_manager
 from pytest import raises
 from test2ref import assert_refdata
 
-from gitwsrepo import RepoManifestFormat
+from gitwsrepo import RepoManifest, RepoManifestFormat
 
 from .common import TESTDATA_PATH, get_refdata_path
 
@@ -82,6 +82,14 @@ def test_default():
     assert manifest_format.load(filepath) == ManifestSpec(group_filters=("-notdefault",))
 
 
+def test_entities():
+    """Entities are forbidden."""
+    filepath = TESTDATA_PATH / "entities.xml"
+    manifest_format = RepoManifestFormat()
+    with raises(ManifestError):
+        manifest_format.load(filepath)
+
+
 def test_example(tmp_path, caplog):
     """Example."""
     with chdir(TESTDATA_PATH):
@@ -114,8 +122,8 @@ def test_example(tmp_path, caplog):
             ),
         )
 
-        with raises(IncompatibleFormatError):
-            manifest_format.save(ManifestSpec(), filepath)
+        manifest_format.save(manifest_spec, tmp_path / "example.xml")
+        assert manifest_format.load(tmp_path / "example.xml") == manifest_spec
 
     assert_refdata(test_example, tmp_path, caplog=caplog)
 
@@ -137,10 +145,92 @@ def test_repo(tmp_path, caplog):
         manifest_format = RepoManifestFormat()
         assert manifest_format.is_compatible(filepath)
 
-        with raises(IncompatibleFormatError):
-            manifest_format.save(ManifestSpec(), filepath)
-
         manifest_spec = manifest_format.load(filepath)
         save(manifest_spec, tmp_path / "gitws.toml")
 
     assert_refdata(test_repo, tmp_path, caplog=caplog)
+
+
+def test_repo_settings():
+    """Repo Specific Settings."""
+    manifest = RepoManifestFormat().load_repo_manifest(TESTDATA_PATH / "repo.xml")
+    assert manifest.sync_j == 4
+    assert manifest.clone_depth is None
+    assert manifest.get_clone_depth("device/amlogic/yukawa-kernel") == 2
+    assert manifest.get_clone_depth("build/make") is None
+
+
+def test_save_repo_manifest(tmp_path):
+    """Save Including Repo Specific Settings."""
+    manifest_format = RepoManifestFormat()
+    manifest = manifest_format.load_repo_manifest(TESTDATA_PATH / "repo.xml")
+    filepath = tmp_path / "sub" / "repo.xml"
+    manifest_format.save_repo_manifest(manifest, filepath)
+    assert manifest_format.load_repo_manifest(filepath) == manifest
+    assert manifest_format.dump_repo_manifest(manifest) == filepath.read_text()
+
+
+def test_save_unsupported(tmp_path):
+    """Settings Without Repo Equivalent."""
+    manifest_format = RepoManifestFormat()
+    spec = ManifestSpec(dependencies=[ProjectSpec(name="dep", url="https://example.com/dep")])
+    with raises(ValueError, match="'url' and 'sub-url' cannot be represented"):
+        manifest_format.save(spec, tmp_path / "default.xml")
+    spec = ManifestSpec(linkfiles=[MainFileRef(src="a", dest="b")])
+    with raises(ValueError, match="'linkfiles' and 'copyfiles' cannot be represented"):
+        manifest_format.dump(spec)
+
+
+def test_save_escape(tmp_path):
+    """Special Characters Are Escaped."""
+    manifest_format = RepoManifestFormat()
+    manifest = RepoManifest(
+        spec=ManifestSpec(
+            remotes=[Remote(name="origin", url_base="https://example.com/?a=1&b='2'")],
+            dependencies=[ProjectSpec(name='dep"<>', groups=("a", "b"), recursive=False)],
+            group_filters=["-notdefault"],
+        ),
+        sync_j=3,
+        clone_depth=2,
+    )
+    filepath = tmp_path / "default.xml"
+    manifest_format.save_repo_manifest(manifest, filepath)
+    assert manifest_format.load_repo_manifest(filepath) == manifest
+
+
+def test_sync_j_invalid(tmp_path):
+    """Invalid ``sync-j``."""
+    filepath = tmp_path / "default.xml"
+    filepath.write_text('<manifest><default sync-j="0"/></manifest>')
+    with raises(ManifestError, match="sync-j"):
+        RepoManifestFormat().load(filepath)
+
+
+def test_compact():
+    """Compact Mode Loads Equal Manifests With Shared Strings And Groups."""
+    for name in ("default.xml", "example.xml", "repo.xml"):
+        filepath = TESTDATA_PATH / name
+        default = RepoManifestFormat().load_repo_manifest(filepath)
+        compact = RepoManifestFormat(compact=True).load_repo_manifest(filepath)
+        assert compact == default, filepath
+        assert compact.spec.model_dump() == default.spec.model_dump(), filepath
+
+
+def test_compact_shared(tmp_path):
+    """Compact Mode Shares Group Tuples And Checks Like Default Mode."""
+    filepath = tmp_path / "default.xml"
+    filepath.write_text(
+        '<manifest><project name="a" groups="x,y" revision="v1"/><project name="b" groups="x, y" revision="v1"/>'
+        "</manifest>"
+    )
+    first, second = RepoManifestFormat(compact=True).load(filepath).dependencies
+    assert first.groups is second.groups
+    assert first.revision is second.revision
+
+    for project in ('name="../a"', 'name="a" path="sub/../../a"', 'name="a" groups="-x"'):
+        filepath.write_text(f"<manifest><project {project}/></manifest>")
+        with raises(ManifestError) as default:
+            RepoManifestFormat().load(filepath)
+        with raises(ManifestError) as compact:
+            RepoManifestFormat(compact=True).load(filepath)
+        assert str(compact.value) == str(default.value)
@@ -0,0 +1,116 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Remote Reference Resolution Testing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import fixture
+
+from gitwsrepo import _resolve
+from gitwsrepo._resolve import RefResolver
+
+from .common import create_repo, run_git
+
+
+@fixture
+def remotes(tmp_path):
+    """Bare Remote Repositories, Reachable Via ``file://``."""
+    for name in ("dep1", "dep2", "dep3"):
+        repo = create_repo(tmp_path / "src" / name, {"data.txt": name})
+        run_git(repo, "tag", "--annotate", "-m", "release", "v1.0")
+        run_git(tmp_path, "clone", "--quiet", "--bare", str(repo), str(tmp_path / "remotes" / f"{name}.git"))
+    return tmp_path / "remotes"
+
+
+@fixture
+def calls(monkeypatch):
+    """Recorded ``ls_remote`` Calls."""
+    calls = []
+    ls_remote = _resolve.ls_remote
+
+    def record(url, *patterns):
+        calls.append((url, patterns))
+        return ls_remote(url, *patterns)
+
+    monkeypatch.setattr(_resolve, "ls_remote", record)
+    return calls
+
+
+def test_resolve(remotes, calls):
+    """One ``ls-remote`` Per Repository With All Revisions."""
+    url1 = (remotes / "dep1.git").as_uri()
+    url2 = (remotes / "dep2.git").as_uri()
+    sha1 = run_git(remotes / "dep1.git", "rev-parse", "main")
+    sha2 = run_git(remotes / "dep2.git", "rev-parse", "main")
+    with ThreadPoolExecutor(2) as executor:
+        resolver = RefResolver(executor)
+        resolver.start([("remote", url1, "main"), ("remote", url1, "v1.0"), ("remote", url2, None)])
+        assert resolver.resolve(url1, "main") == sha1
+        assert resolver.resolve(url1, "v1.0") == sha1
+        assert resolver.resolve(url1, "refs/heads/main") == sha1
+        assert resolver.resolve(url1, "unknown") is None
+        assert resolver.resolve(url2, None) == sha2
+        assert resolver.resolve(url2, "main") is None
+
+        assert sorted(calls) == [
+            (url1, ("main", "main^{}", "v1.0", "v1.0^{}")),
+            (url2, ("HEAD",)),
+        ]
+
+        # not started before
+        url3 = (remotes / "dep3.git").as_uri()
+        assert resolver.resolve(url3, "main") == run_git(remotes / "dep3.git", "rev-parse", "main")
+        assert resolver.resolve(url3, "main") == run_git(remotes / "dep3.git", "rev-parse", "main")
+        assert len(calls) == 3
+
+
+def test_resolve_unreachable(tmp_path):
+    """Unreachable Repositories Resolve To ``None``."""
+    with ThreadPoolExecutor(1) as executor:
+        resolver = RefResolver(executor)
+        assert resolver.resolve((tmp_path / "missing.git").as_uri(), "main") is None
+
+
+def test_resolve_jobs_per_remote(remotes, monkeypatch):
+    """Concurrency Per Remote Is Limited."""
+    lock = threading.Lock()
+    active = {"remote1": 0, "remote2": 0}
+    maximum = dict(active)
+
+    def ls_remote(url, *patterns):
+        remote = "remote2" if url.endswith("dep3.git") else "remote1"
+        with lock:
+            active[remote] += 1
+            maximum[remote] = max(maximum[remote], active[remote])
+        time.sleep(0.05)
+        with lock:
+            active[remote] -= 1
+        return {}
+
+    monkeypatch.setattr(_resolve, "ls_remote", ls_remote)
+    with ThreadPoolExecutor(3) as executor:
+        resolver = RefResolver(executor, jobs_per_remote=1)
+        resolver.start(
+            [
+                ("remote1", (remotes / "dep1.git").as_uri(), "main"),
+                ("remote1", (remotes / "dep2.git").as_uri(), "main"),
+                ("remote2", (remotes / "dep3.git").as_uri(), "main"),
+            ]
+        )
+    assert maximum == {"remote1": 1, "remote2": 1}
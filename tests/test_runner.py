@@ -0,0 +1,95 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Subprocess Runner Testing."""
+
+import sys
+import time
+
+from gitwsrepo._runner import Command, Runner, git_command
+
+
+def _shell(script: str, **kwargs) -> Command:
+    return Command((script,), shell=True, **kwargs)  # noqa: S604
+
+
+def _python(code: str, **kwargs) -> Command:
+    return Command((sys.executable, "-c", code), **kwargs)
+
+
+def test_run(tmp_path):
+    """Results In Command Order."""
+    commands = [_shell(f"echo {idx}; echo error{idx} >&2; exit {idx % 3}") for idx in range(20)]
+    results = Runner(jobs=4).run_all(commands)
+    assert [result.command for result in results] == commands
+    assert [result.stdout for result in results] == [f"{idx}\n".encode() for idx in range(20)]
+    assert [result.stderr for result in results] == [f"error{idx}\n".encode() for idx in range(20)]
+    assert [result.returncode for result in results] == [idx % 3 for idx in range(20)]
+
+    (result,) = Runner().run_all([_shell("echo out; echo err >&2", cwd=tmp_path, merge=True)])
+    assert result.stdout == b"out\nerr\n"
+    assert result.stderr == b""
+
+    (result,) = Runner().run_all([git_command("rev-parse", "--is-inside-work-tree", cwd=tmp_path)])
+    assert result.returncode != 0
+    assert b"not a git repository" in result.stderr
+
+
+def test_run_missing(tmp_path):
+    """Commands Which Cannot Be Started."""
+    (result,) = Runner().run_all([Command((str(tmp_path / "missing"),))])
+    assert result.returncode == 127
+    assert b"No such file or directory" in result.stderr
+
+
+def test_run_limit():
+    """Just The Last Bytes Are Kept."""
+    (result,) = Runner(limit=10).run_all([_python("print('a' * 100000 + 'bcdefghij')")])
+    assert result.stdout == b"bcdefghij\n"
+    assert result.truncated
+    (result,) = Runner(limit=None).run_all([_python("print('a' * 100000)")])
+    assert len(result.stdout) == 100001
+    assert not result.truncated
+
+
+def test_run_stdin():
+    """Standard Input Larger Than A Pipe Buffer."""
+    data = b"line\n" * 100000
+    (result,) = Runner().run_all([_python("import sys; sys.stdout.write(sys.stdin.read())", stdin=data)])
+    assert result.stdout == data
+    (result,) = Runner().run_all([_python("print('ignored')", stdin=data)])
+    assert result.returncode == 0
+    assert result.stdout == b"ignored\n"
+
+
+def test_run_jobs_per_remote(tmp_path):
+    """Concurrency Per Remote Is Limited."""
+    lock = tmp_path / "lock"
+    script = f"mkdir {lock} && sleep 0.05 && rmdir {lock}"
+    commands = [_shell(script, remote="remote") for _ in range(6)]
+    commands.append(_shell("sleep 0.05", remote="other"))
+    results = Runner(jobs=4, jobs_per_remote=1).run_all(commands)
+    assert [result.returncode for result in results] == [0] * 7
+
+
+def test_run_cancel():
+    """Running Processes Are Terminated, If The Consumer Stops."""
+    start = time.monotonic()
+    commands = [_shell("echo first")] + [_shell("sleep 30")] * 8
+    for result in Runner(jobs=4, window=2).iter_run(commands):
+        assert result.stdout == b"first\n"
+        break
+    assert time.monotonic() - start < 10
@@ -0,0 +1,88 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Startup Time Testing."""
+
+import os
+import re
+import subprocess
+import sys
+
+from pytest import mark
+
+IMPORT_RATIO = 0.5
+"""Maximum Import Time Of The Command Line Interface Relative To ``gitws`` (~80ms vs ~270ms when measured)."""
+
+HEAVY = ("gitws", "pydantic", "defusedxml", "tomlkit", "gitwsrepo.datamodel", "gitwsrepo._cache")
+"""Modules Not Needed For ``--help``, ``--version`` and ``is_compatible``."""
+
+_RE_IMPORTTIME = re.compile(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(\S+)")
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run((sys.executable, *args, "-c", code), check=True, capture_output=True, text=True)  # noqa: S603
+
+
+def _get_heavy(code: str) -> list[str]:
+    code = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+    modules = _run(code).stdout.split()
+    return sorted(
+        module for module in modules if any(module == name or module.startswith(f"{name}.") for name in HEAVY)
+    )
+
+
+@mark.parametrize("arg", ["--help", "--version"])
+def test_cli(arg):
+    """Help And Version Do Not Import Heavy Modules."""
+    code = f"""
+from gitwsrepo._cli import main
+try:
+    main([{arg!r}])
+except SystemExit:
+    pass
+"""
+    assert _get_heavy(code) == []
+
+
+def test_is_compatible():
+    """Manifest Format Compatibility Check Does Not Import Parsing Modules."""
+    code = """
+from pathlib import Path
+import gitwsrepo
+from gitwsrepo.repomanifestformat import RepoManifestFormat
+assert RepoManifestFormat().is_compatible(Path("default.xml"))
+"""
+    # the base class requires gitws, which already imports pydantic and tomlkit
+    heavy = _get_heavy(code)
+    assert [module for module in heavy if module.startswith(("defusedxml", "gitwsrepo"))] == []
+
+
+def test_import():
+    """Importing The Command Line Interface Does Not Import Heavy Modules."""
+    assert _get_heavy("import gitwsrepo._cli") == []
+
+
+@mark.skipif(bool(os.environ.get("SKIP_TIMING_TESTS")), reason="SKIP_TIMING_TESTS is set")
+def test_import_budget():
+    """
+    Import Time Of The Command Line Interface.
+
+    Measured relative to the import of ``gitws`` in the same interpreter, to be independent of the machine speed.
+    If the command line interface imported ``gitws`` again, its import would include it and exceed the budget.
+    """
+    stderr = _run("import gitwsrepo._cli\nimport gitws", "-X", "importtime").stderr
+    times = {name: int(cumulative) for cumulative, name in _RE_IMPORTTIME.findall(stderr)}
+    assert times["gitwsrepo._cli"] < IMPORT_RATIO * times["gitws"], stderr
@@ -0,0 +1,88 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Status Testing."""
+
+import os
+import time
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from pytest import fixture
+
+from gitwsrepo import _status
+from gitwsrepo._cli import main
+from gitwsrepo._workspace import RepoWorkspace
+
+from .common import commit, create_remotes, create_workspace, run_git
+
+
+@fixture
+def workspace(tmp_path):
+    """Synchronized Workspace."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["sync"])
+    assert result.exit_code == 0, result.output
+    return workspace
+
+
+def _set_index_time(path, offset):
+    timestamp = time.time() + offset
+    os.utime(path / ".git" / "index", (timestamp, timestamp))
+
+
+def test_status(workspace, tmp_path):
+    """Changed Files, Ahead And Behind."""
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["status"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "nothing to commit (working directory clean)\n"
+
+    (workspace / "dep1" / "data.txt").write_text("modified")
+    (workspace / "dep3" / "new.txt").write_text("new")
+    commit(workspace / "sub" / "dep2", {"local.txt": "local"})
+    commit(tmp_path / "remotes" / "dep1", {"remote.txt": "remote"})
+    run_git(workspace / "dep1", "fetch", "--quiet")
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["status", "-j", "2"])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        "project dep1/                            branch main [behind 1]",
+        "  M data.txt",
+        "project sub/dep2/                        branch main [ahead 1]",
+        "project dep3/                            (detached)",
+        " ?? new.txt",
+    ]
+
+
+def test_status_index_rewritten(workspace):
+    """Changes Are Reported, Although Commands Rewrote The Index Afterwards."""
+    path = workspace / "dep1"
+    (path / "new.txt").write_text("new")
+    run_git(path, "checkout", "--", "data.txt")
+    (workspace / "dep3" / "data.txt").write_text("staged")
+    run_git(workspace / "dep3", "add", "data.txt")
+    _set_index_time(path, 100)
+    _set_index_time(workspace / "dep3", 100)
+
+    repo_workspace = RepoWorkspace.from_path(workspace)
+    projects = repo_workspace.get_projects(repo_workspace.load())
+    statuses = list(_status.iter_status(repo_workspace, projects))
+    assert [status.changes for status in statuses] == [("?? new.txt",), (), ("M  data.txt",)]
+    assert [status.is_clean for status in statuses] == [False, True, False]
@@ -0,0 +1,229 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Sync Testing."""
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+from pytest import fixture
+
+from gitwsrepo import repomanifestformat
+from gitwsrepo._cli import main
+from gitwsrepo.const import LOCAL_MANIFESTS_PATH, MANIFESTS_PATH
+from gitwsrepo.datamodel import SyncState
+
+from .common import commit, create_remotes, create_workspace, run_git
+
+
+@fixture
+def remotes(tmp_path):
+    """Remote Repositories."""
+    create_remotes(tmp_path / "remotes")
+    return tmp_path / "remotes"
+
+
+@fixture
+def workspace(tmp_path, remotes):
+    """Workspace."""
+    return create_workspace(tmp_path / "workspace", remotes)
+
+
+def _sync(workspace, *args):
+    with chdir(workspace):
+        return CliRunner().invoke(main, ["sync", *args])
+
+
+def test_sync(workspace, remotes):
+    """Clone And Update."""
+    result = _sync(workspace, "-j", "3")
+    assert result.exit_code == 0, result.output
+    assert (workspace / "dep1" / "data.txt").read_text() == "dep1"
+    assert (workspace / "sub" / "dep2" / "data.txt").read_text() == "dep2"
+    assert (workspace / "dep3" / "data.txt").read_text() == "dep3"
+    assert not (workspace / "dep4").exists()
+    assert run_git(workspace / "dep1", "branch", "--show-current") == "main"
+    assert run_git(workspace / "dep3", "branch", "--show-current") == ""
+
+    sha = commit(remotes / "dep1", {"data.txt": "changed"})
+    result = _sync(workspace, "--jobs-network", "2", "--jobs-checkout", "1")
+    assert result.exit_code == 0, result.output
+    assert run_git(workspace / "dep1", "rev-parse", "HEAD") == sha
+    assert (workspace / "dep1" / "data.txt").read_text() == "changed"
+
+
+def test_sync_error(workspace, remotes):
+    """Failing Projects Do Not Stop The Others."""
+    (remotes / "dep1").rename(remotes / "gone")
+    result = _sync(workspace)
+    assert result.exit_code == 1
+    assert "Aborted!" in result.output
+    assert not (workspace / "dep1").exists()
+    assert (workspace / "sub" / "dep2" / "data.txt").read_text() == "dep2"
+    assert (workspace / "dep3" / "data.txt").read_text() == "dep3"
+
+
+def test_sync_progress(workspace, remotes):
+    """Progress Bar Instead Of One Line Per Project."""
+    (remotes / "dep1").rename(remotes / "gone")
+    result = _sync(workspace, "--progress", "-j", "3")
+    assert result.exit_code == 1
+    assert "Cloned" not in result.output
+    assert "[##############################]   3/3 (1 failed)\n" in result.output
+    assert "ERROR:   dep1: " in result.output
+    assert result.output.endswith("Aborted!\n")
+
+
+def test_sync_jobs_parse(workspace, monkeypatch):
+    """Included Manifests Are Parsed In Parallel - Not In Forked Processes, As Logging Threads Are Running."""
+    contexts = []
+    get_mp_context = repomanifestformat._get_mp_context
+    monkeypatch.setattr(
+        repomanifestformat, "_get_mp_context", lambda: contexts.append(get_mp_context()) or contexts[-1]
+    )
+    manifests_path = workspace / MANIFESTS_PATH
+    (manifests_path / "default.xml").write_text(
+        '<manifest><include name="remote.xml" /><include name="projects.xml" /></manifest>'
+    )
+    (manifests_path / "remote.xml").write_text(
+        '<manifest><remote name="origin" fetch=".." /><default remote="origin" revision="main" /></manifest>'
+    )
+    (manifests_path / "projects.xml").write_text('<manifest><project name="dep1" /></manifest>')
+    result = _sync(workspace, "--jobs-parse", "2", "--progress")
+    assert result.exit_code == 0, result.output
+    assert (workspace / "dep1" / "data.txt").read_text() == "dep1"
+    assert not (workspace / "dep3").exists()
+    assert [context.get_start_method() for context in contexts] in (["forkserver"], ["spawn"])
+
+
+def test_sync_incremental(workspace, remotes):
+    """Unchanged Projects Are Skipped."""
+    assert _sync(workspace).exit_code == 0
+    state = SyncState.load(workspace)
+    assert sorted(state.projects) == ["dep1", "dep3", "sub/dep2"]
+    assert state.projects["dep3"].revision == "v1.0"
+    assert state.projects["dep3"].sha == run_git(workspace / "dep3", "rev-parse", "HEAD")
+
+    result = _sync(workspace)
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Up to date.") == 3
+    assert "Fetched." not in result.output
+
+    sha = commit(remotes / "dep1", {"data.txt": "changed"})
+    run_git(workspace / "sub" / "dep2", "checkout", "--quiet", "--detach", "HEAD")
+    commit(workspace / "sub" / "dep2", {"data.txt": "local"})
+    result = _sync(workspace)
+    assert result.exit_code == 0, result.output
+    assert "dep1: Fetched." in result.output
+    assert "sub/dep2: Fetched." in result.output
+    assert "dep3: Up to date." in result.output
+    assert SyncState.load(workspace).projects["dep1"].sha == sha
+
+    result = _sync(workspace, "--force")
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Fetched.") == 3
+
+
+def test_sync_smart(workspace, remotes):
+    """Locally Available Pinned Revisions Are Not Fetched."""
+    assert _sync(workspace).exit_code == 0
+    sha1 = commit(remotes / "dep1", {"data.txt": "changed"})
+    run_git(workspace / "dep1", "fetch", "--quiet", "origin")
+    sha3 = run_git(workspace / "dep3", "rev-parse", "HEAD")
+    (workspace / LOCAL_MANIFESTS_PATH).mkdir()
+    (workspace / LOCAL_MANIFESTS_PATH / "pin.xml").write_text(
+        f"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <extend-project name="dep1" revision="{sha1}" />
+  <extend-project name="dep3" revision="{sha3}" />
+</manifest>
+"""
+    )
+    # no network access for pinned projects
+    (remotes / "dep1").rename(remotes / "gone1")
+    (remotes / "dep3").rename(remotes / "gone3")
+
+    result = _sync(workspace, "--smart")
+    assert result.exit_code == 0, result.output
+    assert f"dep1: Checked out {sha1!r}." in result.output
+    assert f"dep3: Checked out {sha3!r}." in result.output
+    assert "sub/dep2: Up to date." in result.output
+    assert "Fetched." not in result.output
+    assert run_git(workspace / "dep1", "rev-parse", "HEAD") == sha1
+
+    result = _sync(workspace, "--smart")
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Up to date.") == 3
+
+
+def test_sync_local_only(workspace, remotes):
+    """No Network Access At All."""
+    assert _sync(workspace).exit_code == 0
+    sha = commit(remotes / "dep1", {"data.txt": "changed"})
+    remotes.rename(remotes.with_name("gone"))
+
+    result = _sync(workspace, "--local-only")
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Up to date.") == 3
+
+    remotes.with_name("gone").rename(remotes)
+    run_git(workspace / "dep1", "fetch", "--quiet", "origin")
+    remotes.rename(remotes.with_name("gone"))
+    result = _sync(workspace, "-l")
+    assert result.exit_code == 0, result.output
+    assert "dep1: Checked out 'main'." in result.output
+    assert run_git(workspace / "dep1", "rev-parse", "HEAD") == sha
+
+    run_git(workspace / "dep3", "tag", "--delete", "v1.0")
+    result = _sync(workspace, "-l")
+    assert result.exit_code == 1
+    assert "ERROR:   dep3: Revision 'v1.0' is not available locally" in result.output
+    assert "dep1: Up to date." in result.output
+
+
+MANIFEST_BRANCHES = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<manifest>
+  <remote name="origin" fetch=".." />
+  <default remote="origin" revision="refs/heads/main" />
+  <project name="dep1" />
+  <project name="dep2" revision="refs/heads/dev" />
+</manifest>
+"""
+
+
+def test_sync_branch_refs(tmp_path):
+    """Branches Given As ``refs/heads/BRANCH`` Are Checked Out As Branches, Following Their Upstream."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes, manifest=MANIFEST_BRANCHES)
+    run_git(remotes / "dep2", "checkout", "--quiet", "-b", "dev")
+    commit(remotes / "dep2", {"data.txt": "dev"})
+    run_git(remotes / "dep2", "checkout", "--quiet", "main")
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+
+    result = _sync(workspace)
+    assert result.exit_code == 0, result.output
+    assert "dep1: Checked out 'main'." in result.output
+    assert "dep2: Checked out 'dev'." in result.output
+    assert run_git(workspace / "dep1", "branch", "--show-current") == "main"
+    assert run_git(workspace / "dep2", "branch", "--show-current") == "dev"
+    assert (workspace / "dep2" / "data.txt").read_text() == "dev"
+
+    sha = commit(remotes / "dep1", {"data.txt": "changed"})
+    result = _sync(workspace)
+    assert result.exit_code == 0, result.output
+    assert run_git(workspace / "dep1", "branch", "--show-current") == "main"
+    assert run_git(workspace / "dep1", "rev-parse", "HEAD") == sha
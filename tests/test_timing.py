@@ -0,0 +1,82 @@
+# Copyright 2025 c0fec0de
+#
+# This file is part of Git Workspace.
+#
+# Git Workspace is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# Git Workspace is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
+
+"""Phase Timing And Profiling Testing."""
+
+import json
+import logging
+import pstats
+
+from click.testing import CliRunner
+from contextlib_chdir import chdir
+
+from gitwsrepo import RepoManifestFormat
+from gitwsrepo._cli import main
+from gitwsrepo._timing import Tracer, phase
+
+from .common import create_remotes, create_workspace
+
+
+def test_phase(tmp_path, caplog):
+    """Phases Are Logged At Debug Level And Traced."""
+    (tmp_path / "default.xml").write_text('<manifest><include name="inc.xml" /></manifest>')
+    (tmp_path / "inc.xml").write_text('<manifest><project name="dep" /></manifest>')
+    with caplog.at_level(logging.DEBUG):
+        RepoManifestFormat().load(tmp_path / "default.xml")
+    phases = [(record.phase, record.detail) for record in caplog.records if hasattr(record, "phase")]
+    assert phases == [
+        ("parse", str(tmp_path / "default.xml")),
+        ("parse", str(tmp_path / "inc.xml")),
+        ("include-resolution", str(tmp_path / "default.xml")),
+        ("validation", str(tmp_path / "default.xml")),
+        ("group-index", str(tmp_path / "default.xml")),
+        ("load", str(tmp_path / "default.xml")),
+    ]
+
+    caplog.clear()
+    tracer = Tracer()
+    tracer.start()
+    with phase("outer"), phase("inner", "detail"):
+        pass
+    tracer.stop()
+    with phase("untraced"):
+        pass
+    assert caplog.records == []
+    assert [event["name"] for event in tracer.events] == ["inner detail", "outer"]
+    assert tracer.events[1]["ts"] <= tracer.events[0]["ts"]
+    assert tracer.events[1]["dur"] >= tracer.events[0]["dur"]
+
+
+def test_profile(tmp_path):
+    """Verbose Output And Profiles."""
+    remotes = tmp_path / "remotes"
+    create_remotes(remotes)
+    workspace = create_workspace(tmp_path / "workspace", remotes)
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["-vv", "--profile", "trace.json", "sync"])
+    assert result.exit_code == 0, result.output
+    assert "DEBUG:   fetch 'dep1': " in result.output
+    assert "DEBUG:   checkout 'sub/dep2': " in result.output
+    trace = json.loads((workspace / "trace.json").read_text())
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert {"sync", "fetch dep1", "checkout dep1", "fetch dep3", "checkout dep3"} <= names
+    assert any(name.startswith("load ") for name in names)
+
+    with chdir(workspace):
+        result = CliRunner().invoke(main, ["--profile", "sync.prof", "sync"])
+    assert result.exit_code == 0, result.output
+    stats = pstats.Stats(str(workspace / "sync.prof"))
+    assert any(func[2] == "run" for func in stats.stats)